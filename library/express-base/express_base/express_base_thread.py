@@ -3,7 +3,7 @@ from express_base.express_base_thread_cycle import ExpressBaseThreadCycle
 from express_base.express_base_thread_factory import ExpressBaseThreadFactory
 from express_base.express_base_thread_state import ExpressBaseThreadState
 from express_base.express_runnable import ExpressRunnable
-from express_utils import ExpressExceptionUtils, ExpressLoggerFactory
+from express_utils import ExpressExceptionUtils, ExpressLogContext, ExpressLoggerFactory
 from abc import abstractmethod
 from threading import Thread
 from logging import Logger
@@ -21,6 +21,8 @@ class ExpressBaseThread(AbstractExpressBaseThreadModel, ExpressRunnable, Express
         self._create_time: float = 0
 
     def run(self):
+        # 이 thread 에서 남기는 log 에 state, 경과 시간을 붙일 수 있도록 등록 (ExpressJsonFormatter)
+        ExpressLogContext.bind(self)
         try:
             self._express_base_thread_state = ExpressBaseThreadState.INIT
             self._initialize()
@@ -43,12 +45,13 @@ class ExpressBaseThread(AbstractExpressBaseThreadModel, ExpressRunnable, Express
             self._sys_logger.error(ExpressExceptionUtils.get_stack_trace(e))
 
         self._express_base_thread_state = ExpressBaseThreadState.DESTROY
+        ExpressLogContext.unbind()
 
     def _initialize(self):
         if not self._name:
             self._name = str(uuid.uuid4()).replace('-', '')
         self._create_time = time()
-        self._sys_logger.debug(f"Thread {self._name} initialized.")
+        self._sys_logger.debug("Thread %s initialized.", self._name)
 
     @abstractmethod
     def _execute(self):
@@ -78,3 +81,6 @@ class ExpressBaseThread(AbstractExpressBaseThreadModel, ExpressRunnable, Express
 
     def get_express_base_thread_state(self) -> ExpressBaseThreadState:
         return self._express_base_thread_state
+
+    def get_create_time(self) -> float:
+        return self._create_time
@@ -0,0 +1,14 @@
+from unittest.mock import patch
+import os
+import unittest
+
+LOGGING_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "logging.yaml")
+
+
+def patch_logging(test: unittest.TestCase) -> None:
+    """
+    Points ExpressLoggerFactory at resources/logging.yaml until the test finishes.
+    """
+    logging_patch = patch('express_utils.express_logger_factory.possible_paths', [LOGGING_CONFIG])
+    logging_patch.start()
+    test.addCleanup(logging_patch.stop)
@@ -0,0 +1,56 @@
+from express_base.express_base_thread import ExpressBaseThread
+from express_utils import ExpressJsonFormatter, ExpressLogContext
+from base_test_support import patch_logging
+import json
+import logging
+import unittest
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+class ContextThread(ExpressBaseThread):
+    def _execute(self):
+        with ExpressLogContext.correlation("task-1"):
+            self._sys_logger.info("executed")
+
+    def _finalize(self):
+        self._sys_logger.info("finalized")
+
+
+class TestLogContext(unittest.TestCase):
+    def setUp(self):
+        patch_logging(self)
+        self.handler = ListHandler()
+        self.handler.setFormatter(ExpressJsonFormatter())
+
+    def test_thread_context(self):
+        thread = ContextThread("context-worker")
+        logger = thread._sys_logger
+        logger.addHandler(self.handler)
+        previous_level = logger.level
+        logger.setLevel(logging.INFO)
+        try:
+            thread.start_with_sub_handler_role().join()
+        finally:
+            logger.removeHandler(self.handler)
+            logger.setLevel(previous_level)
+
+        executed, finalized = [json.loads(line) for line in self.handler.lines]
+        self.assertEqual(executed["thread"], "context-worker")
+        self.assertEqual(executed["state"], "RUNNING")
+        self.assertEqual(executed["correlation_id"], "task-1")
+        self.assertGreaterEqual(executed["elapsed_ms"], 0)
+        self.assertEqual(finalized["state"], "AWAIT")
+        self.assertIsNone(finalized["correlation_id"])
+        self.assertIsNone(ExpressLogContext.snapshot())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+from express_base.express_base_thread import ExpressBaseThread
+from express_utils.express_logger_factory import ExpressLoggerFactory
+from unittest.mock import patch
+import os
+import tempfile
+import time
+
+THREADS = 10000
+CONFIG = """version: 1
+disable_existing_loggers: false
+formatters:
+  detailed:
+    format: '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+handlers:
+  console:
+    class: logging.NullHandler
+root:
+  level: DEBUG
+  handlers: [console]
+"""
+
+
+class BenchmarkThread(ExpressBaseThread):
+    def _execute(self):
+        ...
+
+    def _finalize(self):
+        ...
+
+
+def create_threads(count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        BenchmarkThread(f"benchmark-{i}")
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = os.path.join(temp_dir, "logging.yml")
+        with open(config_path, "w", encoding="utf-8") as file:
+            file.write(CONFIG)
+
+        with patch('express_utils.express_logger_factory.possible_paths', [config_path]):
+            ExpressLoggerFactory.reset()
+            elapsed = create_threads(THREADS)
+            print(f"cached factory      : {THREADS} threads in {elapsed:.3f}s ({elapsed / THREADS * 1e6:.1f} us/thread)")
+
+            # 이전 동작: get_logger 마다 yaml 을 다시 읽고 dictConfig 실행
+            configure = ExpressLoggerFactory.configure
+            with patch.object(ExpressLoggerFactory, 'configure',
+                              side_effect=lambda path, force=False: configure(path, force=True)):
+                elapsed = create_threads(THREADS)
+            print(f"configure every call: {THREADS} threads in {elapsed:.3f}s ({elapsed / THREADS * 1e6:.1f} us/thread)")
@@ -0,0 +1,142 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+TRUE_VALUES = ('true', 'yes', '1')
+FALSE_VALUES = ('false', 'no', '0')
+
+
+class _PrefixTrie:
+    """
+    Character trie over the top-level keys; every node keeps the keys below it in insertion order,
+    so keys(prefix) costs len(prefix) steps regardless of the number of keys.
+    """
+    __slots__ = ("_children", "_keys")
+
+    def __init__(self):
+        self._children: Dict[str, '_PrefixTrie'] = {}
+        self._keys: Union[List[str], Tuple[str, ...]] = []
+
+    def add(self, key: str) -> None:
+        node = self
+        node._keys.append(key)
+        for char in key:
+            child = node._children.get(char)
+            if child is None:
+                child = node._children[char] = _PrefixTrie()
+            node = child
+            node._keys.append(key)
+
+    def freeze(self) -> None:
+        self._keys = tuple(self._keys)
+        for child in self._children.values():
+            child.freeze()
+
+    def keys(self, prefix: str) -> Tuple[str, ...]:
+        node = self
+        for char in prefix:
+            node = node._children.get(char)
+            if node is None:
+                return ()
+        return node._keys
+
+
+class ExpressConfigurationSnapshot:
+    """
+    Compiled, read-only view of a configuration dict, built once per load/reload.
+
+    - every top-level key, plus a dotted path ("section.sub.key") for every value inside nested
+      sections, is indexed in one dict; a top-level key wins over an equal dotted path.
+    - values are pre-parsed the way ExpressConfigurations getters parse them (int(), float(), bool(),
+      comma split); values that fail to parse are left out, so the getter falls back to parsing and
+      raises or logs exactly as before.
+    - lists are kept as tuples so callers cannot modify the snapshot; getters hand out list copies.
+    """
+    __slots__ = ("_values", "_ints", "_floats", "_booleans", "_lists", "_string_arrays",
+                 "_integer_lists", "_float_lists", "_boolean_lists", "_trie")
+
+    def __init__(self, configuration: Optional[Dict[Any, Any]]):
+        configuration = configuration if isinstance(configuration, dict) else {}
+        values: Dict[Any, Any] = {}
+        for key, value in configuration.items():
+            if isinstance(key, str) and isinstance(value, dict):
+                self._index_section(f"{key}.", value, values)
+        values.update(configuration)
+        self._values = values
+
+        self._ints: Dict[Any, int] = {}
+        self._floats: Dict[Any, float] = {}
+        self._booleans: Dict[Any, bool] = {key: bool(value) for key, value in values.items()}
+        self._lists: Dict[Any, Tuple[str, ...]] = {}
+        self._string_arrays: Dict[Any, Tuple[str, ...]] = {}
+        self._integer_lists: Dict[Any, Tuple[int, ...]] = {}
+        self._float_lists: Dict[Any, Tuple[float, ...]] = {}
+        self._boolean_lists: Dict[Any, Tuple[bool, ...]] = {}
+        for key, value in values.items():
+            try:
+                self._ints[key] = int(value)
+            except (TypeError, ValueError, OverflowError):
+                pass
+            try:
+                self._floats[key] = float(value)
+            except (TypeError, ValueError, OverflowError):
+                pass
+            if not isinstance(value, str):
+                continue
+            items = value.split(',')
+            self._lists[key] = tuple(items)
+            stripped = tuple(item.strip() for item in items)
+            self._string_arrays[key] = stripped
+            try:
+                self._integer_lists[key] = tuple(int(item) for item in stripped)
+            except ValueError:
+                pass
+            try:
+                self._float_lists[key] = tuple(float(item) for item in stripped)
+            except (ValueError, OverflowError):
+                pass
+            lowered = [item.lower() for item in stripped]
+            if all(item in TRUE_VALUES or item in FALSE_VALUES for item in lowered):
+                self._boolean_lists[key] = tuple(item in TRUE_VALUES for item in lowered)
+
+        self._trie = _PrefixTrie()
+        for key in configuration:
+            if isinstance(key, str):
+                self._trie.add(key)
+        self._trie.freeze()
+
+    @staticmethod
+    def _index_section(prefix: str, section: Dict[Any, Any], values: Dict[Any, Any]) -> None:
+        for key, value in section.items():
+            path = f"{prefix}{key}"
+            values[path] = value
+            if isinstance(value, dict):
+                ExpressConfigurationSnapshot._index_section(f"{path}.", value, values)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def get_int(self, key: Any) -> Optional[int]:
+        return self._ints.get(key)
+
+    def get_float(self, key: Any) -> Optional[float]:
+        return self._floats.get(key)
+
+    def get_boolean(self, key: Any) -> Optional[bool]:
+        return self._booleans.get(key)
+
+    def get_list(self, key: Any) -> Optional[Tuple[str, ...]]:
+        return self._lists.get(key)
+
+    def get_string_array(self, key: Any) -> Optional[Tuple[str, ...]]:
+        return self._string_arrays.get(key)
+
+    def get_integer_list(self, key: Any) -> Optional[Tuple[int, ...]]:
+        return self._integer_lists.get(key)
+
+    def get_float_list(self, key: Any) -> Optional[Tuple[float, ...]]:
+        return self._float_lists.get(key)
+
+    def get_boolean_list(self, key: Any) -> Optional[Tuple[bool, ...]]:
+        return self._boolean_lists.get(key)
+
+    def get_keys(self, prefix: str = "") -> Tuple[str, ...]:
+        return self._trie.keys(prefix)
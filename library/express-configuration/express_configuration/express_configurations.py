@@ -4,6 +4,7 @@ from typing import List, Dict, Any, Iterator
 from collections import defaultdict
 from .express_configuration_type import ExpressConfigurationType
 from .express_configuration_if import ExpressConfigurationIF
+from .express_configuration_snapshot import ExpressConfigurationSnapshot, TRUE_VALUES, FALSE_VALUES
 from .express_configuration_utils import ExpressConfigurationUtils
 import yaml
 import json
@@ -12,6 +13,13 @@ import os
 
 
 class ExpressConfigurations(ExpressConfigurationIF):
+    """
+    Getters read an ExpressConfigurationSnapshot compiled whenever `configuration` is assigned
+    (load, reload) or set_property() is called, so they cost a dict lookup instead of re-parsing.
+    Keys may also be dotted paths into nested sections ("section.key").
+    Modify values through set_property(); in-place changes to the `configuration` dict are not seen by the getters.
+    """
+
     def __init__(self, file_path: str, configuration_type: ExpressConfigurationType):
         self.file_path = ExpressConfigurationUtils.get_path_file(file_path)
         self.type = configuration_type
@@ -21,6 +29,20 @@ class ExpressConfigurations(ExpressConfigurationIF):
         self.system_properties = defaultdict()
         self.init()
 
+    @property
+    def configuration(self) -> Dict[str, Any]:
+        return self._configuration
+
+    @configuration.setter
+    def configuration(self, configuration: Dict[str, Any]) -> None:
+        # 읽는 thread 는 _snapshot 만 보므로 완성된 snapshot 으로 한 번에 교체
+        snapshot = ExpressConfigurationSnapshot(configuration)
+        self._configuration = configuration
+        self._snapshot = snapshot
+
+    def get_snapshot(self) -> ExpressConfigurationSnapshot:
+        return self._snapshot
+
     def init(self):
         properties = os.environ
         for k, v in properties.items():
@@ -29,22 +51,22 @@ class ExpressConfigurations(ExpressConfigurationIF):
 
         try:
             if self.type == ExpressConfigurationType.STATIC:
-                self.logger.info(f"Loading the static yml file: {self.file_path}")
+                self.logger.info("Loading the static yml file: %s", self.file_path)
                 self.load_config()
             elif self.type == ExpressConfigurationType.DYNAMIC:
-                self.logger.info(f"Loading the dynamic yml file: {self.file_path}")
+                self.logger.info("Loading the dynamic yml file: %s", self.file_path)
                 self.load_config()
                 self.start_watcher()
         except Exception as e:
-            self.logger.error(f"{self.type.value}[{self.file_path}] init failure => {e}")
+            self.logger.error("%s[%s] init failure => %s", self.type.value, self.file_path, e)
 
     def load_config(self):
         try:
             with open(self.file_path, 'r', encoding='utf-8') as file:
                 self.configuration = yaml.safe_load(file)
-                self.logger.info(f"Loaded configuration: {self.configuration}")
+                self.logger.info("Loaded configuration: %s", self.configuration)
         except Exception as e:
-            self.logger.error(f"Failed to load configuration: {e}")
+            self.logger.error("Failed to load configuration: %s", e)
 
     def start_watcher(self):
         """Start a watchdog observer to watch the file for changes."""
@@ -55,32 +77,45 @@ class ExpressConfigurations(ExpressConfigurationIF):
 
     def reload(self):
         self.load_config()
-        self.logger.info(f"Reloaded configuration from {self.file_path}")
+        self.logger.info("Reloaded configuration from %s", self.file_path)
 
     def get_string(self, key: str, default: str = "") -> str:
-        return self.configuration.get(key, default)
+        return self._snapshot.get(key, default)
 
     def get_int(self, key: str, default: int = 0) -> int:
+        value = self._snapshot.get_int(key)
+        if value is not None:
+            return value
         return int(self.get_string(key, default))
 
     def get_float(self, key: str, default: float = 0.0) -> float:
+        value = self._snapshot.get_float(key)
+        if value is not None:
+            return value
         return float(self.get_string(key, default))
 
     def get_boolean(self, key: str, default: bool = False) -> bool:
+        value = self._snapshot.get_boolean(key)
+        if value is not None:
+            return value
         return bool(self.get_string(key, default))
 
     def get_list(self, key: str, default: List[Any] = None) -> List[Any]:
         value = self.get_string(key, None)
-        return value.split(',') if value else (default if default else [])
+        if not value:
+            return default if default else []
+        items = self._snapshot.get_list(key)
+        return list(items) if items is not None else value.split(',')
 
     def get_dict(self, key: str, default: Dict[str, Any] = None) -> Dict[str, Any]:
         return self.configuration if self.configuration else (default if default else {})
 
     def get_keys(self, prefix: str = "") -> Iterator[str]:
-        return (k for k in self.configuration.keys() if k.startswith(prefix))
+        return iter(self._snapshot.get_keys(prefix))
 
     def set_property(self, key: str, value: Any):
         self.configuration[key] = value
+        self._snapshot = ExpressConfigurationSnapshot(self.configuration)
 
     def get_type(self) -> ExpressConfigurationType:
         return self.type
@@ -96,15 +131,14 @@ class ExpressConfigurations(ExpressConfigurationIF):
             yaml.dump(self.configuration, configfile)
 
     def get_string_list(self, var1: str) -> List[str]:
-        value = self.configuration.get(var1, None)
-        if value is None:
-            return []
-        if isinstance(value, str):
-            return value.split(',')
-        return []
+        items = self._snapshot.get_list(var1)
+        return list(items) if items is not None else []
 
     def get_integer_list(self, var1: str) -> List[int]:
-        value = self.configuration.get(var1, None)
+        items = self._snapshot.get_integer_list(var1)
+        if items is not None:
+            return list(items)
+        value = self._snapshot.get(var1)
         if value is None:
             return []
 
@@ -112,22 +146,28 @@ class ExpressConfigurations(ExpressConfigurationIF):
             try:
                 return [int(v.strip()) for v in value.split(',')]
             except ValueError:
-                self.logger.error(f"Failed to parse integer list for key '{var1}'")
+                self.logger.error("Failed to parse integer list for key '%s'", var1)
         return []
 
     def get_float_list(self, var1: str) -> List[float]:
-        value = self.configuration.get(var1, None)
+        items = self._snapshot.get_float_list(var1)
+        if items is not None:
+            return list(items)
+        value = self._snapshot.get(var1)
         if value is None:
             return []
         if isinstance(value, str):
             try:
                 return [float(v.strip()) for v in value.split(',')]
             except ValueError:
-                self.logger.error(f"Failed to parse float list for key '{var1}'")
+                self.logger.error("Failed to parse float list for key '%s'", var1)
         return []
 
     def get_boolean_list(self, var1: str) -> List[bool]:
-        value = self.configuration.get(var1, None)
+        items = self._snapshot.get_boolean_list(var1)
+        if items is not None:
+            return list(items)
+        value = self._snapshot.get(var1)
         if value is None:
             return []
         if isinstance(value, str):
@@ -135,26 +175,20 @@ class ExpressConfigurations(ExpressConfigurationIF):
         return []
 
     def _parse_boolean(self, value: str) -> bool:
-        true_values = ['true', 'yes', '1']
-        false_values = ['false', 'no', '0']
-        if value.lower() in true_values:
+        if value.lower() in TRUE_VALUES:
             return True
-        elif value.lower() in false_values:
+        elif value.lower() in FALSE_VALUES:
             return False
         else:
-            self.logger.error(f"Failed to parse boolean value '{value}'")
+            self.logger.error("Failed to parse boolean value '%s'", value)
             return False
 
     def get_string_array(self, var1: str) -> List[str]:
-        value = self.configuration.get(var1, None)
-        if value is None:
-            return []
-        if isinstance(value, str):
-            return [v.strip() for v in value.split(',')]
-        return []
+        items = self._snapshot.get_string_array(var1)
+        return list(items) if items is not None else []
 
     def get_property(self, var1: str) -> Any:
-        return self.configuration.get(var1)
+        return self._snapshot.get(var1)
 
     def __str__(self) -> str:
         if not self.configuration:
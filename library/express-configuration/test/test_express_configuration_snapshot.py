@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+from express_configuration.express_configurations import ExpressConfigurations
+from express_configuration.express_configuration_snapshot import ExpressConfigurationSnapshot
+from express_configuration.express_configuration_type import ExpressConfigurationType
+
+STATIC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "static.yml")
+
+
+class TestExpressConfigurationSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.configurations = ExpressConfigurations(STATIC_PATH, ExpressConfigurationType.STATIC)
+
+    def test_typed_values_from_file(self):
+        self.assertEqual(self.configurations.get_int('common.dynamic.delay'), 3000)
+        self.assertEqual(self.configurations.get_float('queue.collect.capacity'), 10000.0)
+        self.assertFalse(self.configurations.get_boolean('analyze.worker.count'))
+        self.assertEqual(self.configurations.get_string_array('db.config.enc.field.list'), ['password'])
+        self.assertEqual(list(self.configurations.get_keys('pool.kafka.')),
+                         ['pool.kafka.consumer.id', 'pool.kafka.producer.id'])
+        self.assertEqual(self.configurations.get_int('missing.key', 7), 7)
+        self.assertEqual(self.configurations.get_string('missing.key', 'default'), 'default')
+
+    def test_dotted_path_into_sections(self):
+        self.configurations.configuration = {
+            'kafka': {'producer': {'acks': '1', 'retries': 3, 'topics': 'a, b'}},
+            'kafka.producer.acks': 'all'
+        }
+        self.assertEqual(self.configurations.get_int('kafka.producer.retries'), 3)
+        self.assertEqual(self.configurations.get_string_array('kafka.producer.topics'), ['a', 'b'])
+        self.assertEqual(self.configurations.get_property('kafka.producer'), {'acks': '1', 'retries': 3,
+                                                                               'topics': 'a, b'})
+        # 최상위 key 가 같은 dotted path 보다 우선
+        self.assertEqual(self.configurations.get_string('kafka.producer.acks'), 'all')
+        self.assertEqual(list(self.configurations.get_keys('kafka')), ['kafka', 'kafka.producer.acks'])
+
+    def test_get_keys_prefix(self):
+        self.configurations.configuration = {'b.x': 1, 'a.y': 2, 'a.x': 3, 'ab': 4}
+        self.assertEqual(list(self.configurations.get_keys('a.')), ['a.y', 'a.x'])
+        self.assertEqual(list(self.configurations.get_keys('a')), ['a.y', 'a.x', 'ab'])
+        self.assertEqual(list(self.configurations.get_keys()), ['b.x', 'a.y', 'a.x', 'ab'])
+        self.assertEqual(list(self.configurations.get_keys('c')), [])
+
+    def test_same_results_as_parsing(self):
+        self.configurations.configuration = {
+            'int': '42', 'float': '1.5', 'bool': 'false', 'empty': '', 'none': None, 'number': 3,
+            'ints': '1, 2,3', 'floats': '1.1,2.2', 'bools': 'true,No,1', 'words': 'a, b'
+        }
+        self.assertEqual(self.configurations.get_int('number'), 3)
+        self.assertEqual(self.configurations.get_float('int'), 42.0)
+        self.assertTrue(self.configurations.get_boolean('bool'))
+        self.assertFalse(self.configurations.get_boolean('empty'))
+        self.assertEqual(self.configurations.get_list('empty', ['default']), ['default'])
+        self.assertEqual(self.configurations.get_list('words'), ['a', ' b'])
+        self.assertEqual(self.configurations.get_string_list('empty'), [''])
+        self.assertEqual(self.configurations.get_string_list('number'), [])
+        self.assertEqual(self.configurations.get_integer_list('ints'), [1, 2, 3])
+        self.assertEqual(self.configurations.get_float_list('floats'), [1.1, 2.2])
+        self.assertEqual(self.configurations.get_boolean_list('bools'), [True, False, True])
+        self.assertEqual(self.configurations.get_integer_list('none'), [])
+        with self.assertRaises(ValueError):
+            self.configurations.get_int('float')
+        with self.assertRaises(TypeError):
+            self.configurations.get_int('none')
+
+    def test_unparsable_lists_fall_back(self):
+        self.configurations.configuration = {'ints': '1,x', 'bools': 'true,maybe'}
+        with self.assertLogs('ExpressConfigurations', 'ERROR'):
+            self.assertEqual(self.configurations.get_integer_list('ints'), [])
+        with self.assertLogs('ExpressConfigurations', 'ERROR'):
+            self.assertEqual(self.configurations.get_boolean_list('bools'), [True, False])
+
+    def test_snapshot_is_not_modified_by_callers(self):
+        self.configurations.configuration = {'ints': '1,2'}
+        self.configurations.get_integer_list('ints').append(3)
+        self.assertEqual(self.configurations.get_integer_list('ints'), [1, 2])
+
+    def test_set_property_and_reload_rebuild(self):
+        self.configurations.set_property('analyze.worker.count', '4')
+        self.assertEqual(self.configurations.get_int('analyze.worker.count'), 4)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "dynamic.yml")
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write("workers: 2\n")
+            configurations = ExpressConfigurations(path, ExpressConfigurationType.STATIC)
+            snapshot = configurations.get_snapshot()
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write("workers: 4\n")
+            configurations.reload()
+        self.assertEqual(snapshot.get_int('workers'), 2)
+        self.assertEqual(configurations.get_int('workers'), 4)
+
+    def test_non_dict_configuration(self):
+        snapshot = ExpressConfigurationSnapshot(None)
+        self.assertIsNone(snapshot.get('key'))
+        self.assertEqual(snapshot.get_keys(), ())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+from express_model.express_model_exception import ExpressModelException
+from express_model.express_model_metadata import ExpressModelMetadata
+from express_base.express_base_thread import ExpressBaseThread
+from concurrent.futures import Future
+from queue import Queue, Empty
+from threading import Lock
+from typing import Any, Dict, List, Tuple
+import time
+
+
+class ExpressModelBatcher(ExpressBaseThread):
+    """
+    Micro-batching front of an ExpressModelMetadata.
+    submit() queues one record and returns a Future; the batcher thread collects records until
+    max_rows are queued or max_wait_ms passed since the first one, then runs a single predict_model
+    over the whole batch and resolves every Future with the prediction columns of its own row.
+    The model is looked up once per batch, so a hot reload takes effect on the next batch.
+    """
+
+    def __init__(self,
+                 metadata: ExpressModelMetadata,
+                 max_rows: int = 256,
+                 max_wait_ms: int = 5,
+                 name: str = "ExpressModelBatcher"):
+        super().__init__(name)
+        if max_rows < 1:
+            raise ExpressModelException("max_rows must be positive")
+        self._metadata = metadata
+        self._max_rows = max_rows
+        self._max_wait_sec = max_wait_ms / 1000
+        self._queue: "Queue[Tuple[Dict[str, Any], Future]]" = Queue()
+        self._running = True
+        # _running 확인과 put 사이에 shutdown 되어 queue 에 남는 record 가 없도록 함
+        self._submit_lock = Lock()
+        self._experiment = None
+        self._batch_count = 0
+        self._row_count = 0
+
+    def submit(self, record: Dict[str, Any]) -> Future:
+        """
+        :param record: feature name -> value; missing features are passed to the model as None.
+        :return: Future resolved with {prediction column: value} for this record.
+        """
+        future = Future()
+        with self._submit_lock:
+            if not self._running:
+                raise ExpressModelException("ExpressModelBatcher is shut down")
+            self._queue.put((record, future))
+        return future
+
+    def _initialize(self):
+        super()._initialize()
+        self._experiment = self._metadata.create_experiment()
+
+    def _execute(self):
+        while self._running or not self._queue.empty():
+            batch = self._collect()
+            if batch:
+                self._predict(batch)
+
+    def _collect(self) -> List[Tuple[Dict[str, Any], Future]]:
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except Empty:
+            return []
+
+        deadline = time.monotonic() + self._max_wait_sec
+        while len(batch) < self._max_rows:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    def _predict(self, batch: List[Tuple[Dict[str, Any], Future]]) -> None:
+        import pandas as pd
+
+        # 호출자가 이미 취소한 요청은 예측에서 제외
+        batch = [(record, future) for record, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        futures = [future for _, future in batch]
+        try:
+            configuration = self._metadata.get_configuration()
+            # 모델 교체 중에도 feature list 와 모델이 같은 configuration 에서 나오도록 함
+            model = configuration.model
+            data = pd.DataFrame.from_records(
+                [record for record, _ in batch],
+                columns=configuration.feature_list
+            )
+            predictions = self._experiment.predict_model(estimator=model, data=data)
+            columns = [column for column in predictions.columns if column not in data.columns]
+            rows = predictions[columns].to_dict("records")
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+
+        self._batch_count += 1
+        self._row_count += len(rows)
+        for future, row in zip(futures, rows):
+            future.set_result(row)
+
+    def _finalize(self):
+        # _execute 가 예외로 끝난 경우에도 대기 중인 호출자가 풀려나도록 남은 Future 를 실패 처리
+        with self._submit_lock:
+            self._running = False
+        leftover = 0
+        while True:
+            try:
+                _, future = self._queue.get_nowait()
+            except Empty:
+                break
+            if future.set_running_or_notify_cancel():
+                future.set_exception(ExpressModelException("ExpressModelBatcher stopped before predicting the record"))
+            leftover += 1
+        if leftover:
+            self._sys_logger.warning("Thread %s failed %s queued records on shutdown", self._name, leftover)
+        self._sys_logger.debug("Thread %s finalized. batches=%s, rows=%s",
+                               self._name, self._batch_count, self._row_count)
+
+    def shutdown(self) -> None:
+        """
+        Stops accepting records; records already queued are still predicted.
+        """
+        with self._submit_lock:
+            self._running = False
+
+    def get_batch_count(self) -> int:
+        return self._batch_count
+
+    def get_row_count(self) -> int:
+        return self._row_count
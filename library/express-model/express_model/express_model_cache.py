@@ -0,0 +1,113 @@
+from express_model.express_model_types import ExpressModelTypes
+from express_model.express_model_exception import ExpressModelException
+from collections import OrderedDict
+from threading import Lock, RLock
+from typing import Any, Dict, Tuple
+import os
+
+CacheKey = Tuple[str, float, ExpressModelTypes]
+
+
+class ExpressModelCache:
+    """
+    Process-wide cache of loaded model pipelines keyed by (path, mtime, model type).
+    The key is resolved once per ExpressModelConfiguration (key()), so the request path never stats the file;
+    only ExpressModelReloadWatcher resolves a new key. Configurations keep the model they loaded, so an entry
+    replaced by a reload is simply left to the LRU eviction.
+    Entries are evicted least-recently-used once the summed footprint passes max_bytes.
+    The footprint of a model is estimated by its pickle size on disk.
+    """
+    _lock = RLock()
+    _entries: "OrderedDict[CacheKey, Tuple[Any, int]]" = OrderedDict()
+    _loading_locks: Dict[CacheKey, Lock] = {}
+    _max_bytes: int = 2 * 1024 * 1024 * 1024
+    _footprint: int = 0
+
+    @classmethod
+    def configure(cls, max_bytes: int) -> None:
+        with cls._lock:
+            cls._max_bytes = max_bytes
+            cls._evict()
+
+    @staticmethod
+    def key(model_path: str, model_types: ExpressModelTypes) -> CacheKey:
+        model_path = os.path.abspath(model_path)
+        return model_path, os.path.getmtime(model_path), model_types
+
+    @classmethod
+    def get(cls, key: CacheKey) -> Any:
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None:
+                cls._entries.move_to_end(key)
+                return entry[0]
+            loading_lock = cls._loading_locks.setdefault(key, Lock())
+
+        # 같은 모델을 동시에 요청해도 한 번만 load 되도록 key 단위로 대기
+        with loading_lock:
+            with cls._lock:
+                entry = cls._entries.get(key)
+                if entry is not None:
+                    cls._entries.move_to_end(key)
+                    return entry[0]
+            model_path, mtime, model_types = key
+            try:
+                # evict 된 key 를 다시 load 할 때 파일이 그 사이 교체되었으면 다른 모델을 같은 key 로 올리지 않음
+                if os.path.getmtime(model_path) != mtime:
+                    raise ExpressModelException(f"Model file changed since it was resolved: {model_path}")
+                model = cls._load(model_path, model_types)
+                footprint = os.path.getsize(model_path)
+                with cls._lock:
+                    cls._entries[key] = (model, footprint)
+                    cls._footprint += footprint
+                    cls._evict()
+            finally:
+                with cls._lock:
+                    cls._loading_locks.pop(key, None)
+            return model
+
+    @classmethod
+    def discard(cls, key: CacheKey) -> None:
+        with cls._lock:
+            if key in cls._entries:
+                cls._remove(key)
+
+    @classmethod
+    def _load(cls, model_path: str, model_types: ExpressModelTypes) -> Any:
+        if model_types == ExpressModelTypes.SUPERVISED:
+            from pycaret import classification
+            model = classification.load_model(model_path.replace(".pkl", ""), verbose=False)
+        elif model_types == ExpressModelTypes.UNSUPERVISED:
+            from pycaret import anomaly
+            model = anomaly.load_model(model_path.replace(".pkl", ""), verbose=False)
+        else:
+            model = None
+        if model is None:
+            raise ExpressModelException(f"Failed to load model from path: {model_path}")
+        return model
+
+    @classmethod
+    def _remove(cls, key: CacheKey) -> None:
+        _, footprint = cls._entries.pop(key)
+        cls._footprint -= footprint
+
+    @classmethod
+    def _evict(cls) -> None:
+        # 가장 최근에 사용한 모델 하나는 용량을 넘더라도 유지함
+        while cls._footprint > cls._max_bytes and len(cls._entries) > 1:
+            cls._remove(next(iter(cls._entries)))
+
+    @classmethod
+    def footprint(cls) -> int:
+        return cls._footprint
+
+    @classmethod
+    def size(cls) -> int:
+        return len(cls._entries)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+            cls._loading_locks.clear()
+            cls._footprint = 0
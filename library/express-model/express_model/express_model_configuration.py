@@ -5,8 +5,9 @@ from express_model.define.express_model_configuration_interface import ExpressMo
 from express_model.define.express_model_metadata_builder import ExpressModelMetadataBuilder
 from express_model.express_model_types import ExpressModelTypes
 from express_model.express_model_exception import ExpressModelException
-from pycaret import anomaly, classification
-from typing import List
+from express_model.express_model_cache import ExpressModelCache, CacheKey
+from express_model.express_model_manifest import ExpressModelManifest, NUMERIC_DTYPE, CATEGORY_DTYPE
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class ExpressModelConfiguration(ExpressModelConfigurationInterface):
@@ -17,7 +18,10 @@ class ExpressModelConfiguration(ExpressModelConfigurationInterface):
                  _id: str,
                  dir: str,
                  prefix: str,
-                 feature_list: list
+                 feature_list: list,
+                 feature_dtypes: Optional[Dict[str, str]] = None,
+                 cache_key: Optional[CacheKey] = None,
+                 model: Any = None
                  ):
         self._model_types = model_types
         self._model_path = model_path
@@ -25,6 +29,10 @@ class ExpressModelConfiguration(ExpressModelConfigurationInterface):
         self._dir = dir
         self._prefix = prefix
         self._feature_list = feature_list
+        self._feature_dtypes = feature_dtypes if feature_dtypes is not None else {}
+        # 모델 파일은 configuration 생성 시 한 번만 확인하고, 새 파일은 ExpressModelReloadWatcher 가 반영
+        self._cache_key = cache_key if cache_key is not None else ExpressModelCache.key(model_path, model_types)
+        self._model = model
 
     @property
     def model_type(self) -> ExpressModelTypes:
@@ -50,6 +58,56 @@ class ExpressModelConfiguration(ExpressModelConfigurationInterface):
     def feature_list(self) -> list:
         return self._feature_list
 
+    @property
+    def feature_dtypes(self) -> Dict[str, str]:
+        """
+        feature name -> "numeric" or "category".
+        """
+        return self._feature_dtypes
+
+    @property
+    def cache_key(self) -> CacheKey:
+        """
+        ExpressModelCache key of the model file as it was when this configuration was built.
+        """
+        return self._cache_key
+
+    @property
+    def model(self) -> Any:
+        """
+        Model pipeline of this configuration, loaded through ExpressModelCache on first use and kept here,
+        so a caller holding the configuration keeps a usable model after a reload swapped it out
+        or the cache evicted its entry.
+        """
+        model = self._model
+        if model is None:
+            model = self._model = ExpressModelCache.get(self._cache_key)
+        return model
+
+    @staticmethod
+    def find_latest_model_file(dir: str, prefix: str) -> str:
+        possible_dirs = [
+            dir,
+            os.path.abspath(f"./resources/{dir}")
+        ]
+        checked_dir = None
+        for possible_dir in possible_dirs:
+            if os.path.exists(possible_dir):
+                checked_dir = possible_dir
+                break
+
+        if not checked_dir:
+            raise FileNotFoundError("No model dir found in the specified dirs.")
+
+        pattern = os.path.join(checked_dir, f"{prefix}*.pkl")
+        matching_files = glob.glob(pattern)
+
+        if not matching_files:
+            raise ExpressModelException(f"No files found with prefix {prefix} in path {checked_dir}")
+
+        latest_file = max(matching_files, key=lambda x: os.path.getmtime(x))
+        return latest_file
+
     class Builder(ExpressModelMetadataBuilder):
         def __init__(self, model_types: ExpressModelTypes):
             self.__model_types = model_types
@@ -70,6 +128,11 @@ class ExpressModelConfiguration(ExpressModelConfigurationInterface):
             self.__prefix = prefix
             return self
 
+        def model_path(self, model_path: str) -> 'ExpressModelConfiguration.Builder':
+            # 지정하지 않으면 build 시 dir 에서 prefix 가 일치하는 최신 모델 파일을 사용
+            self.__model_path = model_path
+            return self
+
         def build(self) -> 'ExpressModelConfiguration':
             if self.__model_types == ExpressModelTypes.UNKNOWN or not self.__model_types:
                 raise ExpressModelException("Model Types cannot be UNKNOWN or empty")
@@ -80,52 +143,41 @@ class ExpressModelConfiguration(ExpressModelConfigurationInterface):
             if not self.__prefix:
                 raise ExpressModelException("Model prefix cannot be None or empty")
 
-            self.__model_path = self.__get_latest_model_files(self.__dir, self.__prefix)
+            if not self.__model_path:
+                self.__model_path = ExpressModelConfiguration.find_latest_model_file(self.__dir, self.__prefix)
 
+            cache_key = ExpressModelCache.key(self.__model_path, self.__model_types)
+            feature_list, feature_dtypes, model = self.__extract_feature_list_from_model(cache_key)
             return ExpressModelConfiguration(
                 model_types=self.__model_types,
                 model_path=self.__model_path,
                 _id=self.__id,
                 dir=self.__dir,
                 prefix=self.__prefix,
-                feature_list=self.__extract_feature_list_from_model(self.__model_path)
+                feature_list=feature_list,
+                feature_dtypes=feature_dtypes,
+                cache_key=cache_key,
+                model=model
             )
 
-        def __get_latest_model_files(self, dir: str, prefix: str) -> str:
-            possible_dirs = [
-                dir,
-                os.path.abspath(f"./resources/{dir}")
-            ]
-            checked_dir = None
-            for possible_dir in possible_dirs:
-                if os.path.exists(possible_dir):
-                    checked_dir = possible_dir
-                    break
-
-            if not checked_dir:
-                raise FileNotFoundError("No model dir found in the specified dirs.")
-
-            pattern = os.path.join(checked_dir, f"{prefix}*.pkl")
-            matching_files = glob.glob(pattern)
-
-            if not matching_files:
-                raise ExpressModelException(f"No files found with prefix {prefix} in path {checked_dir}")
-
-            latest_file = max(matching_files, key=lambda x: os.path.getmtime(x))
-            return latest_file
-
-        def __extract_feature_list_from_model(self, model_path: str) -> List[str]:
-            model = None
-            if self.__model_types == ExpressModelTypes.SUPERVISED:
-                model = classification.load_model(model_path.replace(".pkl", ""))
-            elif self.__model_types == ExpressModelTypes.UNSUPERVISED:
-                model = anomaly.load_model(model_path.replace(".pkl", ""))
-            else:
-                model = None
-
-            if model is None:
+        def __extract_feature_list_from_model(self, cache_key: CacheKey) -> Tuple[List[str], Dict[str, str], Any]:
+            """
+            :return: feature list, feature dtypes, and the model when it had to be loaded (None with a manifest).
+            """
+            model_path = cache_key[0]
+            # manifest 가 있으면 모델을 unpickle 하지 않고 feature list 를 얻음
+            manifest = ExpressModelManifest.read(model_path)
+            if manifest is not None and manifest.model_type == self.__model_types:
+                return list(manifest.feature_list), dict(manifest.dtypes), None
+
+            # 추론 시에도 같은 객체를 사용하도록 cache 를 통해 load
+            try:
+                model = ExpressModelCache.get(cache_key)
+            except ExpressModelException:
                 raise ExpressModelException(f"Failed to load model from path: {model_path}. Cannot load feature list.")
 
-            numerical_features = model.named_steps['numerical_imputer'].include
-            categorical_features = model.named_steps['categorical_imputer'].include
-            return list(numerical_features) + list(categorical_features)
+            numerical_features = list(model.named_steps['numerical_imputer'].include)
+            categorical_features = list(model.named_steps['categorical_imputer'].include)
+            feature_dtypes = {feature: NUMERIC_DTYPE for feature in numerical_features}
+            feature_dtypes.update({feature: CATEGORY_DTYPE for feature in categorical_features})
+            return numerical_features + categorical_features, feature_dtypes, model
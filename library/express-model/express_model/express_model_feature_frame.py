@@ -0,0 +1,146 @@
+from express_model.express_model_configuration import ExpressModelConfiguration
+from express_model.express_model_exception import ExpressModelException
+from express_model.express_model_manifest import CATEGORY_DTYPE
+from express_model.express_model_types import (ExpressModelTypes, LABEL_COLUMN, SCORE_COLUMN,
+                                              ANOMALY_COLUMN, ANOMALY_SCORE_COLUMN)
+from typing import Any, Dict, Iterable, List, Tuple, Union
+import numpy as np
+import pandas as pd
+
+PREDICTION_COLUMNS = {
+    ExpressModelTypes.SUPERVISED: [(LABEL_COLUMN, np.int64), (SCORE_COLUMN, np.float64)],
+    ExpressModelTypes.UNSUPERVISED: [(ANOMALY_COLUMN, np.int64), (ANOMALY_SCORE_COLUMN, np.float64)],
+}
+
+
+def prediction_columns(configuration: ExpressModelConfiguration) -> List[Tuple[str, Any]]:
+    """
+    PREDICTION_COLUMNS of the model type, with the prediction_label dtype taken from the model's classes:
+    int64 when predict_fast can cast every class to int, object otherwise (e.g. string class labels).
+    """
+    columns = PREDICTION_COLUMNS[configuration.model_type]
+    if configuration.model_type != ExpressModelTypes.SUPERVISED:
+        return columns
+    label_dtype = _label_dtype(configuration.model)
+    return [(column, label_dtype if column == LABEL_COLUMN else dtype) for column, dtype in columns]
+
+
+def _label_dtype(model: Any) -> Any:
+    from pycaret.utils.generic import get_label_encoder
+
+    # label encoder 가 있으면 model 의 classes_ 는 encoding 된 값이므로 원래 class 를 사용
+    label_encoder = get_label_encoder(model)
+    classes = label_encoder.classes_ if label_encoder else getattr(model, "classes_", None)
+    if classes is None:
+        return object
+    try:
+        np.asarray(classes).astype(np.int64)
+    except (TypeError, ValueError):
+        return object
+    return np.int64
+
+
+class ExpressModelFeatureFrame:
+    """
+    Preallocated column store for a chain of models (e.g. a hybrid section).
+    Holds one array per column of the union of every model's feature_list, plus one array per
+    prediction column named {model id}_{column}. Buffers are allocated once for `capacity` rows and
+    reused by every fill(), so a batch costs one copy of the input and no per-model DataFrame copies.
+
+    view() hands each model a DataFrame over read-only views of the shared arrays.
+    put_predictions() writes a model's outputs into its result columns, and into the feature column
+    of the same name when a later model consumes it (Anomaly_Score feeding a supervised model).
+    """
+
+    def __init__(self, configurations: Iterable[ExpressModelConfiguration], capacity: int = 1024):
+        self._configurations = list(configurations)
+        self._dtypes: Dict[str, str] = {}
+        for configuration in self._configurations:
+            for feature in configuration.feature_list:
+                self._dtypes.setdefault(feature, configuration.feature_dtypes.get(feature, "numeric"))
+        self._result_dtypes: Dict[str, Any] = {}
+        for configuration in self._configurations:
+            for column, dtype in prediction_columns(configuration):
+                self._result_dtypes[f"{configuration.id}_{column}"] = dtype
+        self._rows = 0
+        self._capacity = 0
+        self._columns: Dict[str, np.ndarray] = {}
+        self._results: Dict[str, np.ndarray] = {}
+        self._index = pd.RangeIndex(0)
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._columns = {
+            feature: np.empty(capacity, dtype=object if dtype == CATEGORY_DTYPE else np.float64)
+            for feature, dtype in self._dtypes.items()
+        }
+        self._results = {column: np.zeros(capacity, dtype=dtype) for column, dtype in self._result_dtypes.items()}
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    def fill(self, records: Union[pd.DataFrame, List[Dict[str, Any]]]) -> 'ExpressModelFeatureFrame':
+        """
+        Copies records into the buffers; features absent from records are reset to NaN (numeric) or None.
+        Grows the buffers when records exceed the capacity.
+        """
+        if not isinstance(records, pd.DataFrame):
+            records = pd.DataFrame.from_records(records)
+        rows = len(records)
+        if rows > self._capacity:
+            self._allocate(max(rows, self._capacity * 2))
+        self._rows = rows
+        self._index = records.index
+
+        for feature, values in self._columns.items():
+            target = values[:rows]
+            if feature in records.columns:
+                target[:] = records[feature].to_numpy()
+            else:
+                target[:] = None if values.dtype == object else np.nan
+        for values in self._results.values():
+            values[:rows] = 0
+        return self
+
+    def view(self, configuration: ExpressModelConfiguration) -> pd.DataFrame:
+        """
+        :return: DataFrame of configuration.feature_list in order, backed by read-only views of the buffers.
+        """
+        data = {}
+        for feature in configuration.feature_list:
+            values = self._columns[feature][:self._rows]
+            values.flags.writeable = False
+            data[feature] = values
+        return pd.DataFrame(data, index=self._index, copy=False)
+
+    def put_predictions(self, configuration: ExpressModelConfiguration, predictions: pd.DataFrame) -> None:
+        if len(predictions) != self._rows:
+            raise ExpressModelException(
+                f"Prediction rows of {configuration.id} ({len(predictions)}) do not match frame rows ({self._rows})"
+            )
+        for column, _ in PREDICTION_COLUMNS[configuration.model_type]:
+            values = predictions[column].to_numpy()
+            self._results[f"{configuration.id}_{column}"][:self._rows] = values
+            if column in self._columns:
+                self._columns[column][:self._rows] = values
+
+    def result(self, column: str) -> np.ndarray:
+        """
+        :param column: {model id}_{prediction column}
+        """
+        values = self._results[column][:self._rows]
+        values.flags.writeable = False
+        return values
+
+    def to_frame(self, include_features: bool = True) -> pd.DataFrame:
+        data = {}
+        if include_features:
+            data.update({feature: values[:self._rows] for feature, values in self._columns.items()})
+        data.update({column: values[:self._rows] for column, values in self._results.items()})
+        return pd.DataFrame(data, index=self._index, copy=False)
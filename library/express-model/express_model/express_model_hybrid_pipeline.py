@@ -0,0 +1,136 @@
+from express_model.express_model_exception import ExpressModelException
+from express_model.express_model_feature_frame import ExpressModelFeatureFrame
+from express_model.express_model_metadata import ExpressModelMetadata
+from express_model.express_model_types import ExpressModelTypes
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from threading import Lock
+from typing import Any, Dict, List, Optional, Union
+import pandas as pd
+import time
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+STAGES = ("unsupervised", "supervised")
+
+# process pool worker 마다 한 번만 build 하도록 id 별로 보관
+_process_metadata: Dict[str, ExpressModelMetadata] = {}
+
+
+def _predict_in_process(config: Dict[str, Any], data: pd.DataFrame) -> pd.DataFrame:
+    metadata = _process_metadata.get(config["id"])
+    if metadata is None:
+        metadata = ExpressModelMetadata()
+        if not metadata.build(config=config):
+            raise ExpressModelException(f"Failed to build model {config.get('id')} in worker process")
+        _process_metadata[config["id"]] = metadata
+    return metadata.predict_fast(data)
+
+
+class ExpressModelHybridPipeline:
+    """
+    Runs the models of a hybrid section of model_mapping.yaml as two stages.
+    Unsupervised models are independent of each other and run concurrently; their Anomaly_Score
+    fills the feature of the same name in the supervised stage, which then runs concurrently as well.
+    With several unsupervised models the Anomaly_Score feature takes the last one in config order.
+
+    executor="thread" shares the loaded models and suits estimators that release the GIL (catboost, numpy);
+    executor="process" rebuilds each model once per worker process and suits pure-Python estimators.
+    predict() calls are serialized because the feature frame buffers are reused between calls.
+    """
+
+    def __init__(self,
+                 configs: List[Dict[str, Any]],
+                 executor: str = EXECUTOR_THREAD,
+                 max_workers: Optional[int] = None,
+                 capacity: int = 1024):
+        if not configs:
+            raise ExpressModelException("Hybrid section has no model")
+        if executor not in (EXECUTOR_THREAD, EXECUTOR_PROCESS):
+            raise ExpressModelException(f"Unknown executor: {executor}")
+
+        self._configs: Dict[str, Dict[str, Any]] = {}
+        self._stages: Dict[str, List[ExpressModelMetadata]] = {stage: [] for stage in STAGES}
+        for config in configs:
+            if config.get("id") in self._configs:
+                raise ExpressModelException(f"Duplicated model id in hybrid section: {config.get('id')}")
+            metadata = ExpressModelMetadata()
+            if not metadata.build(config=config):
+                raise ExpressModelException(f"Failed to build hybrid model: {config}")
+            self._configs[config["id"]] = config
+            if metadata.get_configuration().model_type == ExpressModelTypes.UNSUPERVISED:
+                self._stages["unsupervised"].append(metadata)
+            else:
+                self._stages["supervised"].append(metadata)
+
+        self._executor_type = executor
+        workers = max_workers or max(len(stage) for stage in self._stages.values())
+        self._executor: Executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hybrid") \
+            if executor == EXECUTOR_THREAD else ProcessPoolExecutor(max_workers=workers)
+        self._frame = ExpressModelFeatureFrame(
+            [metadata.get_configuration() for stage in STAGES for metadata in self._stages[stage]],
+            capacity=capacity
+        )
+        self._lock = Lock()
+        self._last_latency_ms: Dict[str, float] = {}
+        self._total_latency_ms: Dict[str, float] = {stage: 0.0 for stage in STAGES + ("total",)}
+        self._call_count = 0
+
+    @staticmethod
+    def from_mapping(model_mapping: Dict[str, Any], section: str = "hybrid", **kwargs) -> 'ExpressModelHybridPipeline':
+        configs = model_mapping.get(section)
+        if not configs:
+            raise ExpressModelException(f"No {section} section in model mapping")
+        return ExpressModelHybridPipeline(configs, **kwargs)
+
+    def predict(self,
+                records: Union[pd.DataFrame, List[Dict[str, Any]]],
+                include_features: bool = False) -> pd.DataFrame:
+        """
+        :return: {model id}_{prediction column} for every model, indexed like records.
+                 The returned frame is a copy; the internal buffers are reused by the next call.
+        """
+        with self._lock:
+            start = time.perf_counter()
+            self._frame.fill(records)
+            for stage in STAGES:
+                stage_start = time.perf_counter()
+                self._run_stage(self._stages[stage])
+                self._last_latency_ms[stage] = (time.perf_counter() - stage_start) * 1000
+            self._last_latency_ms["total"] = (time.perf_counter() - start) * 1000
+
+            for stage, latency in self._last_latency_ms.items():
+                self._total_latency_ms[stage] += latency
+            self._call_count += 1
+            return self._frame.to_frame(include_features=include_features).copy()
+
+    def _run_stage(self, stage: List[ExpressModelMetadata]) -> None:
+        if not stage:
+            return
+        futures = []
+        for metadata in stage:
+            configuration = metadata.get_configuration()
+            data = self._frame.view(configuration)
+            if self._executor_type == EXECUTOR_PROCESS:
+                futures.append(self._executor.submit(_predict_in_process, self._configs[configuration.id], data))
+            else:
+                futures.append(self._executor.submit(metadata.predict_fast, data))
+        # 결과는 설정 순서대로 기록해야 같은 입력에 같은 Anomaly_Score 가 들어감
+        for metadata, future in zip(stage, futures):
+            self._frame.put_predictions(metadata.get_configuration(), future.result())
+
+    def get_last_latency_ms(self) -> Dict[str, float]:
+        """
+        :return: latency of the last predict() per stage ("unsupervised", "supervised") and "total".
+        """
+        return dict(self._last_latency_ms)
+
+    def get_average_latency_ms(self) -> Dict[str, float]:
+        if self._call_count == 0:
+            return {}
+        return {stage: total / self._call_count for stage, total in self._total_latency_ms.items()}
+
+    def get_models(self, stage: str) -> List[ExpressModelMetadata]:
+        return list(self._stages[stage])
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
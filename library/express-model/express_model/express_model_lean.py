@@ -0,0 +1,292 @@
+from express_model.express_model_types import (ExpressModelTypes, LABEL_COLUMN, SCORE_COLUMN,
+                                              ANOMALY_COLUMN, ANOMALY_SCORE_COLUMN)
+from express_model.express_model_exception import ExpressModelException
+from typing import Any, Dict, List, Optional, Union
+import argparse
+import glob
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+LEAN_VERSION = 1
+LEAN_SUFFIX = ".lean.joblib"
+_FLOAT32_MAX = float(np.finfo(np.float32).max)
+
+
+class ExpressModelLeanRuntime:
+    """
+    Executes a pipeline exported by export_lean_model() without importing pycaret.
+    Imputers and the one-hot encoder are compiled to fill values and lookup tables applied with NumPy;
+    only the final estimator is kept as an object, so loading needs joblib, pandas and the estimator's own
+    library (catboost, pyod, sklearn, ...). Outputs are identical to ExpressModelMetadata.predict_fast().
+    """
+
+    def __init__(self, lean: Dict[str, Any]):
+        if lean.get("version") != LEAN_VERSION:
+            raise ExpressModelException(f"Unsupported lean model version: {lean.get('version')}")
+        self._model_type = ExpressModelTypes[lean["model_type"]]
+        self._input_columns: List[str] = lean["input_columns"]
+        self._output_columns: List[str] = lean["output_columns"]
+        self._steps: List[Dict[str, Any]] = lean["steps"]
+        self._estimator = lean["estimator"]
+        self._probability_threshold: Optional[float] = lean["probability_threshold"]
+        self._label_encoder = lean["label_encoder"]
+        self._feature_list: List[str] = lean["feature_list"]
+        self._feature_dtypes: Dict[str, str] = lean["feature_dtypes"]
+
+    @staticmethod
+    def load(path: str) -> 'ExpressModelLeanRuntime':
+        import joblib
+        return ExpressModelLeanRuntime(joblib.load(path))
+
+    @property
+    def model_type(self) -> ExpressModelTypes:
+        return self._model_type
+
+    @property
+    def feature_list(self) -> List[str]:
+        return self._feature_list
+
+    @property
+    def feature_dtypes(self) -> Dict[str, str]:
+        return self._feature_dtypes
+
+    def transform(self, records: Union[pd.DataFrame, np.ndarray, List[Dict[str, Any]]]) -> pd.DataFrame:
+        if isinstance(records, pd.DataFrame):
+            data = records
+        elif isinstance(records, np.ndarray):
+            data = pd.DataFrame(records, columns=self._feature_list)
+        else:
+            data = pd.DataFrame.from_records(records, columns=self._feature_list)
+        data = data.reindex(columns=self._input_columns)
+
+        columns: Dict[str, np.ndarray] = {}
+        for column in self._input_columns:
+            columns[column] = _shrink(data[column])
+        for step in self._steps:
+            if step["kind"] == "impute":
+                for column, value in zip(step["columns"], step["values"]):
+                    columns[column] = _impute(columns[column], value)
+            elif step["kind"] == "onehot":
+                for column, encoding in step["columns"].items():
+                    columns.update(_onehot(columns.pop(column), encoding))
+            else:
+                raise ExpressModelException(f"Unknown lean step: {step['kind']}")
+        return pd.DataFrame({column: columns[column] for column in self._output_columns}, index=data.index)
+
+    def predict(self,
+                records: Union[pd.DataFrame, np.ndarray, List[Dict[str, Any]]],
+                round: int = 4) -> pd.DataFrame:
+        transformed = self.transform(records)
+        if self._model_type == ExpressModelTypes.UNSUPERVISED:
+            return pd.DataFrame({
+                ANOMALY_COLUMN: self._estimator.predict(transformed),
+                ANOMALY_SCORE_COLUMN: self._estimator.decision_function(transformed)
+            }, index=transformed.index)
+
+        return predict_classification(self._estimator, transformed, transformed.index,
+                                      self._probability_threshold, self._label_encoder, round)
+
+
+def predict_classification(estimator,
+                           transformed: pd.DataFrame,
+                           index: pd.Index,
+                           probability_threshold: Optional[float],
+                           label_encoder,
+                           round: int = 4) -> pd.DataFrame:
+    """
+    Label and score columns of a classification estimator applied to already transformed features.
+    Shared by ExpressModelLeanRuntime and ExpressModelMetadata.predict_fast().
+    """
+    # pycaret ClassificationExperiment.predict_model 의 label/score 계산과 동일하게 유지
+    pred = np.ravel(np.nan_to_num(estimator.predict(transformed)))
+    if label_encoder:
+        pred = label_encoder.inverse_transform(pred)
+
+    try:
+        score = estimator.predict_proba(transformed)
+        pred_prob = score[:, 1] if len(np.unique(pred)) <= 2 else score
+    except Exception:
+        score = None
+        pred_prob = None
+
+    if probability_threshold is not None and pred_prob is not None:
+        try:
+            pred = (pred_prob >= probability_threshold).astype(int)
+            if label_encoder:
+                pred = label_encoder.inverse_transform(pred)
+        except Exception:
+            pass
+
+    try:
+        pred = pred.astype(int)
+    except Exception:
+        pass
+
+    output = pd.DataFrame({LABEL_COLUMN: pred}, index=index)
+    if score is not None:
+        encoded = label_encoder.transform(pred) if label_encoder else pred
+        output[SCORE_COLUMN] = np.round(score[np.arange(len(encoded)), encoded], round)
+    return output
+
+
+def _shrink(series: pd.Series) -> np.ndarray:
+    # pycaret df_shrink_dtypes 와 같이 float 은 float32 로 줄이고 object 는 그대로 둠
+    if pd.api.types.is_float_dtype(series.dtype):
+        values = series.to_numpy()
+        finite = values[~np.isnan(values)]
+        if finite.size == 0 or np.abs(finite).max() <= _FLOAT32_MAX:
+            return values.astype(np.float32)
+        return values
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64)
+    return series.to_numpy(dtype=object)
+
+
+def _impute(values: np.ndarray, value: Any) -> np.ndarray:
+    missing = pd.isna(values)
+    if not isinstance(value, (int, float, np.number)):
+        # 범주형 imputer 는 숫자로 읽힌 빈 컬럼도 object 로 채움
+        values = values.astype(object)
+        values[missing] = value
+        return values
+    if values.dtype == object:
+        values = values.astype(np.float64)
+    elif not missing.any():
+        return values
+    else:
+        values = values.copy() if values.dtype.kind == "f" else values.astype(np.float64)
+    values[missing] = value
+    return values
+
+
+def _onehot(values: np.ndarray, encoding: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    # table 의 마지막 두 행은 unknown, missing 범주
+    categories = encoding["categories"]
+    table = encoding["table"]
+    codes = pd.Categorical(values, categories=categories).codes.astype(np.int64)
+    codes[codes < 0] = len(categories)
+    codes[pd.isna(values)] = len(categories) + 1
+    encoded = table[codes]
+    return {name: encoded[:, i] for i, name in enumerate(encoding["names"])}
+
+
+def export_lean_model(model: Any, model_type: ExpressModelTypes, feature_dtypes: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Compiles a loaded pycaret pipeline into the dict executed by ExpressModelLeanRuntime.
+    Supports the steps express models are trained with: SimpleImputer and category_encoders OneHotEncoder
+    wrapped in pycaret TransformerWrapper, and an optional label_encoding step.
+
+    :raises ExpressModelException: when the pipeline contains a step that cannot be compiled.
+    """
+    from pycaret.internal.meta_estimators import (CustomProbabilityThresholdClassifier,
+                                                  get_estimator_from_meta_estimator)
+    from pycaret.utils.generic import get_label_encoder
+
+    input_columns = list(model.feature_names_in_)
+    if model_type == ExpressModelTypes.SUPERVISED:
+        input_columns = input_columns[:-1]
+
+    steps = []
+    for name, step in model.steps[:-1]:
+        transformer = getattr(step, "transformer", None)
+        include = list(getattr(step, "include", None) or [])
+        kind = type(transformer).__name__
+        if name == "label_encoding":
+            continue
+        if kind == "SimpleImputer":
+            steps.append({"kind": "impute", "columns": include, "values": list(transformer.statistics_)})
+        elif kind == "OneHotEncoder" and type(transformer).__module__.startswith("category_encoders"):
+            steps.append({"kind": "onehot", "columns": _compile_onehot(transformer)})
+        else:
+            raise ExpressModelException(f"Step {name} ({kind}) cannot be exported to the lean format")
+
+    # 최종 estimator 가 받는 컬럼 순서는 pycaret 변환 결과에서 그대로 가져옴
+    dummy = pd.DataFrame({column: [None] for column in input_columns})
+    transformed = dummy
+    for _, step in model.steps[:-1]:
+        transformed = step.transform(transformed)
+
+    estimator = model.steps[-1][1]
+    probability_threshold = None
+    if isinstance(estimator, CustomProbabilityThresholdClassifier):
+        probability_threshold = estimator.probability_threshold
+        estimator = get_estimator_from_meta_estimator(estimator)
+
+    return {
+        "version": LEAN_VERSION,
+        "model_type": model_type.value,
+        "input_columns": input_columns,
+        "output_columns": list(transformed.columns),
+        "steps": steps,
+        "estimator": estimator,
+        "probability_threshold": probability_threshold,
+        "label_encoder": get_label_encoder(model) or None,
+        "feature_list": list(feature_dtypes),
+        "feature_dtypes": dict(feature_dtypes),
+    }
+
+
+def _compile_onehot(encoder: Any) -> Dict[str, Dict[str, Any]]:
+    if encoder.handle_unknown != "value" or encoder.handle_missing not in ("value", "return_nan"):
+        raise ExpressModelException("Only handle_unknown='value' one-hot encoders can be exported")
+    ordinal_mappings = {mapping["col"]: mapping["mapping"] for mapping in encoder.ordinal_encoder.mapping}
+    compiled = {}
+    for mapping in encoder.mapping:
+        column = mapping["col"]
+        onehot = mapping["mapping"]
+        ordinals = ordinal_mappings[column]
+        categories = [category for category in ordinals.index if not pd.isna(category)]
+        rows = [onehot.loc[ordinals[category]].to_numpy(dtype=np.float64) for category in categories]
+        rows.append(onehot.loc[-1].to_numpy(dtype=np.float64))
+        rows.append(onehot.loc[-2].to_numpy(dtype=np.float64) if -2 in onehot.index
+                    else onehot.loc[-1].to_numpy(dtype=np.float64))
+        compiled[column] = {
+            "categories": categories,
+            "names": list(onehot.columns),
+            "table": np.vstack(rows),
+        }
+    return compiled
+
+
+def export_lean_models(dir: str, prefix: str = "", model_type: Optional[ExpressModelTypes] = None) -> List[str]:
+    """
+    Writes {name}.lean.joblib next to every {prefix}*.pkl in dir.
+
+    :return: written paths.
+    """
+    import joblib
+    from express_model.express_model_manifest import ExpressModelManifest, detect_model_type
+
+    written = []
+    for model_path in sorted(glob.glob(os.path.join(dir, f"{prefix}*.pkl"))):
+        model = joblib.load(model_path)
+        resolved_type = model_type if model_type is not None else detect_model_type(model)
+        manifest = ExpressModelManifest.from_model(model, model_path, resolved_type)
+        lean_path = f"{os.path.splitext(model_path)[0]}{LEAN_SUFFIX}"
+        joblib.dump(export_lean_model(model, resolved_type, manifest.dtypes), lean_path)
+        written.append(lean_path)
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export the model pickles in a directory to the lean format.")
+    parser.add_argument("dir", help="model directory")
+    parser.add_argument("--prefix", default="", help="only models whose file name starts with this prefix")
+    parser.add_argument("--model-type", choices=["supervised", "unsupervised"],
+                        help="model type of every matched model (detected from the pipeline when omitted)")
+    args = parser.parse_args(argv)
+
+    model_type = ExpressModelTypes[args.model_type.upper()] if args.model_type else None
+    written = export_lean_models(args.dir, args.prefix, model_type)
+    for path in written:
+        print(path)
+    if not written:
+        print(f"No model found in {args.dir}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+from express_model.express_model_types import ExpressModelTypes
+from express_model.express_model_exception import ExpressModelException
+from typing import Any, Dict, List, Optional
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+
+MANIFEST_VERSION = 1
+NUMERIC_DTYPE = "numeric"
+CATEGORY_DTYPE = "category"
+
+
+class ExpressModelManifest:
+    """
+    Sidecar file written next to a model pickle ({name}.manifest.json or {name}.manifest.msgpack).
+    Holds what ExpressModelConfiguration needs at build time so the pipeline does not have to be unpickled.
+    The manifest is trusted while the pickle size and mtime match; otherwise the sha256 content hash decides.
+    """
+    FORMATS = ("json", "msgpack")
+
+    def __init__(self,
+                 model_type: ExpressModelTypes,
+                 feature_list: List[str],
+                 dtypes: Dict[str, str],
+                 content_hash: str,
+                 model_size: int,
+                 model_mtime: float):
+        self._model_type = model_type
+        self._feature_list = feature_list
+        self._dtypes = dtypes
+        self._content_hash = content_hash
+        self._model_size = model_size
+        self._model_mtime = model_mtime
+
+    @property
+    def model_type(self) -> ExpressModelTypes:
+        return self._model_type
+
+    @property
+    def feature_list(self) -> List[str]:
+        return self._feature_list
+
+    @property
+    def dtypes(self) -> Dict[str, str]:
+        return self._dtypes
+
+    @property
+    def content_hash(self) -> str:
+        return self._content_hash
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": MANIFEST_VERSION,
+            "model_type": self._model_type.value,
+            "feature_list": self._feature_list,
+            "dtypes": self._dtypes,
+            "content_hash": self._content_hash,
+            "model_size": self._model_size,
+            "model_mtime": self._model_mtime,
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ExpressModelManifest':
+        if data.get("version") != MANIFEST_VERSION:
+            raise ExpressModelException(f"Unsupported manifest version: {data.get('version')}")
+        return ExpressModelManifest(
+            model_type=ExpressModelTypes[data["model_type"]],
+            feature_list=list(data["feature_list"]),
+            dtypes=dict(data["dtypes"]),
+            content_hash=data["content_hash"],
+            model_size=data["model_size"],
+            model_mtime=data["model_mtime"]
+        )
+
+    @staticmethod
+    def from_model(model: Any, model_path: str, model_type: ExpressModelTypes) -> 'ExpressModelManifest':
+        numerical_features = list(model.named_steps['numerical_imputer'].include)
+        categorical_features = list(model.named_steps['categorical_imputer'].include)
+        dtypes = {feature: NUMERIC_DTYPE for feature in numerical_features}
+        dtypes.update({feature: CATEGORY_DTYPE for feature in categorical_features})
+        stat = os.stat(model_path)
+        return ExpressModelManifest(
+            model_type=model_type,
+            feature_list=numerical_features + categorical_features,
+            dtypes=dtypes,
+            content_hash=ExpressModelManifest.hash_file(model_path),
+            model_size=stat.st_size,
+            model_mtime=stat.st_mtime
+        )
+
+    @staticmethod
+    def hash_file(model_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(model_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def manifest_path(model_path: str, fmt: str = "json") -> str:
+        if fmt not in ExpressModelManifest.FORMATS:
+            raise ExpressModelException(f"Unknown manifest format: {fmt}")
+        base, _ = os.path.splitext(model_path)
+        return f"{base}.manifest.{fmt}"
+
+    def write(self, model_path: str, fmt: str = "json") -> str:
+        path = self.manifest_path(model_path, fmt)
+        if fmt == "msgpack":
+            import msgpack
+            payload = msgpack.packb(self.to_dict(), use_bin_type=True)
+        else:
+            payload = json.dumps(self.to_dict(), indent=2).encode("utf-8")
+
+        # 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(payload)
+        os.replace(temp_path, path)
+        return path
+
+    @staticmethod
+    def read(model_path: str) -> Optional['ExpressModelManifest']:
+        """
+        :return: the manifest of model_path, or None when it is missing, unreadable or stale.
+        """
+        for fmt in ExpressModelManifest.FORMATS:
+            path = ExpressModelManifest.manifest_path(model_path, fmt)
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, "rb") as file:
+                    payload = file.read()
+                if fmt == "msgpack":
+                    import msgpack
+                    data = msgpack.unpackb(payload, raw=False)
+                else:
+                    data = json.loads(payload.decode("utf-8"))
+                manifest = ExpressModelManifest.from_dict(data)
+            except Exception:
+                continue
+            if manifest.matches(model_path):
+                return manifest
+        return None
+
+    def matches(self, model_path: str) -> bool:
+        stat = os.stat(model_path)
+        if stat.st_size != self._model_size:
+            return False
+        if stat.st_mtime == self._model_mtime:
+            return True
+        # 복사 등으로 mtime 만 바뀐 경우는 내용으로 확인
+        return self.hash_file(model_path) == self._content_hash
+
+
+def detect_model_type(model: Any) -> ExpressModelTypes:
+    from sklearn.base import is_classifier
+    if is_classifier(model.steps[-1][1]):
+        return ExpressModelTypes.SUPERVISED
+    return ExpressModelTypes.UNSUPERVISED
+
+
+def generate_manifests(dir: str,
+                       prefix: str = "",
+                       model_type: Optional[ExpressModelTypes] = None,
+                       fmt: str = "json") -> List[str]:
+    """
+    Writes a manifest next to every {prefix}*.pkl in dir.
+    When model_type is None it is detected from the pipeline's final estimator.
+
+    :return: written manifest paths.
+    """
+    import joblib
+
+    written = []
+    for model_path in sorted(glob.glob(os.path.join(dir, f"{prefix}*.pkl"))):
+        model = joblib.load(model_path)
+        manifest = ExpressModelManifest.from_model(
+            model, model_path, model_type if model_type is not None else detect_model_type(model)
+        )
+        written.append(manifest.write(model_path, fmt))
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate feature manifests for the model pickles in a directory.")
+    parser.add_argument("dir", help="model directory")
+    parser.add_argument("--prefix", default="", help="only models whose file name starts with this prefix")
+    parser.add_argument("--model-type", choices=["supervised", "unsupervised"],
+                        help="model type of every matched model (detected from the pipeline when omitted)")
+    parser.add_argument("--format", choices=ExpressModelManifest.FORMATS, default="json")
+    args = parser.parse_args(argv)
+
+    model_type = ExpressModelTypes[args.model_type.upper()] if args.model_type else None
+    written = generate_manifests(args.dir, args.prefix, model_type, args.format)
+    for path in written:
+        print(path)
+    if not written:
+        print(f"No model found in {args.dir}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
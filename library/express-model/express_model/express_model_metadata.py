@@ -1,12 +1,15 @@
-from express_model.express_model_types import ExpressModelTypes
+from express_model.express_model_types import ExpressModelTypes, ANOMALY_COLUMN, ANOMALY_SCORE_COLUMN
 from express_model.express_model_configuration import ExpressModelConfiguration
-from pycaret.anomaly import AnomalyExperiment
-from pycaret.classification import ClassificationExperiment
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Union, TYPE_CHECKING
 import os
 import glob
 
+if TYPE_CHECKING:
+    # pycaret, pandas 는 import 에 수 초가 걸리므로 실제로 사용할 때 import 함
+    import numpy as np
+    import pandas as pd
+
 
 class ExpressModelMetadata:
     def __init__(self):
@@ -50,6 +53,21 @@ class ExpressModelMetadata:
             .build()
         return True
 
+    def swap_configuration(self, configuration: ExpressModelConfiguration) -> ExpressModelConfiguration:
+        """
+        Replaces the active configuration in one reference assignment.
+        Callers that already hold the previous configuration or model finish with them;
+        the next load_model() returns the model of the new configuration.
+
+        :return: the replaced configuration.
+        """
+        if configuration.model_type != self._model_type:
+            raise Exception(
+                f"swap_configuration is failed. ExpressModelTypes is Wrong."
+            )
+        previous, self._configuration = self._configuration, configuration
+        return previous
+
     def _get_model_config(self):
         if self._configuration is None:
             raise Exception("Model Configuration is None")
@@ -57,8 +75,10 @@ class ExpressModelMetadata:
 
     def create_experiment(self):
         if self._model_type == ExpressModelTypes.SUPERVISED:
+            from pycaret.classification import ClassificationExperiment
             experiment = ClassificationExperiment()
         elif self._model_type == ExpressModelTypes.UNSUPERVISED:
+            from pycaret.anomaly import AnomalyExperiment
             experiment = AnomalyExperiment()
         else:
             raise Exception(
@@ -71,5 +91,72 @@ class ExpressModelMetadata:
             raise Exception(
                 f"experiment is None. Check model type"
             )
-        model = experiment.load_model(self._configuration.model_path.replace(".pkl", ""))
+        # build 시 feature list 추출에 사용한 객체를 그대로 재사용
+        model = self._configuration.model
         return model
+
+    def predict_fast(self,
+                     records: Union['pd.DataFrame', 'np.ndarray', List[Dict[str, Any]]],
+                     round: int = 4) -> 'pd.DataFrame':
+        """
+        Runs the loaded pipeline directly instead of experiment.predict_model(),
+        skipping its data copies, column validation, display and untransformed output columns.
+        Outputs are identical to predict_model: prediction_label/prediction_score for supervised models,
+        Anomaly/Anomaly_Score for unsupervised models.
+
+        :param records: DataFrame or list of dicts keyed by feature name,
+                        or a 2d array whose columns follow get_configuration().feature_list.
+                        Missing features are passed to the model as None.
+        :param round: decimals of prediction_score, as in predict_model.
+        :return: DataFrame with only the label and score columns, indexed like records.
+        """
+        import numpy as np
+        import pandas as pd
+        from pycaret.utils.generic import df_shrink_dtypes
+
+        configuration = self._get_model_config()
+        model = configuration.model
+
+        if isinstance(records, pd.DataFrame):
+            data = records
+        elif isinstance(records, np.ndarray):
+            data = pd.DataFrame(records, columns=configuration.feature_list)
+        else:
+            data = pd.DataFrame.from_records(records, columns=configuration.feature_list)
+
+        columns = list(model.feature_names_in_)
+        if self._model_type == ExpressModelTypes.SUPERVISED:
+            # 학습 시 마지막 컬럼은 target
+            columns = columns[:-1]
+        # predict_model 과 같은 dtype 으로 변환해야 같은 결과가 나옴
+        data = df_shrink_dtypes(data.reindex(columns=columns))
+
+        transformed = data
+        for _, step in model.steps[:-1]:
+            transformed = step.transform(transformed)
+        estimator = model.steps[-1][1]
+
+        if self._model_type == ExpressModelTypes.SUPERVISED:
+            return self._predict_classification(model, estimator, transformed, data.index, round)
+        if self._model_type == ExpressModelTypes.UNSUPERVISED:
+            return pd.DataFrame({
+                ANOMALY_COLUMN: estimator.predict(transformed),
+                ANOMALY_SCORE_COLUMN: estimator.decision_function(transformed)
+            }, index=data.index)
+        raise Exception(
+            f"predict_fast is failed. ExpressModelTypes is Wrong."
+        )
+
+    @staticmethod
+    def _predict_classification(model, estimator, transformed, index, round: int) -> 'pd.DataFrame':
+        from pycaret.internal.meta_estimators import (CustomProbabilityThresholdClassifier,
+                                                      get_estimator_from_meta_estimator)
+        from pycaret.utils.generic import get_label_encoder
+        from express_model.express_model_lean import predict_classification
+
+        probability_threshold = None
+        if isinstance(estimator, CustomProbabilityThresholdClassifier):
+            probability_threshold = estimator.probability_threshold
+            estimator = get_estimator_from_meta_estimator(estimator)
+        return predict_classification(estimator, transformed, index, probability_threshold,
+                                      get_label_encoder(model), round)
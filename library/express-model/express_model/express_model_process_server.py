@@ -0,0 +1,327 @@
+from express_model.express_model_exception import ExpressModelException
+from express_model.express_model_feature_frame import prediction_columns
+from express_model.express_model_manifest import CATEGORY_DTYPE
+from express_model.express_model_metadata import ExpressModelMetadata
+from multiprocessing import reduction, shared_memory
+from multiprocessing.connection import Connection
+from queue import Queue
+from threading import Lock
+from typing import Any, Dict, List, Optional, Union
+import gc
+import multiprocessing
+import numpy as np
+import os
+import pandas as pd
+import signal
+import time
+import traceback
+
+OUTPUT_COLUMNS = 2
+
+
+class _ModelLayout:
+    """
+    Column split of one model: numeric features travel through shared memory, categorical ones are pickled.
+    """
+
+    def __init__(self, metadata: ExpressModelMetadata):
+        configuration = metadata.get_configuration()
+        self.metadata = metadata
+        self.feature_list = list(configuration.feature_list)
+        self.numeric = [feature for feature in self.feature_list
+                        if configuration.feature_dtypes.get(feature) != CATEGORY_DTYPE]
+        self.categorical = [feature for feature in self.feature_list if feature not in self.numeric]
+        self.outputs = prediction_columns(configuration)
+
+
+class _Worker:
+    def __init__(self, index: int, max_rows: int, max_numeric: int):
+        self.index = index
+        self.input = shared_memory.SharedMemory(create=True, size=max(1, max_numeric * max_rows * 8))
+        self.output = shared_memory.SharedMemory(create=True, size=OUTPUT_COLUMNS * max_rows * 8)
+        self.input_array = np.ndarray((max_numeric, max_rows), dtype=np.float64, buffer=self.input.buf)
+        self.output_array = np.ndarray((OUTPUT_COLUMNS, max_rows), dtype=np.float64, buffer=self.output.buf)
+        self.connection = None
+        self.process = None
+        self.broken = False
+
+    def release(self) -> None:
+        self.input_array = None
+        self.output_array = None
+        for memory in (self.input, self.output):
+            memory.close()
+            memory.unlink()
+
+
+def _serve(worker: _Worker, layouts: Dict[str, _ModelLayout], connection) -> None:
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        model_id, rows, categorical = request
+        try:
+            layout = layouts[model_id]
+            data = {feature: worker.input_array[i, :rows] for i, feature in enumerate(layout.numeric)}
+            data.update(categorical)
+            frame = pd.DataFrame(data, columns=layout.feature_list, copy=False)
+            predictions = layout.metadata.predict_fast(frame)
+            # 숫자가 아닌 label(문자열 class 등)은 float64 buffer 에 담을 수 없으므로 pipe 로 전달
+            pickled = {}
+            for i, (column, _) in enumerate(layout.outputs):
+                values = predictions[column].to_numpy()
+                if values.dtype.kind in "biuf":
+                    worker.output_array[i, :rows] = values
+                else:
+                    pickled[column] = values
+            connection.send((None, pickled))
+        except Exception:
+            connection.send((traceback.format_exc(), None))
+    connection.close()
+
+
+class _ForkedProcess:
+    """
+    Handle of a worker forked by the spawner. It is not a child of the server process, so it is tracked by pid.
+    """
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.exitcode = None
+
+    def is_alive(self) -> bool:
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+    def terminate(self) -> None:
+        try:
+            os.kill(self.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.is_alive() and (deadline is None or time.monotonic() < deadline):
+            time.sleep(0.01)
+
+
+def _spawner(workers: List[_Worker], layouts: Dict[str, _ModelLayout], control) -> None:
+    # server 의 pipe 를 들고 있으면 worker 가 server 종료를 감지하지 못함
+    for worker in workers:
+        worker.connection.close()
+    # 종료된 worker 는 자동으로 회수되어 zombie 로 남지 않음
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    workers_by_index = {worker.index: worker for worker in workers}
+    while True:
+        try:
+            index = control.recv()
+        except EOFError:
+            break
+        if index is None:
+            break
+        parent_connection, child_connection = multiprocessing.Pipe()
+        try:
+            pid = os.fork()
+        except OSError:
+            parent_connection.close()
+            child_connection.close()
+            control.send(None)
+            continue
+        if pid == 0:
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            control.close()
+            parent_connection.close()
+            exitcode = 0
+            try:
+                _serve(workers_by_index[index], layouts, child_connection)
+            except BaseException:
+                exitcode = 1
+            finally:
+                os._exit(exitcode)
+        child_connection.close()
+        control.send(pid)
+        reduction.send_handle(control, parent_connection.fileno(), os.getppid())
+        parent_connection.close()
+    control.close()
+
+
+class ExpressModelProcessServer:
+    """
+    Serves predict_fast() of already built models from N forked worker processes.
+    Models are loaded in the parent before forking, so the workers share the model memory copy-on-write
+    (gc.freeze() keeps the collector from touching, and so copying, those pages).
+    Numeric features of a request are written into the worker's shared-memory buffer and outputs are read
+    back from another one; only categorical columns and the request header are pickled through the pipe.
+
+    predict() is thread-safe: each call checks out an idle worker, so up to `workers` calls run in parallel.
+    A worker process that dies fails its call with ExpressModelException and is forked again (or dropped
+    when that fails) before it is returned to the pool. Replacements are forked by a single-threaded spawner
+    process prepared at construction time, never by the server process, whose request, logging and cache
+    threads may hold locks that a forked child would inherit in the locked state.
+    Requires the fork start method (Linux).
+    """
+
+    def __init__(self,
+                 metadata_list: List[ExpressModelMetadata],
+                 workers: Optional[int] = None,
+                 max_rows: int = 1024):
+        """
+        :param workers: number of worker processes, cpu_count() when None.
+        """
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        if workers < 1:
+            raise ExpressModelException("workers must be positive")
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise ExpressModelException("ExpressModelProcessServer requires the fork start method")
+
+        self._layouts: Dict[str, _ModelLayout] = {}
+        for metadata in metadata_list:
+            configuration = metadata.get_configuration()
+            # fork 전에 load 해야 worker 가 모델 메모리를 공유함
+            configuration.model
+            self._layouts[configuration.id] = _ModelLayout(metadata)
+
+        self._max_rows = max_rows
+        max_numeric = max(len(layout.numeric) for layout in self._layouts.values())
+        self._workers = [_Worker(index, max_rows, max_numeric) for index in range(workers)]
+        self._idle: "Queue[_Worker]" = Queue()
+        self._lock = Lock()
+
+        self._context = multiprocessing.get_context("fork")
+        gc.collect()
+        gc.freeze()
+        try:
+            for worker in self._workers:
+                self._spawn(worker)
+                self._idle.put(worker)
+            self._spawner_connection, spawner_child = self._context.Pipe()
+            self._spawner = self._context.Process(target=_spawner,
+                                                  args=(self._workers, self._layouts, spawner_child),
+                                                  name="ExpressModelSpawner", daemon=True)
+            self._spawner.start()
+            spawner_child.close()
+        finally:
+            gc.unfreeze()
+        self._spawner_lock = Lock()
+        self._closed = False
+
+    def _spawn(self, worker: _Worker) -> None:
+        parent_connection, child_connection = self._context.Pipe()
+        worker.process = self._context.Process(target=_serve, args=(worker, self._layouts, child_connection),
+                                               name=f"ExpressModelWorker-{worker.index}", daemon=True)
+        worker.process.start()
+        child_connection.close()
+        worker.connection = parent_connection
+        worker.broken = False
+
+    def _respawn(self, worker: _Worker) -> Optional[_Worker]:
+        """
+        :return: the worker running a new process, or None when it could not be forked and was dropped.
+        """
+        worker.connection.close()
+        if worker.process.is_alive():
+            worker.process.terminate()
+        worker.process.join(5)
+        try:
+            with self._spawner_lock:
+                self._spawner_connection.send(worker.index)
+                pid = self._spawner_connection.recv()
+                if pid is None:
+                    raise ExpressModelException(f"Spawner could not fork worker {worker.index}")
+                connection = Connection(reduction.recv_handle(self._spawner_connection))
+        except Exception:
+            with self._lock:
+                self._workers.remove(worker)
+            worker.release()
+            return None
+        worker.connection = connection
+        worker.process = _ForkedProcess(pid)
+        worker.broken = False
+        return worker
+
+    def predict(self, model_id: str, records: Union[pd.DataFrame, List[Dict[str, Any]]]) -> pd.DataFrame:
+        """
+        :return: prediction columns of model_id, identical to metadata.predict_fast(records).
+        """
+        if self._closed:
+            raise ExpressModelException("ExpressModelProcessServer is closed")
+        layout = self._layouts.get(model_id)
+        if layout is None:
+            raise ExpressModelException(f"Unknown model id: {model_id}")
+        if not isinstance(records, pd.DataFrame):
+            records = pd.DataFrame.from_records(records)
+
+        worker = self._idle.get()
+        if worker is None:
+            # 모든 worker 가 제거된 경우. 대기 중인 다른 호출도 깨우도록 다시 넣음
+            self._idle.put(None)
+            raise ExpressModelException("ExpressModelProcessServer has no live worker")
+        try:
+            results = [self._predict_chunk(worker, layout, records.iloc[start:start + self._max_rows])
+                       for start in range(0, len(records), self._max_rows)]
+        finally:
+            if worker.broken and not self._closed:
+                worker = self._respawn(worker)
+            with self._lock:
+                no_worker = not self._workers
+            if worker is not None or no_worker:
+                self._idle.put(worker)
+        if not results:
+            return pd.DataFrame({column: np.empty(0, dtype=dtype) for column, dtype in layout.outputs},
+                                index=records.index)
+        return pd.concat(results) if len(results) > 1 else results[0]
+
+    def _predict_chunk(self, worker: _Worker, layout: _ModelLayout, records: pd.DataFrame) -> pd.DataFrame:
+        rows = len(records)
+        for i, feature in enumerate(layout.numeric):
+            if feature in records.columns:
+                worker.input_array[i, :rows] = records[feature].to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                worker.input_array[i, :rows] = np.nan
+        categorical = {feature: records[feature].to_numpy(dtype=object) if feature in records.columns
+                       else np.full(rows, None, dtype=object)
+                       for feature in layout.categorical}
+
+        try:
+            worker.connection.send((layout.metadata.get_configuration().id, rows, categorical))
+            error, pickled = worker.connection.recv()
+        except (EOFError, OSError) as e:
+            worker.broken = True
+            raise ExpressModelException(f"Worker {worker.index} (pid {worker.process.pid}) is not responding, "
+                                        f"exitcode={worker.process.exitcode}: {e!r}")
+        if error is not None:
+            raise ExpressModelException(f"Worker {worker.index} failed: {error}")
+
+        return pd.DataFrame({column: pickled[column] if column in pickled
+                             else worker.output_array[i, :rows].astype(dtype)
+                             for i, (column, dtype) in enumerate(layout.outputs)}, index=records.index)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            try:
+                worker.connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        with self._spawner_lock:
+            try:
+                self._spawner_connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        self._spawner.join(5)
+        if self._spawner.is_alive():
+            self._spawner.terminate()
+        self._spawner_connection.close()
+        for worker in workers:
+            worker.process.join(5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.connection.close()
+            worker.release()
@@ -0,0 +1,91 @@
+from express_model.express_model_cache import ExpressModelCache
+from express_model.express_model_configuration import ExpressModelConfiguration
+from express_model.express_model_metadata import ExpressModelMetadata
+from express_base.express_base_thread import ExpressBaseThread
+from express_utils import ExpressExceptionUtils
+from threading import Event
+from typing import Callable, Optional
+import os
+import time
+
+
+class ExpressModelReloadWatcher(ExpressBaseThread):
+    """
+    Polls the model dir of an ExpressModelMetadata for a newer {prefix}*.pkl.
+    A new file is loaded and warmed up with a dummy prediction on this thread,
+    then swapped into the metadata so the request path never sees a cold model.
+    Files modified less than settle_ms ago are skipped until the copy has finished.
+    """
+
+    def __init__(self,
+                 metadata: ExpressModelMetadata,
+                 interval_ms: int = 10000,
+                 settle_ms: int = 2000,
+                 on_reload: Optional[Callable[[ExpressModelConfiguration, ExpressModelConfiguration], None]] = None,
+                 name: str = "ExpressModelReloadWatcher"):
+        super().__init__(name)
+        self._metadata = metadata
+        self._interval_sec = interval_ms / 1000
+        self._settle_sec = settle_ms / 1000
+        self._on_reload = on_reload
+        self._stop_event = Event()
+        self._reload_count = 0
+        self._loaded = metadata.get_configuration().cache_key[:2]
+
+    def _execute(self):
+        while not self._stop_event.wait(self._interval_sec):
+            try:
+                self.check()
+            except Exception as e:
+                # 새 모델을 사용할 수 없으면 기존 모델로 계속 서비스하고 다음 주기에 다시 시도
+                self._sys_logger.warning("Model reload failed: %s", ExpressExceptionUtils.get_stack_trace(e, 1))
+
+    def check(self) -> bool:
+        """
+        :return: True when a newer model was swapped in.
+        """
+        current = self._metadata.get_configuration()
+        latest_path = ExpressModelConfiguration.find_latest_model_file(current.dir, current.prefix)
+        latest_mtime = os.path.getmtime(latest_path)
+        if (os.path.abspath(latest_path), latest_mtime) == self._loaded:
+            return False
+        if time.time() - latest_mtime < self._settle_sec:
+            return False
+
+        configuration = ExpressModelConfiguration.Builder(current.model_type) \
+            .id(current.id) \
+            .dir(current.dir) \
+            .prefix(current.prefix) \
+            .model_path(latest_path) \
+            .build()
+        if configuration.cache_key[1] != latest_mtime:
+            # build 중에 파일이 다시 쓰였으면 다음 주기에 settle 여부부터 다시 확인
+            ExpressModelCache.discard(configuration.cache_key)
+            return False
+        self._warm_up(configuration)
+
+        previous = self._metadata.swap_configuration(configuration)
+        # 이전 configuration 을 잡고 있는 호출자는 그 모델로 끝까지 처리하고, cache entry 는 LRU 로 정리됨
+        self._loaded = configuration.cache_key[:2]
+        self._reload_count += 1
+        self._sys_logger.info("Model %s reloaded: %s -> %s", current.id, previous.model_path, configuration.model_path)
+        if self._on_reload is not None:
+            self._on_reload(previous, configuration)
+        return True
+
+    def _warm_up(self, configuration: ExpressModelConfiguration) -> None:
+        import pandas as pd
+
+        model = configuration.model
+        experiment = self._metadata.create_experiment()
+        dummy = pd.DataFrame({feature: [None] for feature in configuration.feature_list})
+        experiment.predict_model(estimator=model, data=dummy)
+
+    def _finalize(self):
+        self._sys_logger.debug("Thread %s finalized.", self._name)
+
+    def shutdown(self) -> None:
+        self._stop_event.set()
+
+    def get_reload_count(self) -> int:
+        return self._reload_count
@@ -5,3 +5,10 @@ class ExpressModelTypes(Enum):
     SUPERVISED = "SUPERVISED"
     UNSUPERVISED = "UNSUPERVISED"
     UNKNOWN = "UNKNOWN"
+
+
+# predict_model / predict_fast 출력 컬럼
+LABEL_COLUMN = "prediction_label"
+SCORE_COLUMN = "prediction_score"
+ANOMALY_COLUMN = "Anomaly"
+ANOMALY_SCORE_COLUMN = "Anomaly_Score"
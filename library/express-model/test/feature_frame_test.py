@@ -0,0 +1,69 @@
+from express_model.express_model_cache import ExpressModelCache
+from express_model.express_model_feature_frame import ExpressModelFeatureFrame, prediction_columns
+from model_test_support import build_metadata
+import numpy as np
+import pandas as pd
+import unittest
+from sklearn.dummy import DummyClassifier
+from sklearn.pipeline import Pipeline
+from unittest.mock import PropertyMock, patch
+
+
+class TestFeatureFrame(unittest.TestCase):
+    def setUp(self):
+        ExpressModelCache.clear()
+        self.unsupervised = build_metadata("unsupervised", "TEST_UL")
+        self.supervised = build_metadata("supervised", "TEST_SL")
+        self.configurations = [self.unsupervised.get_configuration(), self.supervised.get_configuration()]
+        self.origin_data = pd.DataFrame({
+            'cont_001': [0.1, 0.2, None],
+            'cont_002': [0.3, 0.4, 0.5],
+            'nominal_043': ['A', 'B', None],
+            'nominal_098': ['X', 'Y', 'Z'],
+            'nominal_099': ['A', 'B', None]
+        })
+
+    def test_hybrid_chain_matches_dataframe_copies(self):
+        frame = ExpressModelFeatureFrame(self.configurations, capacity=2)
+        frame.fill(self.origin_data)
+        for metadata in (self.unsupervised, self.supervised):
+            configuration = metadata.get_configuration()
+            frame.put_predictions(configuration, metadata.predict_fast(frame.view(configuration)))
+
+        unsupervised = self.unsupervised.predict_fast(self.origin_data)
+        supervised = self.supervised.predict_fast(self.origin_data.assign(Anomaly_Score=unsupervised["Anomaly_Score"]))
+        np.testing.assert_array_equal(frame.result("TEST_UL_Anomaly_Score"), unsupervised["Anomaly_Score"])
+        np.testing.assert_array_equal(frame.result("TEST_SL_prediction_label"), supervised["prediction_label"])
+        np.testing.assert_array_equal(frame.result("TEST_SL_prediction_score"), supervised["prediction_score"])
+        self.assertEqual(len(frame.to_frame()), 3)
+
+    def test_views_are_read_only_and_missing_columns_are_reset(self):
+        frame = ExpressModelFeatureFrame(self.configurations, capacity=8)
+        frame.fill(self.origin_data.assign(cont_003=[1.0, 2.0, 3.0]))
+        view = frame.view(self.configurations[1])
+        self.assertEqual(list(view.columns), self.configurations[1].feature_list)
+        with self.assertRaises(ValueError):
+            view["cont_001"].to_numpy()[0] = 1.0
+
+        frame.fill(self.origin_data.iloc[:2])
+        view = frame.view(self.configurations[1])
+        self.assertEqual(len(view), 2)
+        self.assertTrue(view["cont_003"].isna().all())
+        self.assertEqual(view["nominal_043"].iloc[1], "B")
+
+    def test_label_dtype_follows_model_classes(self):
+        configuration = self.supervised.get_configuration()
+        self.assertEqual(dict(prediction_columns(configuration))["prediction_label"], np.int64)
+
+        model = Pipeline([("trained_model", DummyClassifier().fit([[0], [1]], ["attack", "normal"]))])
+        with patch.object(type(configuration), 'model', new_callable=PropertyMock, return_value=model):
+            self.assertEqual(dict(prediction_columns(configuration))["prediction_label"], object)
+            frame = ExpressModelFeatureFrame([configuration], capacity=2)
+        frame.fill(self.origin_data)
+        frame.put_predictions(configuration, pd.DataFrame({"prediction_label": ["attack", "normal", "attack"],
+                                                           "prediction_score": [0.9, 0.8, 0.7]}))
+        self.assertEqual(list(frame.result("TEST_SL_prediction_label")), ["attack", "normal", "attack"])
+
+
+if __name__ == "__main__":
+    unittest.main()
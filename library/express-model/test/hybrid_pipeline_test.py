@@ -0,0 +1,64 @@
+from express_model.express_model_cache import ExpressModelCache
+from express_model.express_model_exception import ExpressModelException
+from express_model.express_model_hybrid_pipeline import ExpressModelHybridPipeline
+from model_test_support import RESOURCES
+import numpy as np
+import os
+import pandas as pd
+import unittest
+import yaml
+
+
+class TestHybridPipeline(unittest.TestCase):
+    def setUp(self):
+        ExpressModelCache.clear()
+        with open(os.path.join(RESOURCES, "model_mapping.yaml"), "r") as file:
+            self.model_mapping = yaml.safe_load(file)
+        for config in self.model_mapping["hybrid"]:
+            config["dir"] = os.path.join(RESOURCES, "models")
+        self.origin_data = pd.DataFrame({
+            'cont_001': [0.1, 0.2, None, 4.0],
+            'cont_002': [0.3, 0.4, 0.5, 9.0],
+            'nominal_043': ['A', 'B', None, 'A'],
+            'nominal_098': ['X', 'Y', 'Z', 'X'],
+            'nominal_099': ['A', 'B', None, 'B']
+        })
+
+    def expected(self, pipeline: ExpressModelHybridPipeline) -> pd.DataFrame:
+        unsupervised = pipeline.get_models("unsupervised")[0]
+        supervised = pipeline.get_models("supervised")[0]
+        anomaly = unsupervised.predict_fast(self.origin_data)
+        prediction = supervised.predict_fast(self.origin_data.assign(Anomaly_Score=anomaly["Anomaly_Score"]))
+        return pd.DataFrame({
+            "ul_1_Anomaly": anomaly["Anomaly"],
+            "ul_1_Anomaly_Score": anomaly["Anomaly_Score"],
+            "sl_1_prediction_label": prediction["prediction_label"],
+            "sl_1_prediction_score": prediction["prediction_score"],
+        })
+
+    def assert_same(self, executor: str):
+        pipeline = ExpressModelHybridPipeline.from_mapping(self.model_mapping, executor=executor)
+        try:
+            result = pipeline.predict(self.origin_data)
+            expected = self.expected(pipeline)
+            for column in expected.columns:
+                np.testing.assert_array_equal(result[column].to_numpy(), expected[column].to_numpy())
+            latency = pipeline.get_last_latency_ms()
+            self.assertEqual(set(latency), {"unsupervised", "supervised", "total"})
+            self.assertGreaterEqual(latency["total"], latency["unsupervised"] + latency["supervised"])
+        finally:
+            pipeline.close()
+
+    def test_thread_executor(self):
+        self.assert_same("thread")
+
+    def test_process_executor(self):
+        self.assert_same("process")
+
+    def test_rejects_missing_section(self):
+        with self.assertRaises(ExpressModelException):
+            ExpressModelHybridPipeline.from_mapping(self.model_mapping, section="unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
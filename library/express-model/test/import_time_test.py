@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import unittest
+
+# configuration 파싱/검증만 하는 CLI 가 감당할 수 있는 import 시간 (microseconds)
+IMPORT_BUDGET_US = 300_000
+LIGHT_MODULES = [
+    "express_model.express_model_types",
+    "express_model.express_model_configuration",
+    "express_model.express_model_manifest",
+    "express_model.express_model_metadata",
+]
+HEAVY_MODULES = ["pycaret", "sklearn", "pandas", "numpy", "catboost", "pyod"]
+
+
+class TestImportTime(unittest.TestCase):
+    def run_importtime(self):
+        script = (
+            "import sys\n"
+            f"import {', '.join(LIGHT_MODULES)}\n"
+            f"print(sorted(name for name in {HEAVY_MODULES!r} if name in sys.modules))\n"
+        )
+        return subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                              capture_output=True, text=True, check=True)
+
+    def test_heavy_modules_are_not_imported(self):
+        output = self.run_importtime()
+        self.assertEqual(output.stdout.strip(), "[]")
+
+    def test_import_time_budget(self):
+        output = self.run_importtime()
+        cumulative = {}
+        for line in output.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, total, name = line[len("import time:"):].split("|")
+            if total.strip().isdigit():
+                cumulative[name.strip()] = int(total)
+        total = sum(cumulative.get(module, 0) for module in LIGHT_MODULES)
+        self.assertLess(total, IMPORT_BUDGET_US, f"express_model import took {total} us")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+from express_model.express_model_cache import ExpressModelCache
+from express_model.express_model_lean import ExpressModelLeanRuntime, export_lean_models
+from model_test_support import RESOURCES, build_metadata
+import numpy as np
+import os
+import pandas as pd
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+
+class TestLeanModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        ExpressModelCache.clear()
+        cls.temp_dir = tempfile.mkdtemp()
+        for name in ("TEST_SL.pkl", "TEST_UL.pkl"):
+            shutil.copy(os.path.join(RESOURCES, "models", name), cls.temp_dir)
+        cls.written = export_lean_models(cls.temp_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
+
+    def build_data(self) -> pd.DataFrame:
+        random = np.random.default_rng(3)
+        # 일부 feature 는 누락, 범주형에는 학습에 없던 값과 None 을 섞음
+        data = {f"cont_{i:03d}": random.normal(size=64) * 100 for i in range(1, 20)}
+        data["cont_002"][random.random(64) < 0.2] = np.nan
+        data["nominal_043"] = random.choice(["a", "b", "c", "unknown", None], size=64)
+        data["nominal_098"] = random.choice(["h", "i", "j", None], size=64)
+        data["Anomaly_Score"] = random.random(64) * 20
+        return pd.DataFrame(data)
+
+    def assert_same_as_predict_fast(self, model_type: str, prefix: str):
+        metadata = build_metadata(model_type, prefix, self.temp_dir)
+        runtime = ExpressModelLeanRuntime.load(os.path.join(self.temp_dir, f"{prefix}.lean.joblib"))
+        self.assertEqual(runtime.feature_list, metadata.get_configuration().feature_list)
+        data = self.build_data()
+        pd.testing.assert_frame_equal(runtime.predict(data), metadata.predict_fast(data))
+
+    def test_supervised(self):
+        self.assert_same_as_predict_fast("supervised", "TEST_SL")
+
+    def test_unsupervised(self):
+        self.assert_same_as_predict_fast("unsupervised", "TEST_UL")
+
+    def test_runtime_does_not_import_pycaret(self):
+        script = (
+            "import sys\n"
+            "from express_model.express_model_lean import ExpressModelLeanRuntime\n"
+            f"runtime = ExpressModelLeanRuntime.load({self.written[0]!r})\n"
+            "runtime.predict([{'cont_001': 1.0, 'nominal_043': 'a'}])\n"
+            "print([name for name in sys.modules if name.split('.')[0] in ('pycaret', 'category_encoders')])\n"
+        )
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip().splitlines()[-1], "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
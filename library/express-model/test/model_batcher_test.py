@@ -0,0 +1,67 @@
+from express_model.express_model_batcher import ExpressModelBatcher
+from express_model.express_model_cache import ExpressModelCache
+from express_model.express_model_exception import ExpressModelException
+from express_model.express_model_metadata import ExpressModelMetadata
+from concurrent.futures import ThreadPoolExecutor
+from model_test_support import RESOURCES, patch_logging
+import os
+import pandas as pd
+import unittest
+
+
+class TestModelBatcher(unittest.TestCase):
+    def setUp(self):
+        patch_logging(self)
+        ExpressModelCache.clear()
+        self.metadata = ExpressModelMetadata()
+        self.metadata.build(config={"id": "sl_1", "dir": os.path.join(RESOURCES, "models"),
+                                    "model_type": "supervised", "prefix": "TEST_SL"})
+        self.records = [{"cont_001": i / 10, "cont_002": (i % 7) / 7, "nominal_043": "AB"[i % 2], "Anomaly_Score": i}
+                        for i in range(40)]
+
+    def test_batched_results_match_row_by_row(self):
+        batcher = ExpressModelBatcher(self.metadata, max_rows=16, max_wait_ms=50)
+        thread = batcher.start_with_sub_handler_role()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = list(executor.map(batcher.submit, self.records))
+        results = [future.result(timeout=30) for future in futures]
+        batcher.shutdown()
+        thread.join(5)
+
+        experiment = self.metadata.create_experiment()
+        model = self.metadata.load_model(experiment)
+        feature_list = self.metadata.get_configuration().feature_list
+        for record, result in zip(self.records, results):
+            expected = experiment.predict_model(estimator=model, data=pd.DataFrame([record], columns=feature_list))
+            self.assertEqual(result["prediction_label"], expected["prediction_label"].iloc[0])
+            self.assertEqual(result["prediction_score"], expected["prediction_score"].iloc[0])
+        self.assertEqual(batcher.get_row_count(), len(self.records))
+        self.assertLess(batcher.get_batch_count(), len(self.records))
+
+    def test_shutdown_drains_queue_and_rejects_new_records(self):
+        batcher = ExpressModelBatcher(self.metadata, max_rows=8, max_wait_ms=1)
+        futures = [batcher.submit(record) for record in self.records[:10]]
+        batcher.shutdown()
+        thread = batcher.start_with_sub_handler_role()
+        thread.join(30)
+        self.assertTrue(all(future.done() and future.exception() is None for future in futures))
+        self.assertEqual(batcher.get_batch_count(), 2)
+        with self.assertRaises(ExpressModelException):
+            batcher.submit(self.records[0])
+
+    def test_leftover_records_fail_when_thread_stops(self):
+        batcher = ExpressModelBatcher(self.metadata)
+        futures = [batcher.submit(record) for record in self.records[:3]]
+        futures[0].cancel()
+        # _execute 가 예외로 끝나 queue 를 비우지 못한 경우
+        batcher._finalize()
+        self.assertTrue(futures[0].cancelled())
+        for future in futures[1:]:
+            with self.assertRaises(ExpressModelException):
+                future.result(timeout=1)
+        with self.assertRaises(ExpressModelException):
+            batcher.submit(self.records[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+from express_model.express_model_cache import ExpressModelCache
+from express_model.express_model_exception import ExpressModelException
+from express_model.express_model_metadata import ExpressModelMetadata
+from express_model.express_model_types import ExpressModelTypes
+from model_test_support import RESOURCES
+from unittest.mock import patch
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import yaml
+
+
+class TestModelCache(unittest.TestCase):
+    def setUp(self):
+        ExpressModelCache.clear()
+        with open(os.path.join(RESOURCES, "model_mapping.yaml"), "r") as file:
+            self.model_mapping = yaml.safe_load(file)
+
+    def build_metadata(self, section: str, index: int = 0) -> ExpressModelMetadata:
+        config = dict(self.model_mapping[section][index], dir=os.path.join(RESOURCES, "models"))
+        metadata = ExpressModelMetadata()
+        metadata.build(config=config)
+        return metadata
+
+    def test_build_and_inference_share_one_load(self):
+        with patch.object(ExpressModelCache, '_load', wraps=ExpressModelCache._load) as load:
+            supervised = self.build_metadata("supervised")
+            model = supervised.load_model(supervised.create_experiment())
+            hybrid = self.build_metadata("hybrid", index=1)
+            self.assertIs(hybrid.load_model(hybrid.create_experiment()), model)
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(ExpressModelCache.size(), 1)
+
+    def test_request_path_does_not_stat_file(self):
+        metadata = self.build_metadata("unsupervised")
+        model = metadata.load_model(metadata.create_experiment())
+        with patch('os.path.getmtime', side_effect=AssertionError("stat on request path")):
+            self.assertIs(metadata.load_model(metadata.create_experiment()), model)
+
+    def test_rewritten_file_is_not_loaded_under_old_key(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            model_path = os.path.join(temp_dir, "TEST_UL.pkl")
+            shutil.copy(os.path.join(RESOURCES, "models", "TEST_UL.pkl"), model_path)
+            key = ExpressModelCache.key(model_path, ExpressModelTypes.UNSUPERVISED)
+            first = ExpressModelCache.get(key)
+            os.utime(model_path, (time.time() + 10, time.time() + 10))
+            self.assertIs(ExpressModelCache.get(key), first)
+
+            ExpressModelCache.discard(key)
+            with self.assertRaises(ExpressModelException):
+                ExpressModelCache.get(key)
+            new_key = ExpressModelCache.key(model_path, ExpressModelTypes.UNSUPERVISED)
+            self.assertIsNot(ExpressModelCache.get(new_key), first)
+            self.assertEqual(ExpressModelCache.size(), 1)
+
+    def test_failed_load_releases_loading_lock(self):
+        key = ExpressModelCache.key(os.path.join(RESOURCES, "models", "TEST_UL.pkl"), ExpressModelTypes.UNSUPERVISED)
+        with patch.object(ExpressModelCache, '_load', side_effect=ExpressModelException("broken")):
+            with self.assertRaises(ExpressModelException):
+                ExpressModelCache.get(key)
+        self.assertEqual(ExpressModelCache._loading_locks, {})
+        ExpressModelCache._loading_locks[key] = None
+        ExpressModelCache.clear()
+        self.assertEqual(ExpressModelCache._loading_locks, {})
+
+    def test_lru_eviction_by_footprint(self):
+        for name, model_types in (("TEST_UL.pkl", ExpressModelTypes.UNSUPERVISED),
+                                  ("TEST_SL.pkl", ExpressModelTypes.SUPERVISED)):
+            ExpressModelCache.get(ExpressModelCache.key(os.path.join(RESOURCES, "models", name), model_types))
+        ExpressModelCache.configure(max_bytes=os.path.getsize(os.path.join(RESOURCES, "models", "TEST_SL.pkl")))
+        self.assertEqual(ExpressModelCache.size(), 1)
+        ExpressModelCache.configure(max_bytes=2 * 1024 * 1024 * 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+from express_model.express_model_cache import ExpressModelCache
+from express_model.express_model_configuration import ExpressModelConfiguration
+from express_model.express_model_manifest import ExpressModelManifest, generate_manifests
+from express_model.express_model_types import ExpressModelTypes
+from model_test_support import RESOURCES
+from unittest.mock import patch
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+
+class TestModelManifest(unittest.TestCase):
+    def setUp(self):
+        ExpressModelCache.clear()
+        self.temp_dir = tempfile.mkdtemp()
+        for name in ("TEST_SL.pkl", "TEST_UL.pkl"):
+            shutil.copy(os.path.join(RESOURCES, "models", name), self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def build(self, model_types: ExpressModelTypes, prefix: str) -> ExpressModelConfiguration:
+        return ExpressModelConfiguration.Builder(model_types).id("test").dir(self.temp_dir).prefix(prefix).build()
+
+    def test_generate_detects_model_type(self):
+        written = generate_manifests(self.temp_dir)
+        self.assertEqual(len(written), 2)
+        with open(ExpressModelManifest.manifest_path(os.path.join(self.temp_dir, "TEST_SL.pkl"))) as file:
+            data = json.load(file)
+        self.assertEqual(data["model_type"], "SUPERVISED")
+        self.assertEqual(data["dtypes"]["nominal_043"], "category")
+        self.assertEqual(data["dtypes"]["Anomaly_Score"], "numeric")
+        self.assertEqual(ExpressModelManifest.read(os.path.join(self.temp_dir, "TEST_UL.pkl")).model_type,
+                         ExpressModelTypes.UNSUPERVISED)
+
+    def test_manifest_matches_unpickled_feature_list(self):
+        unpickled = self.build(ExpressModelTypes.SUPERVISED, "TEST_SL").feature_list
+        generate_manifests(self.temp_dir, prefix="TEST_SL")
+        ExpressModelCache.clear()
+        with patch.object(ExpressModelCache, 'get') as get:
+            configuration = self.build(ExpressModelTypes.SUPERVISED, "TEST_SL")
+        get.assert_not_called()
+        self.assertEqual(configuration.feature_list, unpickled)
+
+    def test_stale_manifest_falls_back_to_unpickling(self):
+        model_path = os.path.join(self.temp_dir, "TEST_UL.pkl")
+        generate_manifests(self.temp_dir, prefix="TEST_UL")
+        with open(model_path, "ab") as file:
+            file.write(b"\0")
+        os.utime(model_path, (time.time() + 10, time.time() + 10))
+        self.assertIsNone(ExpressModelManifest.read(model_path))
+
+    def test_touched_model_with_same_content_keeps_manifest(self):
+        model_path = os.path.join(self.temp_dir, "TEST_UL.pkl")
+        generate_manifests(self.temp_dir, prefix="TEST_UL")
+        os.utime(model_path, (time.time() + 10, time.time() + 10))
+        self.assertIsNotNone(ExpressModelManifest.read(model_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+from express_model.express_model_cache import ExpressModelCache
+from express_model.express_model_metadata import ExpressModelMetadata
+from model_test_support import build_metadata
+import numpy as np
+import pandas as pd
+import unittest
+
+
+class TestPredictFast(unittest.TestCase):
+    def setUp(self):
+        ExpressModelCache.clear()
+
+    def build_data(self, feature_list) -> pd.DataFrame:
+        random = np.random.default_rng(7)
+        data = {}
+        for feature in feature_list:
+            if feature.startswith("nominal"):
+                data[feature] = random.choice(["A", "B", "X", None], size=64)
+            else:
+                values = random.normal(size=64) * 100
+                values[random.random(64) < 0.1] = np.nan
+                data[feature] = values
+        return pd.DataFrame(data)
+
+    def assert_same_as_predict_model(self, metadata: ExpressModelMetadata, columns):
+        experiment = metadata.create_experiment()
+        model = metadata.load_model(experiment)
+        feature_list = metadata.get_configuration().feature_list
+        data = self.build_data(feature_list)
+
+        expected = experiment.predict_model(estimator=model, data=data)[columns]
+        pd.testing.assert_frame_equal(metadata.predict_fast(data), expected)
+        pd.testing.assert_frame_equal(metadata.predict_fast(data.to_dict("records")), expected)
+        pd.testing.assert_frame_equal(metadata.predict_fast(data[feature_list].to_numpy(dtype=object)), expected)
+
+    def test_supervised(self):
+        self.assert_same_as_predict_model(build_metadata("supervised", "TEST_SL"),
+                                          ["prediction_label", "prediction_score"])
+
+    def test_unsupervised(self):
+        self.assert_same_as_predict_model(build_metadata("unsupervised", "TEST_UL"),
+                                          ["Anomaly", "Anomaly_Score"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+from express_model.express_model_cache import ExpressModelCache
+from express_model.express_model_metadata import ExpressModelMetadata
+from express_model.express_model_reload_watcher import ExpressModelReloadWatcher
+from model_test_support import RESOURCES, patch_logging
+from unittest.mock import patch
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+
+class TestModelReload(unittest.TestCase):
+    def setUp(self):
+        patch_logging(self)
+        ExpressModelCache.clear()
+        self.temp_dir = tempfile.mkdtemp()
+        self.deploy("TEST_UL_1.pkl", time.time() - 60)
+        self.metadata = ExpressModelMetadata()
+        self.metadata.build(config={"id": "ul_1", "dir": self.temp_dir, "model_type": "unsupervised", "prefix": "TEST_UL"})
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def deploy(self, name: str, mtime: float) -> str:
+        model_path = os.path.join(self.temp_dir, name)
+        shutil.copy(os.path.join(RESOURCES, "models", "TEST_UL.pkl"), model_path)
+        os.utime(model_path, (mtime, mtime))
+        return model_path
+
+    def test_newer_file_is_swapped_in(self):
+        reloads = []
+        watcher = ExpressModelReloadWatcher(self.metadata, settle_ms=0, on_reload=lambda *args: reloads.append(args))
+        old_model = self.metadata.load_model(self.metadata.create_experiment())
+        self.assertFalse(watcher.check())
+
+        new_path = self.deploy("TEST_UL_2.pkl", time.time() - 30)
+        self.assertTrue(watcher.check())
+        self.assertEqual(self.metadata.get_configuration().model_path, new_path)
+        self.assertIsNot(self.metadata.load_model(self.metadata.create_experiment()), old_model)
+        self.assertEqual(len(reloads), 1)
+        self.assertFalse(watcher.check())
+
+    def test_in_flight_caller_keeps_old_model(self):
+        watcher = ExpressModelReloadWatcher(self.metadata, settle_ms=0)
+        # swap 직전에 configuration 을 읽은 요청
+        in_flight = self.metadata.get_configuration()
+        old_model = in_flight.model
+        self.deploy("TEST_UL_2.pkl", time.time() - 30)
+        self.assertTrue(watcher.check())
+        ExpressModelCache.clear()
+        with patch.object(ExpressModelCache, '_load', side_effect=AssertionError("cold load on request path")):
+            self.assertIs(in_flight.model, old_model)
+            self.assertIsNot(self.metadata.load_model(self.metadata.create_experiment()), old_model)
+
+    def test_in_place_rewrite_keeps_serving_old_model(self):
+        watcher = ExpressModelReloadWatcher(self.metadata, settle_ms=0)
+        in_flight = self.metadata.get_configuration()
+        old_model = in_flight.model
+        self.deploy("TEST_UL_1.pkl", time.time() - 30)
+        self.assertTrue(watcher.check())
+        self.assertIs(in_flight.model, old_model)
+
+    def test_unsettled_file_is_skipped(self):
+        watcher = ExpressModelReloadWatcher(self.metadata, settle_ms=60000)
+        self.deploy("TEST_UL_2.pkl", time.time())
+        self.assertFalse(watcher.check())
+        self.assertEqual(watcher.get_reload_count(), 0)
+
+    def test_rewritten_file_is_reloaded(self):
+        watcher = ExpressModelReloadWatcher(self.metadata, settle_ms=0)
+        self.deploy("TEST_UL_1.pkl", time.time() - 30)
+        self.assertTrue(watcher.check())
+
+    def test_broken_file_keeps_current_model(self):
+        watcher = ExpressModelReloadWatcher(self.metadata, interval_ms=10, settle_ms=0)
+        current = self.metadata.get_configuration()
+        with open(os.path.join(self.temp_dir, "TEST_UL_2.pkl"), "wb") as file:
+            file.write(b"not a model")
+        thread = watcher.start_with_sub_handler_role()
+        time.sleep(0.2)
+        watcher.shutdown()
+        thread.join(5)
+        self.assertIs(self.metadata.get_configuration(), current)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+from express_model.express_model_metadata import ExpressModelMetadata
+from typing import Optional
+from unittest.mock import patch
+import os
+import unittest
+
+RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources")
+MODELS_DIR = os.path.join(RESOURCES, "models")
+LOGGING_CONFIG = os.path.join(RESOURCES, "logging.yaml")
+
+
+def build_metadata(model_type: str, prefix: str, model_dir: Optional[str] = None) -> ExpressModelMetadata:
+    """
+    Metadata of the latest `prefix` model in model_dir (resources/models by default), with prefix as its id.
+    """
+    metadata = ExpressModelMetadata()
+    metadata.build(config={"id": prefix, "dir": model_dir or MODELS_DIR, "model_type": model_type, "prefix": prefix})
+    return metadata
+
+
+def patch_logging(test: unittest.TestCase) -> None:
+    """
+    Points ExpressLoggerFactory at resources/logging.yaml until the test finishes.
+    """
+    logging_patch = patch('express_utils.express_logger_factory.possible_paths', [LOGGING_CONFIG])
+    logging_patch.start()
+    test.addCleanup(logging_patch.stop)
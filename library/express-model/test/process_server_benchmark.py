@@ -0,0 +1,40 @@
+from express_model.express_model_metadata import ExpressModelMetadata
+from express_model.express_model_process_server import ExpressModelProcessServer
+from concurrent.futures import ThreadPoolExecutor
+from model_test_support import RESOURCES
+import multiprocessing
+import numpy as np
+import os
+import pandas as pd
+import time
+
+
+def build_data(rows: int) -> pd.DataFrame:
+    random = np.random.default_rng(0)
+    data = {f"cont_{i:03d}": random.normal(size=rows) for i in range(1, 28)}
+    data.update({name: random.choice(["A", "B", None], size=rows) for name in ("nominal_043", "nominal_098", "nominal_099")})
+    data["Anomaly_Score"] = random.random(rows)
+    return pd.DataFrame(data)
+
+
+if __name__ == "__main__":
+    metadata = ExpressModelMetadata()
+    metadata.build(config={"id": "sl_1", "dir": os.path.join(RESOURCES, "models"),
+                           "model_type": "supervised", "prefix": "TEST_SL"})
+    batches = [build_data(64) for _ in range(200)]
+
+    start = time.perf_counter()
+    for batch in batches[:50]:
+        metadata.predict_fast(batch)
+    print(f"in-process      : {50 * 64 / (time.perf_counter() - start):10.0f} rows/s")
+
+    for workers in sorted({1, 2, multiprocessing.cpu_count()}):
+        server = ExpressModelProcessServer([metadata], workers=workers, max_rows=64)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                start = time.perf_counter()
+                list(executor.map(lambda batch: server.predict("sl_1", batch), batches))
+                elapsed = time.perf_counter() - start
+            print(f"{workers:2d} worker(s)    : {len(batches) * 64 / elapsed:10.0f} rows/s")
+        finally:
+            server.close()
@@ -0,0 +1,82 @@
+from express_model.express_model_cache import ExpressModelCache
+from express_model.express_model_exception import ExpressModelException
+from express_model.express_model_process_server import ExpressModelProcessServer
+from concurrent.futures import ThreadPoolExecutor
+from model_test_support import build_metadata
+import numpy as np
+import os
+import pandas as pd
+import signal
+import unittest
+
+
+class TestProcessServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        ExpressModelCache.clear()
+        cls.supervised = build_metadata("supervised", "TEST_SL")
+        cls.unsupervised = build_metadata("unsupervised", "TEST_UL")
+        cls.server = ExpressModelProcessServer([cls.supervised, cls.unsupervised], workers=2, max_rows=16)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+
+    def build_data(self, rows: int, seed: int) -> pd.DataFrame:
+        random = np.random.default_rng(seed)
+        data = {f"cont_{i:03d}": random.normal(size=rows) * 100 for i in range(1, 28)}
+        data["cont_005"][random.random(rows) < 0.2] = np.nan
+        data.update({name: random.choice(["A", "B", "X", None], size=rows)
+                     for name in ("nominal_043", "nominal_098", "nominal_099")})
+        data["Anomaly_Score"] = random.random(rows) * 20
+        return pd.DataFrame(data)
+
+    def test_matches_predict_fast(self):
+        # max_rows 보다 큰 입력은 나눠서 처리
+        data = self.build_data(40, 1)
+        for metadata in (self.supervised, self.unsupervised):
+            expected = metadata.predict_fast(data)
+            result = self.server.predict(metadata.get_configuration().id, data)
+            pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_concurrent_callers(self):
+        batches = [self.build_data(8, seed) for seed in range(12)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda data: self.server.predict("TEST_SL", data), batches))
+        for data, result in zip(batches, results):
+            pd.testing.assert_frame_equal(result, self.supervised.predict_fast(data), check_dtype=False)
+
+    def test_unknown_model(self):
+        with self.assertRaises(ExpressModelException):
+            self.server.predict("unknown", self.build_data(1, 0))
+
+    def test_dead_worker_is_respawned_and_string_labels(self):
+        metadata = build_metadata("supervised", "TEST_SL")
+        predict_fast = metadata.predict_fast
+        # class label 이 문자열인 모델
+        metadata.predict_fast = lambda frame: predict_fast(frame).assign(
+            prediction_label=lambda df: df["prediction_label"].map({0: "normal", 1: "attack"}))
+        server = ExpressModelProcessServer([metadata], workers=1, max_rows=16)
+        try:
+            data = self.build_data(20, 3)
+            pd.testing.assert_frame_equal(server.predict("TEST_SL", data), metadata.predict_fast(data),
+                                          check_dtype=False)
+
+            worker = server._workers[0]
+            os.kill(worker.process.pid, signal.SIGKILL)
+            worker.process.join(5)
+            with self.assertRaises(ExpressModelException):
+                server.predict("TEST_SL", data)
+            result = server.predict("TEST_SL", data)
+            self.assertEqual(set(result["prediction_label"]) - {"normal", "attack"}, set())
+            self.assertTrue(server._workers[0].process.is_alive())
+            # 교체 worker 는 server 가 아닌 spawner process 에서 fork 됨
+            with open(f"/proc/{server._workers[0].process.pid}/status") as f:
+                parent_pid = next(int(line.split()[1]) for line in f if line.startswith("PPid:"))
+            self.assertEqual(parent_pid, server._spawner.pid)
+        finally:
+            server.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
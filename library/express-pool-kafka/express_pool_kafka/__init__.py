@@ -1,17 +1,42 @@
 from .express_kafka_configuration import ExpressKafkaConfiguration
+from .express_kafka_consumer_metrics import ExpressKafkaConsumerMetrics, ExpressKafkaHistogram
+from .express_kafka_consumer_runner import ExpressKafkaConsumerRunner
+from .express_kafka_dead_letter import ExpressKafkaDeadLetter
 from .express_kafka_exception import ExpressKafkaException
+from .express_kafka_lag_sampler import ExpressKafkaLagSampler
 from .express_kafka_metadata import ExpressKafkaMetadata
+from .express_kafka_overflow_policy import ExpressKafkaOverflowPolicy
 from .express_kafka_produce_record import ExpressKafkaProduceRecord
+from .express_kafka_producer_buffer import ExpressKafkaProducerBuffer
+from .express_kafka_producer_pool import ExpressKafkaProducerPool
+from .express_kafka_profiles import ExpressKafkaProfiles
+from .express_kafka_retry_queue import ExpressKafkaRetryQueue
+from .express_kafka_send_result import ExpressKafkaSendResult
+from .express_kafka_serializers import ExpressKafkaSerializers
 from .express_kafka_types import ExpressKafkaTypes
 from .express_kafka_utils import ExpressKafkaUtils
+from .express_kafka_worker_types import ExpressKafkaWorkerTypes
 from .kafka_producer_wrapper import KafkaProducerWrapper
 
 __all__ = [
     ExpressKafkaConfiguration,
+    ExpressKafkaConsumerMetrics,
+    ExpressKafkaConsumerRunner,
+    ExpressKafkaDeadLetter,
     ExpressKafkaException,
+    ExpressKafkaHistogram,
+    ExpressKafkaLagSampler,
     ExpressKafkaMetadata,
+    ExpressKafkaOverflowPolicy,
     ExpressKafkaProduceRecord,
+    ExpressKafkaProducerBuffer,
+    ExpressKafkaProducerPool,
+    ExpressKafkaProfiles,
+    ExpressKafkaRetryQueue,
+    ExpressKafkaSendResult,
+    ExpressKafkaSerializers,
     ExpressKafkaTypes,
     ExpressKafkaUtils,
+    ExpressKafkaWorkerTypes,
     KafkaProducerWrapper,
 ]
@@ -1,4 +1,5 @@
 from .express_kafka_produce_record import ExpressKafkaProduceRecord
+from .express_kafka_retry_queue import ExpressKafkaRetryQueue
 from express_utils.express_logger_factory import ExpressLoggerFactory
 from typing import Optional, Callable, Any
 import logging
@@ -8,21 +9,34 @@ class ExpressKafkaCallback:
     def __init__(self,
                  kafka_record: ExpressKafkaProduceRecord,
                  # on_success: Optional[Callable[[Any], None]] = None,
-                 on_error: Optional[Callable[[Exception], None]] = None):
+                 on_error: Optional[Callable[[Exception], None]] = None,
+                 retry_queue: Optional[ExpressKafkaRetryQueue] = None):
         self._logger = ExpressLoggerFactory.get_logger(self.__class__.__name__)
         self._kafka_record = kafka_record
-        self._on_error = on_error if on_error is not None else self._default_on_error
+        self._handle_error = on_error if on_error is not None else self._default_on_error
+        self._retry_queue = retry_queue
 
     def _on_success_callback(self, record_metadata):
-        if self._logger.isEnabledFor(logging.TRACE):
+        if self._logger.trace_enabled:
             self._logger.trace("Send Success:")
-            self._logger.trace(f"Topic: {record_metadata.topic}")
-            self._logger.trace(f"Partition: {record_metadata.partition}")
-            self._logger.trace(f"Offset: {record_metadata.offset}")
+            self._logger.trace("Topic: %s", record_metadata.topic)
+            self._logger.trace("Partition: %s", record_metadata.partition)
+            self._logger.trace("Offset: %s", record_metadata.offset)
         if self.on_success:
             self.on_success(record_metadata)
 
-    def _default_on_error(self, exception: Exception):
+    def on_error(self, exception: Exception):
+        """
+        Error path of the record: counts the failure, calls on_error (or logs) and offers it to the retry queue.
+        Registered as the errback of the send future; also called by ExpressKafkaProducerBuffer for records
+        that never reached the producer.
+        """
+        # on_error 를 지정해도 failure count 와 retry 는 항상 처리
         self._kafka_record.fail()
+        self._handle_error(exception)
+        if self._retry_queue is not None:
+            self._retry_queue.offer(self._kafka_record, exception)
+
+    def _default_on_error(self, exception: Exception):
         if self._logger.isEnabledFor(logging.ERROR):
-            self._logger.error(f'Kafka sending exception in callback: {exception} -> {self._kafka_record.data()}')
+            self._logger.error('Kafka sending exception in callback: %s -> %s', exception, self._kafka_record.data())
@@ -1,10 +1,11 @@
 from .express_kafka_exception import ExpressKafkaException
+from .express_kafka_profiles import ExpressKafkaProfiles
+from .express_kafka_serializers import ExpressKafkaSerializers
 from .express_kafka_types import ExpressKafkaTypes
 from .define.express_kafka_meta_configuration import ExpressKafkaMetaConfiguration
 from .define.express_kafka_meta_builder import ExpressKafkaMetaBuilder
 from express_utils.express_yml_converter import ExpressYmlConverter
 from typing import Dict, Any, List
-import json
 
 
 class ExpressKafkaConfiguration(ExpressKafkaMetaConfiguration):
@@ -13,11 +14,13 @@ class ExpressKafkaConfiguration(ExpressKafkaMetaConfiguration):
                  kafka_types: ExpressKafkaTypes,
                  _id: str,
                  bootstrap_servers: str,
-                 properties: Dict[str, Any]):
+                 properties: Dict[str, Any],
+                 flush_properties: Dict[str, int] = None):
         self.kafka_types = kafka_types
         self._id = _id
         self.bootstrap_servers = bootstrap_servers
         self.properties = properties
+        self.flush_properties = flush_properties if flush_properties is not None else {}
 
     def kafka_types(self) -> ExpressKafkaTypes:
         return self.kafka_types
@@ -34,15 +37,20 @@ class ExpressKafkaConfiguration(ExpressKafkaMetaConfiguration):
     def get_properties(self) -> Dict[str, Any]:
         return self.properties
 
+    def get_flush_properties(self) -> Dict[str, int]:
+        return self.flush_properties
+
     class Builder(ExpressKafkaMetaBuilder):
         def __init__(self, kafka_types: ExpressKafkaTypes):
             self.kafka_types = kafka_types
             self._id = None
             self._bootstrap_servers = None
             self._properties = None
+            self._flush_properties = {}
+            self._profile = None
 
         def id(self, _id: str) -> 'ExpressKafkaConfiguration.Builder':
-            self._id = id
+            self._id = _id
             return self
 
         def bootstrap_servers(self, bootstrap_servers: str) -> 'ExpressKafkaConfiguration.Builder':
@@ -53,19 +61,23 @@ class ExpressKafkaConfiguration(ExpressKafkaMetaConfiguration):
             self._properties = self.init_properties(properties)
             return self
 
+        def profile(self, profile: str) -> 'ExpressKafkaConfiguration.Builder':
+            self._profile = profile
+            return self
+
+        def flush_properties(self, flush_properties: Dict[str, Any]) -> 'ExpressKafkaConfiguration.Builder':
+            temp_properties = ExpressYmlConverter.dict_keys_to_snake_case(flush_properties or {})
+            unknown_keys = set(temp_properties) - {'max_records', 'max_bytes', 'interval_ms'}
+            if unknown_keys:
+                raise ExpressKafkaException(f"Unknown flush properties: {sorted(unknown_keys)}")
+            self._flush_properties = {k: int(v) for k, v in temp_properties.items()}
+            return self
+
         def get_deserializer(self, deserializer_type):
-            if deserializer_type == "json":
-                return lambda x: json.loads(x.decode('utf-8'))
-            elif deserializer_type == "string":
-                return lambda x: x.decode('utf-8')
-            return None
+            return ExpressKafkaSerializers.get_deserializer(deserializer_type)
 
         def get_serializer(self, serializer_type):
-            if serializer_type == "json":
-                return lambda x: json.dumps(x).encode('utf-8')
-            elif serializer_type == "string":
-                return lambda x: x.encode('utf-8')
-            return None
+            return ExpressKafkaSerializers.get_serializer(serializer_type)
 
         def convert_config(self, kafka_types: ExpressKafkaTypes, config: Dict[str, Any]):
             new_config = config.copy()
@@ -87,6 +99,7 @@ class ExpressKafkaConfiguration(ExpressKafkaMetaConfiguration):
 
         def init_properties(self, properties: Dict[str, Any]) -> Dict[str, Any]:
             temp_properties = ExpressYmlConverter.dict_keys_to_snake_case(properties)
+            temp_properties = ExpressKafkaProfiles.validate(self.kafka_types, temp_properties)
             temp_properties = self.convert_config(self.kafka_types, temp_properties)
             temp_properties['bootstrap_servers'] = self._bootstrap_servers
             return temp_properties
@@ -101,9 +114,15 @@ class ExpressKafkaConfiguration(ExpressKafkaMetaConfiguration):
             if not self._properties:
                 raise ExpressKafkaException("Properties cannot be None or empty")
 
+            properties = self._properties
+            if self._profile:
+                # 명시된 property 가 profile 설정보다 우선함
+                properties = {**ExpressKafkaProfiles.expand(self.kafka_types, self._profile), **self._properties}
+
             return ExpressKafkaConfiguration(
                 kafka_types=self.kafka_types
                 , _id=self._id
                 , bootstrap_servers=self._bootstrap_servers
-                , properties=self._properties
+                , properties=properties
+                , flush_properties=self._flush_properties
             )
@@ -0,0 +1,163 @@
+from threading import Lock
+from typing import Dict, List, Tuple, Any, Optional
+import bisect
+import time
+
+
+class ExpressKafkaHistogram:
+    DEFAULT_BOUNDS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BOUNDS_MS):
+        self._bounds = tuple(bounds)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+        if value > self._max:
+            self._max = value
+
+    def count(self) -> int:
+        return self._count
+
+    def mean(self) -> float:
+        return self._sum / self._count if self._count else 0.0
+
+    def max(self) -> float:
+        return self._max
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        :return: (upper bound, count) pairs; the last bound is inf.
+        """
+        return list(zip(self._bounds + (float('inf'),), self._counts))
+
+    def percentile(self, p: float) -> float:
+        """
+        Upper bound of the bucket holding the p-th percentile (0 < p <= 100).
+        """
+        if not self._count:
+            return 0.0
+        rank = self._count * p / 100
+        cumulative = 0
+        for bound, count in self.buckets():
+            cumulative += count
+            if cumulative >= rank:
+                return bound if bound != float('inf') else self._max
+        return self._max
+
+
+class ExpressKafkaConsumerMetrics:
+    """
+    Consumer-side lag, consume rate and poll latency.
+    Consumed offsets are recorded once per poll by the consumer thread, which also publishes the assigned
+    partitions with their committed offsets whenever the assignment changes. End offsets and the consume rate
+    are refreshed by ExpressKafkaLagSampler, so reading lag never costs a broker round trip.
+    Lag is measured from the consumed offset, or from the committed offset for a partition not consumed yet.
+    """
+
+    def __init__(self, latency_bounds_ms: Tuple[float, ...] = ExpressKafkaHistogram.DEFAULT_BOUNDS_MS):
+        self._lock = Lock()
+        self._consumed_offsets: Dict[Any, int] = {}
+        self._end_offsets: Dict[Any, int] = {}
+        # update_assignment 이 호출되기 전에는 None. 이후에는 assignment 의 partition -> committed offset
+        self._committed_offsets: Optional[Dict[Any, Optional[int]]] = None
+        self._consumed_count = 0
+        self._poll_latency = ExpressKafkaHistogram(latency_bounds_ms)
+        self._rate_sample: Tuple[float, int] = (time.monotonic(), 0)
+        self._consume_rate = 0.0
+
+    def record_poll(self, latency_ms: float, records: Optional[Dict[Any, List[Any]]]) -> None:
+        with self._lock:
+            self._poll_latency.observe(latency_ms)
+            if not records:
+                return
+            for partition, msgs in records.items():
+                if msgs:
+                    self._consumed_offsets[partition] = msgs[-1].offset + 1
+                    self._consumed_count += len(msgs)
+
+    def update_assignment(self, committed_offsets: Dict[Any, Optional[int]]) -> None:
+        """
+        Called by the consumer thread with every assigned partition and its committed offset
+        (None when unknown). Revoked partitions are forgotten.
+        """
+        with self._lock:
+            self._committed_offsets = dict(committed_offsets)
+            for partition in self._consumed_offsets.keys() - self._committed_offsets.keys():
+                del self._consumed_offsets[partition]
+            for partition in self._end_offsets.keys() - self._committed_offsets.keys():
+                del self._end_offsets[partition]
+
+    def partitions(self) -> List[Any]:
+        with self._lock:
+            if self._committed_offsets is not None:
+                return list(self._committed_offsets.keys())
+            return list(self._consumed_offsets.keys() | self._end_offsets.keys())
+
+    def update_end_offsets(self, end_offsets: Dict[Any, int]) -> None:
+        with self._lock:
+            self._end_offsets.update(end_offsets)
+
+    def sample_rate(self) -> float:
+        now = time.monotonic()
+        with self._lock:
+            last_time, last_count = self._rate_sample
+            if now > last_time:
+                self._consume_rate = (self._consumed_count - last_count) / (now - last_time)
+            self._rate_sample = (now, self._consumed_count)
+            return self._consume_rate
+
+    def lag(self, partition) -> Optional[int]:
+        """
+        :return: None while the end offset or the consumer position of the partition is unknown.
+        """
+        with self._lock:
+            end_offset = self._end_offsets.get(partition)
+            return None if end_offset is None else self._lag(partition, end_offset)
+
+    def lags(self) -> Dict[Any, int]:
+        with self._lock:
+            lags = {partition: self._lag(partition, end_offset) for partition, end_offset in self._end_offsets.items()}
+        return {partition: lag for partition, lag in lags.items() if lag is not None}
+
+    def _lag(self, partition, end_offset: int) -> Optional[int]:
+        offset = self._consumed_offsets.get(partition)
+        if offset is None and self._committed_offsets is not None:
+            offset = self._committed_offsets.get(partition)
+        if offset is None:
+            return None
+        return max(end_offset - offset, 0)
+
+    def total_lag(self) -> int:
+        return sum(self.lags().values())
+
+    def consume_rate(self) -> float:
+        return self._consume_rate
+
+    def consumed_count(self) -> int:
+        return self._consumed_count
+
+    def poll_latency(self) -> ExpressKafkaHistogram:
+        return self._poll_latency
+
+    def snapshot(self) -> Dict[str, Any]:
+        lags = self.lags()
+        latency = self._poll_latency
+        return {
+            "total_lag": sum(lags.values()),
+            "lag": {f"{p.topic}-{p.partition}": v for p, v in lags.items()},
+            "consume_rate": self._consume_rate,
+            "consumed_count": self._consumed_count,
+            "poll_latency_ms": {
+                "count": latency.count(),
+                "mean": latency.mean(),
+                "p50": latency.percentile(50),
+                "p99": latency.percentile(99),
+                "max": latency.max(),
+            },
+        }
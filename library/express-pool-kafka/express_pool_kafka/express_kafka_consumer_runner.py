@@ -0,0 +1,199 @@
+from .express_kafka_consumer_metrics import ExpressKafkaConsumerMetrics
+from .express_kafka_dead_letter import ExpressKafkaDeadLetter
+from .express_kafka_exception import ExpressKafkaException
+from .express_kafka_produce_record import ExpressKafkaProduceRecord
+from .express_kafka_worker_types import ExpressKafkaWorkerTypes
+from express_base.express_base_thread import ExpressBaseThread
+from express_utils import ExpressExceptionUtils
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from kafka import ConsumerRebalanceListener, KafkaConsumer
+from kafka.errors import CommitFailedError
+from kafka.structs import TopicPartition
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
+import time
+
+
+class _RebalanceListener(ConsumerRebalanceListener):
+    """
+    Called by KafkaConsumer inside poll(), i.e. on the runner thread.
+    """
+
+    def __init__(self, runner: 'ExpressKafkaConsumerRunner'):
+        self._runner = runner
+
+    def on_partitions_revoked(self, revoked):
+        self._runner._forget_partitions(revoked)
+
+    def on_partitions_assigned(self, assigned):
+        pass
+
+    def on_partitions_lost(self, lost):
+        self._runner._forget_partitions(lost)
+
+
+class ExpressKafkaConsumerRunner(ExpressBaseThread):
+    """
+    Batched consumer loop.
+    Each poll returns up to max.poll.records records; every partition of the batch is handed to the worker pool
+    as one ordered task, so per-partition ordering is kept while partitions run in parallel.
+    Offsets are committed only after the whole batch is processed. A partition whose handler raised is
+    rewound to the start of its batch and paused for an exponential backoff before it is redelivered.
+    After max_attempts failures of the same batch its messages are handled one by one; a message that still
+    fails is handed to the dead letter and skipped, so one poison message cannot stall its partition.
+
+    With ExpressKafkaWorkerTypes.PROCESS the handler must be a picklable module-level function.
+    """
+
+    def __init__(self,
+                 metadata,
+                 topics: List[str],
+                 handler: Callable[[List[Any]], None],
+                 worker_types: ExpressKafkaWorkerTypes = ExpressKafkaWorkerTypes.THREAD,
+                 max_workers: Optional[int] = None,
+                 poll_timeout_ms: int = 100,
+                 metrics: Optional[ExpressKafkaConsumerMetrics] = None,
+                 max_attempts: int = 5,
+                 backoff_ms: int = 100,
+                 max_backoff_ms: int = 10000,
+                 dead_letter: Optional[ExpressKafkaDeadLetter] = None,
+                 name: str = "ExpressKafkaConsumerRunner"):
+        super().__init__(name)
+        if not topics:
+            raise ExpressKafkaException("Consumer runner topics cannot be None or empty")
+        if max_attempts <= 0:
+            raise ExpressKafkaException("Consumer runner max_attempts must be positive")
+        self._metadata = metadata
+        self._topics = topics
+        self._handler = handler
+        self._worker_types = worker_types
+        self._max_workers = max_workers
+        self._poll_timeout_ms = poll_timeout_ms
+        self._max_poll_records = 500
+        self._consumer: Optional[KafkaConsumer] = None
+        self._executor: Optional[Executor] = None
+        self._metrics = metrics
+        self._max_attempts = max_attempts
+        self._backoff_ms = backoff_ms
+        self._max_backoff_ms = max_backoff_ms
+        self._dead_letter = dead_letter
+        # partition -> (실패한 batch 의 첫 offset, 연속 실패 횟수)
+        self._attempts: Dict[TopicPartition, Tuple[int, int]] = {}
+        # backoff 중인 partition -> resume 시각
+        self._paused: Dict[TopicPartition, float] = {}
+        self._published_assignment: Set[TopicPartition] = set()
+
+    def _initialize(self):
+        super()._initialize()
+        properties = self._metadata.get_configuration().get_properties()
+        self._max_poll_records = properties.get('max_poll_records', self._max_poll_records)
+        # auto commit 을 사용하면 처리 전에 offset 이 commit 될 수 있으므로 항상 비활성화
+        self._consumer = self._metadata.create_consumer({'enable_auto_commit': False})
+        self._consumer.subscribe(topics=self._topics, listener=_RebalanceListener(self))
+        if self._worker_types == ExpressKafkaWorkerTypes.PROCESS:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix=self._name)
+
+    def _execute(self):
+        while not self._interrupted:
+            self._resume_due()
+            poll_start = time.perf_counter()
+            records = self._consumer.poll(timeout_ms=self._poll_timeout_ms, max_records=self._max_poll_records)
+            if self._metrics is not None:
+                self._metrics.record_poll((time.perf_counter() - poll_start) * 1000, records)
+                self._publish_assignment()
+            if not records:
+                continue
+            self._process_batch(records)
+
+    def _publish_assignment(self) -> None:
+        # KafkaConsumer 는 thread-safe 하지 않으므로 assignment 와 committed offset 은 poll thread 에서 조회
+        assignment = self._consumer.assignment()
+        if assignment == self._published_assignment:
+            return
+        committed_offsets = {}
+        for partition in assignment:
+            committed = self._consumer.committed(partition)
+            if committed is None:
+                # commit 이력이 없는 partition 은 auto.offset.reset 으로 정해진 현재 위치를 기준으로 함
+                committed = self._consumer.position(partition)
+            committed_offsets[partition] = committed
+        self._metrics.update_assignment(committed_offsets)
+        self._published_assignment = set(assignment)
+
+    def _process_batch(self, records) -> None:
+        futures = [(partition, msgs, self._executor.submit(self._handler, msgs))
+                   for partition, msgs in records.items()]
+        for partition, msgs, future in futures:
+            try:
+                future.result()
+                self._attempts.pop(partition, None)
+            except Exception as e:
+                self._on_failure(partition, msgs, e)
+        try:
+            self._consumer.commit()
+        except CommitFailedError as e:
+            # rebalance 로 partition 이 회수된 경우. 새 assignment 에서 마지막 commit 위치부터 다시 받음
+            self._sys_logger.warning("Consumer commit failed after rebalance, batch will be redelivered: %s", e)
+
+    def backoff(self, attempt: int) -> float:
+        return min(self._backoff_ms * (2 ** max(attempt - 1, 0)), self._max_backoff_ms)
+
+    def _on_failure(self, partition: TopicPartition, msgs: List[Any], exception: Exception) -> None:
+        offset, attempt = self._attempts.get(partition, (msgs[0].offset, 0))
+        attempt = attempt + 1 if offset == msgs[0].offset else 1
+        if attempt >= self._max_attempts:
+            self._sys_logger.error("Consumer handler failed %s times on %s at %s, isolating the batch: %s",
+                                   attempt, partition, msgs[0].offset, ExpressExceptionUtils.get_stack_trace(exception))
+            self._attempts.pop(partition, None)
+            self._isolate(msgs)
+            return
+        backoff_ms = self.backoff(attempt)
+        self._sys_logger.error("Consumer handler failed on %s, rewind to %s and retry in %sms (attempt %s/%s): %s",
+                               partition, msgs[0].offset, backoff_ms, attempt, self._max_attempts,
+                               ExpressExceptionUtils.get_stack_trace(exception))
+        self._attempts[partition] = (msgs[0].offset, attempt)
+        self._consumer.seek(partition, msgs[0].offset)
+        # poll thread 를 sleep 시키면 max.poll.interval 을 넘길 수 있으므로 partition 만 멈춤
+        self._consumer.pause(partition)
+        self._paused[partition] = time.monotonic() + backoff_ms / 1000
+
+    def _isolate(self, msgs: List[Any]) -> None:
+        for msg in msgs:
+            try:
+                self._executor.submit(self._handler, [msg]).result()
+            except Exception as e:
+                self._on_dead_letter(msg, e)
+
+    def _on_dead_letter(self, msg: Any, exception: Exception) -> None:
+        self._sys_logger.error("Skipping message %s-%s@%s: %s", msg.topic, msg.partition, msg.offset, exception)
+        if self._dead_letter is not None:
+            self._dead_letter.write(ExpressKafkaProduceRecord(msg.topic, msg.value, msg.key), exception)
+
+    def _resume_due(self) -> None:
+        if not self._paused:
+            return
+        now = time.monotonic()
+        due = [partition for partition, resume_at in self._paused.items() if resume_at <= now]
+        for partition in due:
+            del self._paused[partition]
+        # assignment 에 없는 partition 을 resume 하면 KeyError 가 발생함
+        assignment = self._consumer.assignment()
+        due = [partition for partition in due if partition in assignment]
+        if due:
+            self._consumer.resume(*due)
+
+    def _forget_partitions(self, partitions) -> None:
+        for partition in partitions:
+            self._paused.pop(partition, None)
+            self._attempts.pop(partition, None)
+
+    def _finalize(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        if self._consumer is not None:
+            self._consumer.close()
+        self._sys_logger.debug("Thread %s finalized.", self._name)
+
+    def shutdown(self) -> None:
+        self._interrupted = True
@@ -0,0 +1,72 @@
+from .express_kafka_exception import ExpressKafkaException
+from .express_kafka_produce_record import ExpressKafkaProduceRecord
+from express_utils.express_logger_factory import ExpressLoggerFactory
+from threading import Lock
+from typing import Optional
+import json
+import time
+
+
+class ExpressKafkaDeadLetter:
+    """
+    Destination for records that exhausted their retries.
+    Records are re-published to a dead-letter topic, or appended as JSON lines to a local file.
+    """
+
+    def __init__(self,
+                 producer=None,
+                 topic: Optional[str] = None,
+                 file_path: Optional[str] = None):
+        if (producer is None or not topic) and not file_path:
+            raise ExpressKafkaException("Dead letter needs a producer with a topic, or a file path")
+        self._logger = ExpressLoggerFactory.get_logger(self.__class__.__name__)
+        self._producer = producer
+        self._topic = topic
+        self._file_path = file_path
+        self._file_lock = Lock()
+        self._count = 0
+        self._failed_count = 0
+
+    def write(self, record: ExpressKafkaProduceRecord, exception: Optional[Exception] = None) -> None:
+        self._count += 1
+        if self._producer is not None and self._topic:
+            try:
+                future = self._producer.send_async(ExpressKafkaProduceRecord(self._topic, record.data(), record.key()))
+            except Exception as e:
+                self._on_send_error(record, exception, e)
+                return
+            # broker 에서 거부된 경우도 file 로 남기거나 기록
+            future.add_errback(self._on_send_error, record, exception)
+            return
+        self._append(record, exception)
+
+    def _on_send_error(self, record: ExpressKafkaProduceRecord, exception: Optional[Exception],
+                       send_error: Exception) -> None:
+        if self._file_path:
+            self._append(record, exception)
+            return
+        with self._file_lock:
+            self._failed_count += 1
+        self._logger.error('Dead letter topic sending failed: %s -> %s', send_error, record.data())
+
+    def _append(self, record: ExpressKafkaProduceRecord, exception: Optional[Exception]) -> None:
+        line = json.dumps({
+            "timestamp": int(time.time() * 1000),
+            "topic": record.topic(),
+            "key": record.key(),
+            "data": record.data(),
+            "failure_count": record.failure_count(),
+            "error": None if exception is None else str(exception),
+        }, default=str, ensure_ascii=False)
+        with self._file_lock:
+            with open(self._file_path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+
+    def count(self) -> int:
+        return self._count
+
+    def failed_count(self) -> int:
+        """
+        Records lost because the dead-letter topic rejected them and no file path was configured.
+        """
+        return self._failed_count
@@ -0,0 +1,54 @@
+from .express_kafka_consumer_metrics import ExpressKafkaConsumerMetrics
+from express_base.express_base_thread import ExpressBaseThread
+from express_utils import ExpressExceptionUtils
+from threading import Event
+from typing import Optional
+
+
+class ExpressKafkaLagSampler(ExpressBaseThread):
+    """
+    Refreshes end offsets of the partitions assigned to the consumer (see ExpressKafkaConsumerMetrics) on a timer.
+    KafkaConsumer is not thread-safe, so the sampler queries the broker through its own group-less consumer
+    instead of the one driving the poll loop.
+    """
+
+    def __init__(self,
+                 metadata,
+                 metrics: ExpressKafkaConsumerMetrics,
+                 interval_ms: int = 5000,
+                 name: str = "ExpressKafkaLagSampler"):
+        super().__init__(name)
+        self._metadata = metadata
+        self._metrics = metrics
+        self._interval_sec = interval_ms / 1000
+        self._stop_event = Event()
+        self._consumer = None
+
+    def _initialize(self):
+        super()._initialize()
+        self._consumer = self._metadata.create_consumer({'group_id': None, 'enable_auto_commit': False})
+
+    def _execute(self):
+        while not self._stop_event.wait(self._interval_sec):
+            self.sample()
+
+    def sample(self) -> None:
+        self._metrics.sample_rate()
+        partitions = self._metrics.partitions()
+        if not partitions:
+            return
+        try:
+            self._metrics.update_end_offsets(self._consumer.end_offsets(partitions))
+        except Exception as e:
+            self._sys_logger.warning("Lag sampling failed: %s", ExpressExceptionUtils.get_stack_trace(e, 1))
+
+    def _finalize(self):
+        if self._consumer is not None:
+            self._consumer.close()
+        self._sys_logger.debug("Thread %s finalized.", self._name)
+
+    def shutdown(self) -> None:
+        self._stop_event.set()
+
+    def get_metrics(self) -> Optional[ExpressKafkaConsumerMetrics]:
+        return self._metrics
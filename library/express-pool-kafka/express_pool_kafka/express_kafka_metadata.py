@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from kafka import KafkaConsumer
 from .define.express_kafka_factory import ExpressKafkaFactory
 from .express_kafka_configuration import ExpressKafkaConfiguration
@@ -6,6 +6,7 @@ from .kafka_producer_wrapper import KafkaProducerWrapper
 from .express_kafka_types import ExpressKafkaTypes
 from .express_kafka_exception import ExpressKafkaException
 from .express_kafka_utils import ExpressKafkaUtils
+from .express_kafka_producer_pool import ExpressKafkaProducerPool
 # from confluent_kafka import Consumer, Producer # 추후 성능 문제로 리팩토링시 confluent kafka 도입이 필요할 수 있음
 
 
@@ -31,20 +32,26 @@ class ExpressKafkaMetadata(ExpressKafkaFactory):
         if not bootstrap_servers:
             return False
         properties = _input.get("property", {})
+        flush_properties = _input.get("flush", {})
+        profile = _input.get("profile")
 
         builder = ExpressKafkaConfiguration.Builder(self.express_kafka_types)
         self.configuration = builder.id(identifier) \
             .bootstrap_servers(bootstrap_servers) \
             .properties(properties) \
+            .flush_properties(flush_properties) \
+            .profile(profile) \
             .build()
         return True
 
-    def create_consumer(self) -> KafkaConsumer:
+    def create_consumer(self, overrides: Optional[Dict[str, Any]] = None) -> KafkaConsumer:
         if self.express_kafka_types != ExpressKafkaTypes.CONSUMER:
             raise ExpressKafkaException(
                 f"kafka mis-match type. your request is consumer but this object type is {self.express_kafka_types}"
             )
         properties = ExpressKafkaUtils.configuration_check(self.configuration)
+        if overrides:
+            properties.update(overrides)
         return KafkaConsumer(**properties)
 
     def create_producer(self) -> KafkaProducerWrapper:
@@ -53,4 +60,21 @@ class ExpressKafkaMetadata(ExpressKafkaFactory):
                 f"kafka mis-match type. your request is producer but this object type is {self.express_kafka_types}"
             )
         properties = ExpressKafkaUtils.configuration_check(self.configuration)
-        return KafkaProducerWrapper(properties)
+        flush_properties = self.configuration.get_flush_properties()
+        return KafkaProducerWrapper(properties,
+                                    flush_max_records=flush_properties.get('max_records', 0),
+                                    flush_max_bytes=flush_properties.get('max_bytes', 0),
+                                    flush_interval_ms=flush_properties.get('interval_ms', 0))
+
+    def acquire_producer(self) -> KafkaProducerWrapper:
+        """
+        Returns the process-wide shared producer for this configuration id. Return it with release_producer().
+        """
+        if self.express_kafka_types != ExpressKafkaTypes.PRODUCER:
+            raise ExpressKafkaException(
+                f"kafka mis-match type. your request is producer but this object type is {self.express_kafka_types}"
+            )
+        return ExpressKafkaProducerPool.acquire(self)
+
+    def release_producer(self) -> None:
+        ExpressKafkaProducerPool.release(self.get_configuration()._id)
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ExpressKafkaOverflowPolicy(Enum):
+    BLOCK = 0
+    DROP_OLDEST = 1
+    DROP_NEWEST = 2
+    SPILL = 3
@@ -0,0 +1,162 @@
+from .express_kafka_callback import ExpressKafkaCallback
+from .express_kafka_dead_letter import ExpressKafkaDeadLetter
+from .express_kafka_exception import ExpressKafkaException
+from .express_kafka_overflow_policy import ExpressKafkaOverflowPolicy
+from .express_kafka_produce_record import ExpressKafkaProduceRecord
+from express_base.express_base_thread import ExpressBaseThread
+from express_utils import ExpressExceptionUtils
+from collections import deque
+from threading import Condition
+from typing import Optional, Dict, Deque, Tuple
+import time
+
+
+class ExpressKafkaProducerBuffer(ExpressBaseThread):
+    """
+    Bounded in-process queue in front of KafkaProducerWrapper.
+    Request threads only enqueue; a single drain thread feeds send_async, so a slow broker stalls the drain
+    thread instead of the callers. When the queue is full the overflow policy decides:
+    BLOCK waits up to block_timeout_ms, DROP_OLDEST/DROP_NEWEST discard, SPILL appends to the spill file.
+    """
+
+    def __init__(self,
+                 producer,
+                 capacity: int = 10000,
+                 overflow_policy: ExpressKafkaOverflowPolicy = ExpressKafkaOverflowPolicy.BLOCK,
+                 block_timeout_ms: int = 100,
+                 spill: Optional[ExpressKafkaDeadLetter] = None,
+                 name: str = "ExpressKafkaProducerBuffer"):
+        super().__init__(name)
+        if capacity <= 0:
+            raise ExpressKafkaException("Producer buffer capacity must be positive")
+        if overflow_policy == ExpressKafkaOverflowPolicy.SPILL and spill is None:
+            raise ExpressKafkaException("SPILL overflow policy needs a spill destination")
+        self._producer = producer
+        self._capacity = capacity
+        self._overflow_policy = overflow_policy
+        self._block_timeout_sec = block_timeout_ms / 1000
+        self._spill = spill
+        self._queue: Deque[Tuple[ExpressKafkaProduceRecord, Optional[ExpressKafkaCallback]]] = deque()
+        self._condition = Condition()
+        self._max_depth = 0
+        self._offered_count = 0
+        self._sent_count = 0
+        self._dropped_count = 0
+        self._spilled_count = 0
+
+    def offer(self, record: ExpressKafkaProduceRecord, callback: Optional[ExpressKafkaCallback] = None) -> bool:
+        """
+        :return: True when the record was queued, False when it was dropped or spilled.
+            A dropped or spilled record's callback gets its error path called.
+        """
+        with self._condition:
+            self._offered_count += 1
+            if self._interrupted:
+                self._count_rejected()
+                rejected, reason = (record, callback), "shut down"
+            else:
+                rejected = self._on_overflow(record, callback) if len(self._queue) >= self._capacity else None
+                reason = "full"
+            queued = rejected is None or rejected[0] is not record
+            if queued:
+                self._queue.append((record, callback))
+                if len(self._queue) > self._max_depth:
+                    self._max_depth = len(self._queue)
+                self._condition.notify_all()
+        # spill 파일 쓰기와 callback 은 lock 을 놓은 뒤 호출 thread 에서 실행
+        if rejected is not None:
+            self._reject(*rejected, ExpressKafkaException(f"Producer buffer is {reason}"))
+        return queued
+
+    def _on_overflow(self, record: ExpressKafkaProduceRecord, callback: Optional[ExpressKafkaCallback]) \
+            -> Optional[Tuple[ExpressKafkaProduceRecord, Optional[ExpressKafkaCallback]]]:
+        """
+        Called with the condition held.
+        :return: the entry pushed out of the buffer (the offered one or the oldest), None when there is room.
+        """
+        if self._overflow_policy == ExpressKafkaOverflowPolicy.BLOCK:
+            deadline = time.monotonic() + self._block_timeout_sec
+            while len(self._queue) >= self._capacity:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._interrupted:
+                    self._count_rejected()
+                    return record, callback
+                self._condition.wait(remaining)
+            return None
+        elif self._overflow_policy == ExpressKafkaOverflowPolicy.DROP_OLDEST:
+            self._dropped_count += 1
+            return self._queue.popleft()
+        self._count_rejected()
+        return record, callback
+
+    def _count_rejected(self) -> None:
+        if self._overflow_policy == ExpressKafkaOverflowPolicy.SPILL:
+            self._spilled_count += 1
+        else:
+            self._dropped_count += 1
+
+    def _reject(self,
+                record: ExpressKafkaProduceRecord,
+                callback: Optional[ExpressKafkaCallback],
+                exception: Exception) -> None:
+        if self._overflow_policy == ExpressKafkaOverflowPolicy.SPILL:
+            self._spill.write(record, exception)
+        if callback is not None:
+            callback.on_error(exception)
+        else:
+            record.fail()
+
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def gauges(self) -> Dict[str, int]:
+        return {
+            "depth": len(self._queue),
+            "max_depth": self._max_depth,
+            "capacity": self._capacity,
+            "offered": self._offered_count,
+            "sent": self._sent_count,
+            "dropped": self._dropped_count,
+            "spilled": self._spilled_count,
+        }
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._interrupted = True
+            self._condition.notify_all()
+
+    def _execute(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._interrupted:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                record, callback = self._queue.popleft()
+                self._condition.notify_all()
+            self._send(record, callback)
+
+    def _send(self, record: ExpressKafkaProduceRecord, callback: Optional[ExpressKafkaCallback]) -> None:
+        try:
+            self._producer.send_async(record, callback)
+        except Exception as e:
+            if callback is not None:
+                callback.on_error(e)
+            else:
+                record.fail()
+            self._sys_logger.error("Producer buffer send failed: %s", ExpressExceptionUtils.get_stack_trace(e, 1))
+            if self._spill is not None:
+                self._spill.write(record, e)
+                with self._condition:
+                    self._spilled_count += 1
+            return
+        with self._condition:
+            self._sent_count += 1
+
+    def _finalize(self):
+        # shutdown 이후 남은 record 도 전송한 뒤 flush
+        while self._queue:
+            record, callback = self._queue.popleft()
+            self._send(record, callback)
+        self._producer.flush()
+        self._sys_logger.debug("Thread %s finalized. %s", self._name, self.gauges())
@@ -0,0 +1,134 @@
+from .express_kafka_exception import ExpressKafkaException
+from .kafka_producer_wrapper import KafkaProducerWrapper
+from express_base.express_base_thread import ExpressBaseThread
+from threading import Lock, RLock, Event
+from typing import Dict, Optional
+import time
+
+
+class _PooledProducer:
+    def __init__(self, _id: str):
+        self.id = _id
+        self.lock = Lock()
+        self.producer: Optional[KafkaProducerWrapper] = None
+        self.ref_count = 0
+        self.last_release_time = time.monotonic()
+
+
+class _ExpressKafkaProducerPoolReaper(ExpressBaseThread):
+    def __init__(self, interval_sec: float):
+        super().__init__("ExpressKafkaProducerPoolReaper")
+        self._interval_sec = interval_sec
+        self._stop_event = Event()
+
+    def _execute(self):
+        while not self._stop_event.wait(self._interval_sec):
+            ExpressKafkaProducerPool.evict_idle()
+
+    def _finalize(self):
+        self._sys_logger.debug("Thread %s finalized.", self._name)
+
+    def shutdown(self):
+        self._stop_event.set()
+
+
+class ExpressKafkaProducerPool:
+    """
+    Process-wide pool of KafkaProducerWrapper keyed by the ExpressKafkaConfiguration id.
+    Producers are created lazily on the first acquire and shared by reference count;
+    a producer nobody holds for idle_timeout_sec is closed by the reaper thread.
+    Pooled producers must be returned with release(), never closed by the caller.
+    """
+    _lock = RLock()
+    _entries: Dict[str, _PooledProducer] = {}
+    _idle_timeout_sec: float = 300.0
+    _reaper: Optional[_ExpressKafkaProducerPoolReaper] = None
+
+    @classmethod
+    def configure(cls, idle_timeout_sec: float) -> None:
+        cls._idle_timeout_sec = idle_timeout_sec
+
+    @classmethod
+    def acquire(cls, metadata) -> KafkaProducerWrapper:
+        """
+        :param metadata: built ExpressKafkaMetadata of PRODUCER type.
+        """
+        _id = metadata.get_configuration()._id
+        if not _id:
+            raise ExpressKafkaException("Pooled producer requires a configuration id")
+
+        with cls._lock:
+            entry = cls._entries.get(_id)
+            if entry is None:
+                entry = _PooledProducer(_id)
+                cls._entries[_id] = entry
+            # 참조를 먼저 잡아 두어 생성 중에 evict 되지 않도록 함
+            entry.ref_count += 1
+            cls._start_reaper()
+
+        # producer 생성은 metadata fetch 등으로 느릴 수 있어 entry 단위 lock 으로 수행
+        try:
+            with entry.lock:
+                if entry.producer is None:
+                    entry.producer = metadata.create_producer()
+                return entry.producer
+        except Exception:
+            cls.release(_id)
+            raise
+
+    @classmethod
+    def release(cls, _id: str) -> None:
+        with cls._lock:
+            entry = cls._entries.get(_id)
+            if entry is None or entry.ref_count == 0:
+                return
+            entry.ref_count -= 1
+            if entry.ref_count > 0:
+                return
+            entry.last_release_time = time.monotonic()
+            producer = entry.producer
+        if producer is not None:
+            producer.flush()
+
+    @classmethod
+    def ref_count(cls, _id: str) -> int:
+        entry = cls._entries.get(_id)
+        return 0 if entry is None else entry.ref_count
+
+    @classmethod
+    def size(cls) -> int:
+        return len(cls._entries)
+
+    @classmethod
+    def evict_idle(cls, idle_timeout_sec: Optional[float] = None) -> int:
+        timeout = cls._idle_timeout_sec if idle_timeout_sec is None else idle_timeout_sec
+        now = time.monotonic()
+        evicted = []
+        with cls._lock:
+            for _id, entry in list(cls._entries.items()):
+                if entry.ref_count == 0 and now - entry.last_release_time >= timeout:
+                    del cls._entries[_id]
+                    evicted.append(entry.producer)
+        for producer in evicted:
+            if producer is not None:
+                producer.close()
+        return len(evicted)
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._lock:
+            entries, cls._entries = cls._entries, {}
+            reaper, cls._reaper = cls._reaper, None
+        if reaper is not None:
+            reaper.shutdown()
+        for entry in entries.values():
+            with entry.lock:
+                if entry.producer is not None:
+                    entry.producer.close()
+                    entry.producer = None
+
+    @classmethod
+    def _start_reaper(cls) -> None:
+        if cls._reaper is None:
+            cls._reaper = _ExpressKafkaProducerPoolReaper(max(cls._idle_timeout_sec / 2, 1.0))
+            cls._reaper.start_with_sub_handler_role()
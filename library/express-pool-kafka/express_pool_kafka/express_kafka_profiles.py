@@ -0,0 +1,125 @@
+from .express_kafka_exception import ExpressKafkaException
+from .express_kafka_types import ExpressKafkaTypes
+from express_utils.express_logger_factory import ExpressLoggerFactory
+from kafka import KafkaConsumer, KafkaProducer
+from kafka import codec
+from typing import Dict, Any, Union
+import difflib
+
+COMPRESSION_TYPES = {
+    None: lambda: True,
+    'gzip': codec.has_gzip,
+    'snappy': codec.has_snappy,
+    'lz4': codec.has_lz4,
+    'zstd': codec.has_zstd,
+}
+
+
+class ExpressKafkaProfiles:
+    """
+    Named tuning profiles expanded into kafka-python settings, and validation of snake-cased properties
+    against the DEFAULT_CONFIG of the installed kafka-python.
+    Profile keys the installed kafka-python does not know (e.g. buffer_memory on 3.x) are skipped with a warning.
+    Profiles only tune batching and latency; durability settings (acks, idempotence) are left to kafka-python
+    defaults and explicit properties, so a profile can be combined with transactional.id.
+    """
+    PRODUCER_PROFILES: Dict[str, Dict[str, Any]] = {
+        "low-latency": {
+            "compression_type": None,
+            "linger_ms": 0,
+            "batch_size": 16384,
+            "buffer_memory": 33554432,
+            "max_in_flight_requests_per_connection": 5,
+        },
+        "balanced": {
+            "compression_type": "gzip",
+            "linger_ms": 5,
+            "batch_size": 65536,
+            "buffer_memory": 67108864,
+            "max_in_flight_requests_per_connection": 5,
+        },
+        "high-throughput": {
+            "compression_type": "lz4" if codec.has_lz4() else "gzip",
+            "linger_ms": 20,
+            "batch_size": 262144,
+            "buffer_memory": 134217728,
+            "max_in_flight_requests_per_connection": 5,
+        },
+    }
+    CONSUMER_PROFILES: Dict[str, Dict[str, Any]] = {
+        "low-latency": {
+            "fetch_min_bytes": 1,
+            "fetch_max_wait_ms": 10,
+            "max_poll_records": 100,
+        },
+        "balanced": {
+            "fetch_min_bytes": 1024,
+            "fetch_max_wait_ms": 100,
+            "max_poll_records": 500,
+        },
+        "high-throughput": {
+            "fetch_min_bytes": 65536,
+            "fetch_max_wait_ms": 500,
+            "max_poll_records": 2000,
+            "max_partition_fetch_bytes": 4194304,
+        },
+    }
+
+    @staticmethod
+    def known_properties(kafka_types: ExpressKafkaTypes) -> Dict[str, Any]:
+        if kafka_types == ExpressKafkaTypes.PRODUCER:
+            return KafkaProducer.DEFAULT_CONFIG
+        elif kafka_types == ExpressKafkaTypes.CONSUMER:
+            return KafkaConsumer.DEFAULT_CONFIG
+        raise ExpressKafkaException("kafka_types must be CONSUMER or PRODUCER")
+
+    @staticmethod
+    def expand(kafka_types: ExpressKafkaTypes, profile: str) -> Dict[str, Any]:
+        profiles = ExpressKafkaProfiles.PRODUCER_PROFILES if kafka_types == ExpressKafkaTypes.PRODUCER \
+            else ExpressKafkaProfiles.CONSUMER_PROFILES
+        if profile not in profiles:
+            raise ExpressKafkaException(f"Unknown kafka profile '{profile}'. available: {sorted(profiles)}")
+        known = ExpressKafkaProfiles.known_properties(kafka_types)
+        unsupported = [k for k in profiles[profile] if k not in known]
+        if unsupported:
+            ExpressLoggerFactory.get_logger(ExpressKafkaProfiles.__name__).warning(
+                "Kafka profile '%s' settings %s are not supported by the installed kafka-python and are ignored",
+                profile, unsupported)
+        return {k: v for k, v in profiles[profile].items() if k in known}
+
+    @staticmethod
+    def validate(kafka_types: ExpressKafkaTypes, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :return: the properties with numeric strings (e.g. "3000" from an environment override) converted.
+        """
+        known = ExpressKafkaProfiles.known_properties(kafka_types)
+        validated = dict(properties)
+        for key, value in properties.items():
+            if key not in known:
+                suggestion = difflib.get_close_matches(key, known.keys(), n=1)
+                hint = f" (did you mean '{suggestion[0]}'?)" if suggestion else ""
+                raise ExpressKafkaException(f"Unknown kafka {kafka_types.name.lower()} property '{key}'{hint}")
+            default = known[key]
+            # acks 는 기본값이 int 이지만 'all' 도 허용됨
+            if key != 'acks' and isinstance(default, int) and not isinstance(default, bool) and value is not None:
+                value = validated[key] = ExpressKafkaProfiles._to_number(key, value)
+            if key == 'compression_type':
+                if value not in COMPRESSION_TYPES:
+                    raise ExpressKafkaException(
+                        f"Kafka property 'compression_type' must be one of "
+                        f"{[k for k in COMPRESSION_TYPES if k]} or None: {value}")
+                if not COMPRESSION_TYPES[value]():
+                    raise ExpressKafkaException(f"Compression library for '{value}' is not installed")
+        return validated
+
+    @staticmethod
+    def _to_number(key: str, value: Any) -> Union[int, float]:
+        # ms 설정 등은 kafka-python 에서 float 도 허용됨 (linger_ms: 0.5)
+        if isinstance(value, str):
+            try:
+                value = float(value) if any(c in value for c in '.eE') else int(value)
+            except ValueError:
+                pass
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not value >= 0:
+            raise ExpressKafkaException(f"Kafka property '{key}' must be a non-negative number: {value}")
+        return value
@@ -0,0 +1,116 @@
+from .express_kafka_dead_letter import ExpressKafkaDeadLetter
+from .express_kafka_produce_record import ExpressKafkaProduceRecord
+from express_base.express_base_thread import ExpressBaseThread
+from collections import deque
+from threading import Condition
+from typing import Deque, List, Tuple, Optional
+import functools
+import heapq
+import itertools
+import time
+
+
+class ExpressKafkaRetryQueue(ExpressBaseThread):
+    """
+    Bounded in-memory retry queue with exponential backoff.
+    Records whose failure_count() is under max_retries are re-submitted from this background thread;
+    the rest, and any record that does not fit in the queue, go to the dead letter.
+    offer() runs on the kafka sender/errback thread, so it only enqueues: dead-letter writes (producer sends
+    or file appends) are done by this thread, never from the callback.
+    """
+
+    def __init__(self,
+                 producer,
+                 dead_letter: ExpressKafkaDeadLetter,
+                 max_retries: int = 3,
+                 capacity: int = 10000,
+                 backoff_ms: int = 100,
+                 max_backoff_ms: int = 10000,
+                 name: str = "ExpressKafkaRetryQueue"):
+        super().__init__(name)
+        self._producer = producer
+        self._dead_letter = dead_letter
+        self._max_retries = max_retries
+        self._capacity = capacity
+        self._backoff_ms = backoff_ms
+        self._max_backoff_ms = max_backoff_ms
+        self._condition = Condition()
+        self._heap: List[Tuple[float, int, ExpressKafkaProduceRecord, Optional[Exception]]] = []
+        self._sequence = itertools.count()
+        self._dead: Deque[Tuple[ExpressKafkaProduceRecord, Optional[Exception]]] = deque()
+
+    def offer(self, record: ExpressKafkaProduceRecord, exception: Optional[Exception] = None) -> bool:
+        """
+        Never blocks. Returns True when the record was queued for retry, False when it was queued for the dead letter.
+        """
+        failure_count = record.failure_count()
+        with self._condition:
+            if failure_count < self._max_retries and not self._interrupted and len(self._heap) < self._capacity:
+                heapq.heappush(self._heap, (time.monotonic() + self.backoff(failure_count) / 1000,
+                                            next(self._sequence), record, exception))
+                self._condition.notify()
+                return True
+            self._dead.append((record, exception))
+            self._condition.notify()
+            return False
+
+    def backoff(self, failure_count: int) -> float:
+        return min(self._backoff_ms * (2 ** max(failure_count - 1, 0)), self._max_backoff_ms)
+
+    def size(self) -> int:
+        return len(self._heap)
+
+    def dead_letter_pending(self) -> int:
+        return len(self._dead)
+
+    def drain_dead_letters(self) -> int:
+        """
+        Writes the records queued for the dead letter. Called by this thread; after shutdown it can be called
+        from any thread that is not a kafka I/O thread, for records offered after the thread finished.
+
+        :return: number of records written.
+        """
+        with self._condition:
+            dead, self._dead = self._dead, deque()
+        for record, exception in dead:
+            self._dead_letter.write(record, exception)
+        return len(dead)
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._interrupted = True
+            self._condition.notify_all()
+
+    def _on_retry_error(self, record: ExpressKafkaProduceRecord, exception: Exception) -> None:
+        record.fail()
+        self.offer(record, exception)
+
+    def _execute(self):
+        while not self._interrupted:
+            with self._condition:
+                record = None
+                if not self._dead:
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    wait_time = self._heap[0][0] - time.monotonic()
+                    if wait_time > 0:
+                        self._condition.wait(wait_time)
+                        continue
+                    _, _, record, _ = heapq.heappop(self._heap)
+            if record is None:
+                self.drain_dead_letters()
+                continue
+            try:
+                future = self._producer.send_async(record)
+                future.add_errback(functools.partial(self._on_retry_error, record))
+            except Exception as e:
+                self._on_retry_error(record, e)
+
+    def _finalize(self):
+        # 종료 시점에 남아있는 재시도 대상은 유실되지 않도록 dead letter 로 보냄
+        with self._condition:
+            remaining, self._heap = self._heap, []
+            self._dead.extend((record, exception) for _, _, record, exception in sorted(remaining))
+        self.drain_dead_letters()
+        self._sys_logger.debug("Thread %s finalized. dead letter count: %s", self._name, self._dead_letter.count())
@@ -0,0 +1,64 @@
+from .express_kafka_produce_record import ExpressKafkaProduceRecord
+from threading import Lock
+from typing import List, Set, Tuple
+
+
+class ExpressKafkaSendResult:
+    """
+    Aggregate delivery result of KafkaProducerWrapper.send_many.
+    Only failures are recorded, so the success path takes no lock.
+    """
+
+    def __init__(self):
+        self._total = 0
+        self._failed: List[Tuple[ExpressKafkaProduceRecord, Exception]] = []
+        self._expired: Set[int] = set()
+        self._lock = Lock()
+
+    def _on_sent(self) -> None:
+        self._total += 1
+
+    def _on_failure(self, record: ExpressKafkaProduceRecord, exception: Exception, future=None) -> None:
+        # sender thread 의 errback 과 send_many 의 timeout 처리가 동시에 호출할 수 있음
+        with self._lock:
+            if future is not None and id(future) in self._expired:
+                return
+            self._failed.append((record, exception))
+        record.fail()
+
+    def _expire(self, pending: List[Tuple[ExpressKafkaProduceRecord, object]], exception: Exception) -> None:
+        """
+        Fails the records whose future was not resolved when the flush timed out.
+        A later errback of such a future is ignored, so each record is reported once.
+        """
+        expired = []
+        with self._lock:
+            for record, future in pending:
+                if not future.is_done:
+                    self._expired.add(id(future))
+                    self._failed.append((record, exception))
+                    expired.append(record)
+        for record in expired:
+            record.fail()
+
+    def total_count(self) -> int:
+        return self._total
+
+    def failure_count(self) -> int:
+        return len(self._failed)
+
+    def success_count(self) -> int:
+        return self._total - len(self._failed)
+
+    def has_failures(self) -> bool:
+        return len(self._failed) > 0
+
+    def failed_records(self) -> List[ExpressKafkaProduceRecord]:
+        return [record for record, _ in list(self._failed)]
+
+    def errors(self) -> List[Exception]:
+        return [exception for _, exception in list(self._failed)]
+
+    def __str__(self) -> str:
+        return f"ExpressKafkaSendResult(total={self.total_count()}, success={self.success_count()}, " \
+               f"failure={self.failure_count()})"
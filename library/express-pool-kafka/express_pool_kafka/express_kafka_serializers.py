@@ -0,0 +1,96 @@
+from .express_kafka_exception import ExpressKafkaException
+from express_utils.express_logger_factory import ExpressLoggerFactory
+from typing import Callable, Dict, Optional, Tuple, Any
+import json
+
+Serializer = Callable[[Any], bytes]
+Deserializer = Callable[[bytes], Any]
+
+
+def _json_codec() -> Tuple[Serializer, Deserializer]:
+    return (lambda x: json.dumps(x).encode('utf-8'),
+            lambda x: json.loads(x.decode('utf-8')))
+
+
+def _string_codec() -> Tuple[Serializer, Deserializer]:
+    return (lambda x: x.encode('utf-8'),
+            lambda x: x.decode('utf-8'))
+
+
+def _orjson_codec() -> Tuple[Serializer, Deserializer]:
+    import orjson
+    return orjson.dumps, orjson.loads
+
+
+def _msgpack_codec() -> Tuple[Serializer, Deserializer]:
+    import msgpack
+    return (lambda x: msgpack.packb(x, use_bin_type=True),
+            lambda x: msgpack.unpackb(x, raw=False))
+
+
+class ExpressKafkaSerializers:
+    """
+    Name -> (serializer, deserializer) registry used by ExpressKafkaConfiguration.Builder.
+    Codecs backed by an optional library are resolved on first use; when the library is not installed
+    the codec falls back to its registered fallback with a warning, or raises when it has none.
+    orjson output is json compatible, so it falls back to json. msgpack output is not: a producer silently
+    writing json to consumers expecting msgpack would break them, so msgpack has no fallback.
+    """
+    _factories: Dict[str, Tuple[Callable[[], Tuple[Serializer, Deserializer]], Optional[str]]] = {
+        "json": (_json_codec, None),
+        "string": (_string_codec, None),
+        "orjson": (_orjson_codec, "json"),
+        "msgpack": (_msgpack_codec, None),
+    }
+    _codecs: Dict[str, Tuple[str, Serializer, Deserializer]] = {}
+
+    @classmethod
+    def register(cls,
+                 name: str,
+                 factory: Callable[[], Tuple[Serializer, Deserializer]],
+                 fallback: Optional[str] = None) -> None:
+        """
+        :param factory: returns (serializer, deserializer); may raise ImportError for optional libraries.
+        :param fallback: codec name used when the factory raises ImportError.
+        """
+        cls._factories[name] = (factory, fallback)
+        cls._codecs.pop(name, None)
+
+    @classmethod
+    def names(cls):
+        return list(cls._factories.keys())
+
+    @classmethod
+    def resolve(cls, name: str) -> Optional[Tuple[str, Serializer, Deserializer]]:
+        """
+        :return: (resolved codec name, serializer, deserializer), or None for an unknown name.
+        :raises ExpressKafkaException: the codec library is not installed and the codec has no fallback.
+        """
+        codec = cls._codecs.get(name)
+        if codec is not None:
+            return codec
+        entry = cls._factories.get(name)
+        if entry is None:
+            return None
+        factory, fallback = entry
+        try:
+            serializer, deserializer = factory()
+            codec = (name, serializer, deserializer)
+        except ImportError as e:
+            if fallback is None:
+                raise ExpressKafkaException(f"Kafka codec '{name}' is not available: {e}") from e
+            codec = cls.resolve(fallback)
+            ExpressLoggerFactory.get_logger(cls.__name__).warning(
+                "Kafka codec '%s' is not available (%s), using '%s' instead", name, e, codec[0])
+        cls._codecs[name] = codec
+        return codec
+
+    @classmethod
+    def get_serializer(cls, name: str) -> Optional[Serializer]:
+        codec = cls.resolve(name)
+        return None if codec is None else codec[1]
+
+    @classmethod
+    def get_deserializer(cls, name: str) -> Optional[Deserializer]:
+        codec = cls.resolve(name)
+        return None if codec is None else codec[2]
@@ -1,6 +1,7 @@
 from .express_kafka_configuration import ExpressKafkaConfiguration
 from .express_kafka_exception import ExpressKafkaException
-from typing import Dict, Any
+from kafka.structs import OffsetAndMetadata
+from typing import Dict, Any, List
 
 
 class ExpressKafkaUtils:
@@ -10,3 +11,20 @@ class ExpressKafkaUtils:
             raise ExpressKafkaException("Kafka configuration or its properties are null")
         config = express_kafka_configuration.properties.copy()
         return config
+
+    @staticmethod
+    def offsets_to_commit(records: Dict[Any, List[Any]]) -> Dict[Any, OffsetAndMetadata]:
+        """
+        Converts a KafkaConsumer.poll() result into the offsets to commit after processing it.
+        """
+        offsets = {}
+        for partition, msgs in records.items():
+            if not msgs:
+                continue
+            offset = msgs[-1].offset + 1
+            if len(OffsetAndMetadata._fields) > 2:
+                # kafka-python 2.1 부터 leader_epoch 필드가 추가됨
+                offsets[partition] = OffsetAndMetadata(offset, '', -1)
+            else:
+                offsets[partition] = OffsetAndMetadata(offset, '')
+        return offsets
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ExpressKafkaWorkerTypes(Enum):
+    THREAD = 0
+    PROCESS = 1
@@ -1,13 +1,54 @@
 from .express_kafka_callback import ExpressKafkaCallback
+from .express_kafka_exception import ExpressKafkaException
 from .express_kafka_produce_record import ExpressKafkaProduceRecord
+from .express_kafka_send_result import ExpressKafkaSendResult
+from express_utils.express_logger_factory import ExpressLoggerFactory
 from kafka import KafkaProducer
-from typing import Optional, Dict, Any
+from kafka.errors import KafkaTimeoutError
+from threading import Lock
+from typing import Optional, Dict, Any, Iterable, Union
+import functools
+import time
 
 
 class KafkaProducerWrapper:
-    def __init__(self, configs: Dict[str, Any]):
+    def __init__(self,
+                 configs: Dict[str, Any],
+                 flush_max_records: int = 0,
+                 flush_max_bytes: int = 0,
+                 flush_interval_ms: int = 0):
+        """
+        :param configs: kafka-python producer properties.
+        :param flush_max_records: send_async flushes once this many records are pending (0 = disabled).
+        :param flush_max_bytes: send_async flushes once this many serialized bytes are pending (0 = disabled).
+        :param flush_interval_ms: send_async flushes once this much time passed since the last flush (0 = disabled).
+            The interval is checked on send; there is no timer, so an idle producer is not flushed.
+        """
+        configs = configs.copy()
+        # 직렬화를 wrapper 에서 수행해야 pending bytes 를 정확히 계산할 수 있음
+        self._key_serializer = configs.pop('key_serializer', None)
+        self._value_serializer = configs.pop('value_serializer', None)
         self.kafka_internal_producer = KafkaProducer(**configs)
 
+        self._flush_max_records = flush_max_records
+        self._flush_max_bytes = flush_max_bytes
+        self._flush_interval_ms = flush_interval_ms
+        self._pending_lock = Lock()
+        self._pending_records = 0
+        self._pending_bytes = 0
+        self._last_flush_time = time.monotonic()
+
+        self._transactional = bool(configs.get('transactional_id'))
+        self._transaction_lock = Lock()
+        self._transactions_initialized = False
+
+    def _serialize(self, key, data):
+        if self._key_serializer is not None and key is not None:
+            key = self._key_serializer(key)
+        if self._value_serializer is not None:
+            data = self._value_serializer(data)
+        return key, data
+
     def send(self,
              record: ExpressKafkaProduceRecord,
              callback: Optional[ExpressKafkaCallback] = None):
@@ -19,7 +60,7 @@ class KafkaProducerWrapper:
         if topic is None:
             raise Exception(" * Kafka produce topic is empty")
 
-        key = record.key()
+        key, data = self._serialize(record.key(), data)
 
         future = self.kafka_internal_producer.send(
             topic=topic,
@@ -29,9 +70,9 @@ class KafkaProducerWrapper:
 
         if callback is not None:
             # future.add_callback(callback.on_success_callback)
-            future.add_errback(callback._on_error)
+            future.add_errback(callback.on_error)
 
-        self.kafka_internal_producer.flush()
+        self.flush()
 
     def fast_send(self,
              record: ExpressKafkaProduceRecord):
@@ -43,13 +84,161 @@ class KafkaProducerWrapper:
         if topic is None:
             raise Exception(" * Kafka produce topic is empty")
 
+        _, data = self._serialize(None, data)
+
         self.kafka_internal_producer.send(
             topic=topic,
             value=data
         )
-        self.kafka_internal_producer.flush()
+        self.flush()
+
+    def send_async(self,
+                   record: ExpressKafkaProduceRecord,
+                   callback: Optional[ExpressKafkaCallback] = None):
+        """
+        Hands the record to the producer's linger/batch machinery without waiting for the broker.
+        The record is flushed on flush(), close(), or when a configured watermark is crossed.
+
+        :return: kafka-python future resolved when the record is acknowledged.
+        """
+        future, size = self._produce(record)
+
+        if callback is not None:
+            future.add_errback(callback.on_error)
+
+        if self._on_pending(size):
+            # counter 는 _on_pending 에서 이미 초기화됨
+            self.kafka_internal_producer.flush()
+        return future
+
+    def send_many(self,
+                  records: Iterable[ExpressKafkaProduceRecord],
+                  timeout: Optional[float] = None) -> ExpressKafkaSendResult:
+        """
+        Pipelines every record into the producer and flushes once at the end.
+        Failed records are counted with ExpressKafkaRecord.fail() and reported in the result;
+        records still unacknowledged when the flush times out are reported with the KafkaTimeoutError.
+        """
+        result = ExpressKafkaSendResult()
+        pending = []
+        for record in records:
+            result._on_sent()
+            try:
+                future, _ = self._produce(record)
+            except Exception as e:
+                result._on_failure(record, e)
+                continue
+            future.add_errback(functools.partial(result._on_failure, record, future=future))
+            pending.append((record, future))
+        try:
+            self.flush(timeout)
+        except KafkaTimeoutError as e:
+            result._expire(pending, e)
+        return result
+
+    def send_transaction(self,
+                         records: Iterable[ExpressKafkaProduceRecord],
+                         offsets: Optional[Dict[Any, Any]] = None,
+                         consumer_group: Union[str, Any, None] = None) -> ExpressKafkaSendResult:
+        """
+        Sends the records as one atomic transaction. Requires 'transactional.id' in the producer properties
+        (idempotence is enabled by kafka-python for transactional producers).
+
+        :param offsets: {TopicPartition: OffsetAndMetadata} consumed offsets committed in the same transaction,
+                        see ExpressKafkaUtils.offsets_to_commit.
+        :param consumer_group: consumer group id, or KafkaConsumer.group_metadata() where supported.
+        :raises ExpressKafkaException: when any record failed; the transaction is aborted.
+        """
+        if not self._transactional:
+            raise ExpressKafkaException("Transactional send requires 'transactional.id' in producer properties")
+        producer = self.kafka_internal_producer
+        if not hasattr(producer, 'begin_transaction'):
+            raise ExpressKafkaException("Installed kafka-python does not support transactions (>= 2.2.0 required)")
+        if offsets and consumer_group is None:
+            raise ExpressKafkaException("consumer_group is required to commit offsets in a transaction")
+
+        # 하나의 producer 에서는 동시에 하나의 transaction 만 진행할 수 있음
+        with self._transaction_lock:
+            if not self._transactions_initialized:
+                producer.init_transactions()
+                self._transactions_initialized = True
+
+            result = ExpressKafkaSendResult()
+            producer.begin_transaction()
+            try:
+                for record in records:
+                    result._on_sent()
+                    future, _ = self._produce(record)
+                    future.add_errback(functools.partial(result._on_failure, record))
+                if offsets:
+                    producer.send_offsets_to_transaction(offsets, consumer_group)
+                self.flush()
+                if result.has_failures():
+                    raise ExpressKafkaException(f"Transaction has failed records: {result}")
+                producer.commit_transaction()
+            except Exception as e:
+                try:
+                    producer.abort_transaction()
+                except Exception as abort_error:
+                    # abort 실패가 transaction 실패 원인을 가리지 않도록 기록만 하고 원래 예외를 전달
+                    ExpressLoggerFactory.get_logger(self.__class__.__name__).error(
+                        "Transaction abort failed: %r, while handling: %r", abort_error, e)
+                raise
+            return result
+
+    def _produce(self, record: ExpressKafkaProduceRecord):
+        data = record.data()
+        if data is None:
+            raise Exception(" * Kafka produce data is empty")
+
+        topic = record.topic()
+        if topic is None:
+            raise Exception(" * Kafka produce topic is empty")
+
+        key, data = self._serialize(record.key(), data)
+
+        future = self.kafka_internal_producer.send(
+            topic=topic,
+            value=data,
+            key=key
+        )
+        size = (len(data) if data is not None else 0) + (len(key) if key is not None else 0)
+        return future, size
+
+    def _on_pending(self, size: int) -> bool:
+        """
+        :return: True when a watermark is crossed. The counters are reset under the lock before returning,
+            so only the sender that crossed it flushes.
+        """
+        with self._pending_lock:
+            self._pending_records += 1
+            self._pending_bytes += size
+            crossed = (0 < self._flush_max_records <= self._pending_records
+                       or 0 < self._flush_max_bytes <= self._pending_bytes
+                       or 0 < self._flush_interval_ms <= (time.monotonic() - self._last_flush_time) * 1000)
+            if crossed:
+                self._reset_pending()
+            return crossed
+
+    def _reset_pending(self) -> None:
+        # _pending_lock 을 잡은 상태에서 호출
+        self._pending_records = 0
+        self._pending_bytes = 0
+        self._last_flush_time = time.monotonic()
+
+    def pending_records(self) -> int:
+        return self._pending_records
+
+    def pending_bytes(self) -> int:
+        return self._pending_bytes
+
+    def flush(self, timeout: Optional[float] = None):
+        with self._pending_lock:
+            self._reset_pending()
+        self.kafka_internal_producer.flush(timeout)
 
     def close(self, timeout: Optional[float] = None):
+        self.flush(timeout)
         if timeout is not None:
             self.kafka_internal_producer.close(timeout)
         else:
@@ -0,0 +1,106 @@
+from express_pool_kafka.express_kafka_produce_record import ExpressKafkaProduceRecord
+from express_pool_kafka.kafka_producer_wrapper import KafkaProducerWrapper
+from fake_kafka_producer import FakeKafkaProducer
+from kafka.errors import KafkaTimeoutError
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import time
+import unittest
+
+
+class TestAsyncSend(unittest.TestCase):
+    def create_producer(self, fail_topics=(), **kwargs) -> KafkaProducerWrapper:
+        with patch('express_pool_kafka.kafka_producer_wrapper.KafkaProducer', FakeKafkaProducer):
+            return KafkaProducerWrapper({'value_serializer': lambda x: x.encode('utf-8'), 'round_trip_ms': 0,
+                                         'fail_topics': fail_topics},
+                                        **kwargs)
+
+    def test_send_async_does_not_flush_without_watermark(self):
+        producer = self.create_producer()
+        futures = [producer.send_async(ExpressKafkaProduceRecord("t", f"v{i}")) for i in range(10)]
+        self.assertFalse(any(f.is_done for f in futures))
+        self.assertEqual(producer.pending_records(), 10)
+        producer.flush()
+        self.assertTrue(all(f.succeeded() for f in futures))
+        self.assertEqual(producer.pending_records(), 0)
+
+    def test_record_watermark(self):
+        producer = self.create_producer(flush_max_records=3)
+        for i in range(7):
+            producer.send_async(ExpressKafkaProduceRecord("t", "v"))
+        self.assertEqual(len(producer.kafka_internal_producer.sent), 6)
+        self.assertEqual(producer.pending_records(), 1)
+
+    def test_byte_watermark(self):
+        producer = self.create_producer(flush_max_bytes=10)
+        producer.send_async(ExpressKafkaProduceRecord("t", "12345"))
+        self.assertEqual(producer.pending_bytes(), 5)
+        producer.send_async(ExpressKafkaProduceRecord("t", "67890", "k"))
+        self.assertEqual(producer.pending_bytes(), 0)
+        self.assertEqual(len(producer.kafka_internal_producer.sent), 2)
+
+    def test_interval_watermark(self):
+        producer = self.create_producer(flush_interval_ms=20)
+        producer.send_async(ExpressKafkaProduceRecord("t", "v"))
+        self.assertEqual(producer.pending_records(), 1)
+        time.sleep(0.03)
+        producer.send_async(ExpressKafkaProduceRecord("t", "v"))
+        self.assertEqual(producer.pending_records(), 0)
+
+    def test_concurrent_senders_flush_once_per_watermark(self):
+        producer = self.create_producer(flush_max_records=10)
+        with ThreadPoolExecutor(8) as executor:
+            for _ in range(8):
+                executor.submit(lambda: [producer.send_async(ExpressKafkaProduceRecord("t", "v")) for _ in range(50)])
+        self.assertEqual(producer.kafka_internal_producer.flush_count, 40)
+        self.assertEqual(producer.pending_records(), 0)
+
+    def test_close_flushes_pending(self):
+        producer = self.create_producer()
+        future = producer.send_async(ExpressKafkaProduceRecord("t", "v"))
+        producer.close()
+        self.assertTrue(future.succeeded())
+        self.assertTrue(producer.kafka_internal_producer.closed)
+
+    def test_send_many_flushes_once(self):
+        producer = self.create_producer(flush_max_records=2)
+        result = producer.send_many(ExpressKafkaProduceRecord("t", f"v{i}") for i in range(5))
+        self.assertEqual(producer.kafka_internal_producer.flush_count, 1)
+        self.assertEqual(result.total_count(), 5)
+        self.assertEqual(result.success_count(), 5)
+        self.assertFalse(result.has_failures())
+
+    def test_send_many_reports_failed_records(self):
+        producer = self.create_producer(fail_topics=("bad",))
+        records = [ExpressKafkaProduceRecord("good", "v"),
+                   ExpressKafkaProduceRecord("bad", "v"),
+                   ExpressKafkaProduceRecord("bad", None)]
+        result = producer.send_many(records)
+        self.assertEqual(result.failure_count(), 2)
+        self.assertCountEqual(result.failed_records(), records[1:])
+        self.assertEqual([r.failure_count() for r in records], [0, 1, 1])
+        errors = dict(zip(map(id, result.failed_records()), map(str, result.errors())))
+        self.assertEqual(errors[id(records[1])], "fake broker rejected topic bad")
+
+    def test_send_many_reports_unresolved_records_on_timeout(self):
+        producer = self.create_producer(fail_topics=("bad",))
+        internal = producer.kafka_internal_producer
+        flush = internal.flush
+
+        def timeout_flush(timeout=None):
+            raise KafkaTimeoutError("flush timed out")
+
+        internal.flush = timeout_flush
+        records = [ExpressKafkaProduceRecord("bad", "v"), ExpressKafkaProduceRecord("good", "v")]
+        result = producer.send_many(records, timeout=0.01)
+        self.assertEqual(result.failure_count(), 2)
+        self.assertIsInstance(result.errors()[0], KafkaTimeoutError)
+
+        # timeout 이후 broker 응답이 와도 다시 집계하지 않음
+        flush()
+        self.assertEqual(result.failure_count(), 2)
+        self.assertEqual([r.failure_count() for r in records], [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
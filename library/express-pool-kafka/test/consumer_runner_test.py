@@ -0,0 +1,172 @@
+from express_pool_kafka.express_kafka_consumer_metrics import ExpressKafkaConsumerMetrics
+from express_pool_kafka.express_kafka_consumer_runner import ExpressKafkaConsumerRunner
+from express_pool_kafka.express_kafka_dead_letter import ExpressKafkaDeadLetter
+from express_pool_kafka.express_kafka_metadata import ExpressKafkaMetadata
+from express_pool_kafka.express_kafka_types import ExpressKafkaTypes
+from fake_kafka_consumer import FakeKafkaConsumer
+from kafka.errors import CommitFailedError
+from kafka.structs import TopicPartition
+from kafka_test_support import patch_logging
+from threading import Lock
+import json
+import os
+import tempfile
+import time
+import unittest
+
+
+class TestConsumerRunner(unittest.TestCase):
+    def setUp(self):
+        patch_logging(self)
+        self.consumer = FakeKafkaConsumer(partitions=2)
+        self.metadata = ExpressKafkaMetadata(ExpressKafkaTypes.CONSUMER)
+        self.metadata.build(_input={"id": "consr", "use": True, "bootstrap.servers": "localhost:9092",
+                                    "property": {"group.id": "test", "max.poll.records": 4}})
+        self.metadata.create_consumer = lambda overrides=None: self.consumer
+
+    def run_until(self, runner, condition, timeout: float = 2.0):
+        thread = runner.start_with_sub_handler_role()
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.005)
+        runner.shutdown()
+        thread.join(1)
+
+    def test_per_partition_order_and_commit_after_batch(self):
+        received = {0: [], 1: []}
+        lock = Lock()
+
+        def handler(msgs):
+            with lock:
+                received[msgs[0].partition].extend(m.value for m in msgs)
+
+        runner = ExpressKafkaConsumerRunner(self.metadata, ["t"], handler, max_workers=2)
+        self.consumer.subscribe(["t"])
+        for i in range(10):
+            self.consumer.produce("t", i % 2, i)
+        self.run_until(runner, lambda: sum(len(v) for v in received.values()) == 10)
+
+        self.assertEqual(received[0], [0, 2, 4, 6, 8])
+        self.assertEqual(received[1], [1, 3, 5, 7, 9])
+        self.assertEqual(self.consumer.committed_offsets[TopicPartition("t", 0)], 5)
+        self.assertTrue(self.consumer.closed)
+
+    def test_failed_partition_is_redelivered(self):
+        attempts = []
+
+        def handler(msgs):
+            attempts.append([m.value for m in msgs])
+            if len(attempts) == 1:
+                raise ValueError("first attempt fails")
+
+        runner = ExpressKafkaConsumerRunner(self.metadata, ["t"], handler, max_workers=1)
+        self.consumer.subscribe(["t"])
+        self.consumer.produce("t", 0, "a")
+        self.consumer.produce("t", 0, "b")
+        self.run_until(runner, lambda: len(attempts) >= 2)
+
+        self.assertEqual(attempts[:2], [["a", "b"], ["a", "b"]])
+        self.assertEqual(self.consumer.committed_offsets[TopicPartition("t", 0)], 2)
+
+    def test_poison_message_is_dead_lettered_and_skipped(self):
+        attempts = []
+        handled = []
+
+        def handler(msgs):
+            attempts.append([m.value for m in msgs])
+            if "poison" in [m.value for m in msgs]:
+                raise ValueError("cannot handle poison")
+            handled.extend(m.value for m in msgs)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dead_letter_path = os.path.join(temp_dir, "dead_letter.jsonl")
+            dead_letter = ExpressKafkaDeadLetter(file_path=dead_letter_path)
+            runner = ExpressKafkaConsumerRunner(self.metadata, ["t"], handler, max_workers=1, max_attempts=3,
+                                                backoff_ms=10, dead_letter=dead_letter)
+            self.consumer.subscribe(["t"])
+            for value in ("a", "poison", "b"):
+                self.consumer.produce("t", 0, value)
+            self.run_until(runner, lambda: self.consumer.committed_offsets.get(TopicPartition("t", 0)) == 3)
+
+            with open(dead_letter_path, encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f]
+        self.assertEqual(attempts[:3], [["a", "poison", "b"]] * 3)
+        self.assertEqual(attempts[3:], [["a"], ["poison"], ["b"]])
+        self.assertEqual(handled, ["a", "b"])
+        self.assertEqual([line["data"] for line in lines], ["poison"])
+        self.assertEqual(self.consumer.paused, set())
+
+    def test_revoked_paused_partition_is_forgotten(self):
+        received = []
+
+        def handler(msgs):
+            if msgs[0].partition == 0:
+                raise ValueError("partition 0 fails")
+            received.extend(m.value for m in msgs)
+
+        runner = ExpressKafkaConsumerRunner(self.metadata, ["t"], handler, max_workers=1, backoff_ms=50)
+        self.consumer.subscribe(["t"])
+        self.consumer.produce("t", 0, "a")
+        thread = runner.start_with_sub_handler_role()
+        deadline = time.monotonic() + 2
+        while TopicPartition("t", 0) not in self.consumer.paused and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.consumer.revoke([TopicPartition("t", 0)])
+        # backoff 이 지난 뒤에도 revoke 된 partition 을 resume 하지 않아야 함
+        time.sleep(0.1)
+        self.consumer.produce("t", 1, "b")
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.005)
+        alive = thread.is_alive()
+        runner.shutdown()
+        thread.join(1)
+
+        self.assertTrue(alive)
+        self.assertEqual(received, ["b"])
+        self.assertEqual(runner._paused, {})
+        self.assertEqual(runner._attempts, {})
+
+    def test_backoff_is_exponential_and_capped(self):
+        runner = ExpressKafkaConsumerRunner(self.metadata, ["t"], lambda msgs: None, backoff_ms=100, max_backoff_ms=250)
+        self.assertEqual([runner.backoff(n) for n in (1, 2, 3)], [100, 200, 250])
+
+    def test_commit_failure_keeps_polling(self):
+        received = []
+        runner = ExpressKafkaConsumerRunner(self.metadata, ["t"], lambda msgs: received.extend(m.value for m in msgs),
+                                            max_workers=1)
+        self.consumer.subscribe(["t"])
+        self.consumer.commit_errors.append(CommitFailedError("rebalanced"))
+        self.consumer.produce("t", 0, "a")
+        thread = runner.start_with_sub_handler_role()
+        deadline = time.monotonic() + 2
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.consumer.produce("t", 0, "b")
+        while self.consumer.committed_offsets.get(TopicPartition("t", 0)) != 2 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        runner.shutdown()
+        thread.join(1)
+
+        self.assertEqual(received, ["a", "b"])
+        self.assertEqual(self.consumer.committed_offsets[TopicPartition("t", 0)], 2)
+        self.assertEqual(self.consumer.commit_errors, [])
+
+    def test_assignment_and_committed_offsets_are_published(self):
+        metrics = ExpressKafkaConsumerMetrics()
+        received = []
+        runner = ExpressKafkaConsumerRunner(self.metadata, ["t"], lambda msgs: received.extend(msgs),
+                                            max_workers=1, metrics=metrics)
+        self.consumer.subscribe(["t"])
+        self.consumer.committed_offsets[TopicPartition("t", 1)] = 3
+        for i in range(5):
+            self.consumer.produce("t", 1, i)
+        self.consumer.positions[TopicPartition("t", 1)] = 3
+        self.run_until(runner, lambda: len(received) == 2)
+
+        self.assertEqual(sorted(metrics.partitions()), [TopicPartition("t", 0), TopicPartition("t", 1)])
+        metrics.update_end_offsets({TopicPartition("t", 0): 0, TopicPartition("t", 1): 5})
+        self.assertEqual(metrics.lags(), {TopicPartition("t", 0): 0, TopicPartition("t", 1): 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 from express_pool_kafka.express_kafka_metadata import ExpressKafkaMetadata
 from express_pool_kafka.express_kafka_types import ExpressKafkaTypes
+from express_pool_kafka.express_kafka_consumer_metrics import ExpressKafkaConsumerMetrics
+from express_pool_kafka.express_kafka_lag_sampler import ExpressKafkaLagSampler
 import time
 import yaml
 import json
@@ -17,13 +19,18 @@ if __name__ == "__main__":
     metadata.build(_input=consumer_config)
     c = metadata.create_consumer()
     c.subscribe(topics=['test_event'])
+    metrics = ExpressKafkaConsumerMetrics()
+    sampler = ExpressKafkaLagSampler(metadata, metrics, interval_ms=1000)
+    sampler.start_with_sub_handler_role()
     pv_partition = ""
     pv_topic = ""
 
     try:
         while True:
             # Poll for new messages
+            poll_start = time.perf_counter()
             records = c.poll()
+            metrics.record_poll((time.perf_counter() - poll_start) * 1000, records)
             if records is None:
                 time.sleep(1)
                 continue
@@ -36,12 +43,8 @@ if __name__ == "__main__":
                         print(msg.value, type(msg.value))
                         print("--------------------------------------------------------")
                         print("--------------------------------------------------------")
-                        end_offsets = c.end_offsets([partition])
-
-                        print(end_offsets, type(end_offsets))
-                        last_offset = end_offsets[partition]
-
-                        lag = last_offset - msg.offset - 1  # end_offsets returns the next offset to be written, so subtract 1
+                        # end_offsets 는 sampler 가 주기적으로 갱신하므로 메시지마다 broker 를 조회하지 않음
+                        lag = metrics.lag(partition)
                         print(f"Lag for partition {partition.partition}: {lag}")
                         print("========================================================")
                     except Exception as e:
@@ -49,4 +52,6 @@ if __name__ == "__main__":
                         continue
     except KeyboardInterrupt:
         print("keyboard interrupted")
+        print(metrics.snapshot())
+        sampler.shutdown()
         c.close()
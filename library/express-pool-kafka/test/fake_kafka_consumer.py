@@ -0,0 +1,106 @@
+from kafka.structs import TopicPartition
+from collections import namedtuple
+from threading import Lock
+from typing import Dict, List
+
+FakeConsumerRecord = namedtuple('FakeConsumerRecord', ['topic', 'partition', 'offset', 'key', 'value'])
+
+
+class FakeKafkaConsumer:
+    """
+    Local broker stand-in for KafkaConsumer over an in-memory log of `partitions` partitions.
+    """
+
+    def __init__(self, partitions: int = 2, **configs):
+        self.configs = configs
+        self.partition_count = partitions
+        self.logs: Dict[TopicPartition, List[FakeConsumerRecord]] = {}
+        self.positions: Dict[TopicPartition, int] = {}
+        self.committed_offsets: Dict[TopicPartition, int] = {}
+        self.commit_count = 0
+        self.end_offsets_calls = 0
+        self.closed = False
+        self.paused = set()
+        self.commit_errors = []
+        self.listener = None
+        self._revoked = []
+        self._lock = Lock()
+
+    def subscribe(self, topics, listener=None):
+        if listener is not None:
+            self.listener = listener
+        for topic in topics:
+            for partition in range(self.partition_count):
+                tp = TopicPartition(topic, partition)
+                self.logs.setdefault(tp, [])
+                self.positions.setdefault(tp, 0)
+
+    def produce(self, topic: str, partition: int, value) -> None:
+        with self._lock:
+            log = self.logs.setdefault(TopicPartition(topic, partition), [])
+            log.append(FakeConsumerRecord(topic, partition, len(log), None, value))
+
+    def assignment(self):
+        return set(self.positions)
+
+    def poll(self, timeout_ms=0, max_records=None, update_offsets=True):
+        with self._lock:
+            revoked, self._revoked = self._revoked, []
+        if revoked:
+            if self.listener is not None:
+                self.listener.on_partitions_revoked(set(revoked))
+            for partition in revoked:
+                self.positions.pop(partition, None)
+                self.paused.discard(partition)
+        result = {}
+        remaining = max_records or 500
+        with self._lock:
+            for tp, position in self.positions.items():
+                if tp in self.paused:
+                    continue
+                msgs = self.logs[tp][position:position + remaining]
+                if msgs:
+                    result[tp] = msgs
+                    self.positions[tp] = position + len(msgs)
+                    remaining -= len(msgs)
+        return result
+
+    def seek(self, partition, offset):
+        self.positions[partition] = offset
+
+    def pause(self, *partitions):
+        self.paused.update(partitions)
+
+    def resume(self, *partitions):
+        for partition in partitions:
+            if partition not in self.positions:
+                # kafka-python 의 SubscriptionState 와 같이 assign 되지 않은 partition 은 KeyError
+                raise KeyError(partition)
+        self.paused.difference_update(partitions)
+
+    def revoke(self, partitions):
+        """
+        Simulates a rebalance taking partitions away; the listener runs on the next poll like in KafkaConsumer.
+        """
+        with self._lock:
+            self._revoked = list(partitions)
+
+    def position(self, partition):
+        return self.positions[partition]
+
+    def commit(self, offsets=None):
+        if self.commit_errors:
+            raise self.commit_errors.pop(0)
+        self.commit_count += 1
+        self.committed_offsets.update(self.positions if offsets is None else offsets)
+
+    def committed(self, partition):
+        return self.committed_offsets.get(partition)
+
+    def end_offsets(self, partitions):
+        self.end_offsets_calls += 1
+        with self._lock:
+            return {tp: len(self.logs.get(tp, [])) for tp in partitions}
+
+    def close(self):
+        self.closed = True
@@ -0,0 +1,71 @@
+from kafka.future import Future
+from kafka.producer.future import RecordMetadata
+from threading import Lock
+from typing import List, Tuple
+import time
+
+
+class FakeKafkaProducer:
+    """
+    Local broker stand-in for KafkaProducer.
+    send() only buffers the record; each flush() costs one simulated broker round trip
+    per `batch_size` bytes, like the real producer's batched produce requests.
+    """
+
+    def __init__(self, round_trip_ms: float = 2.0, batch_size: int = 16384, fail_topics=(), **configs):
+        self.round_trip_ms = round_trip_ms
+        self.batch_size = batch_size
+        self.fail_topics = set(fail_topics)
+        self.configs = configs
+        self.sent: List[Tuple[str, bytes, bytes]] = []
+        self.flush_count = 0
+        self.closed = False
+        self._lock = Lock()
+        self._buffer: List[Tuple[Future, str, bytes, bytes]] = []
+        self.transactions: List[str] = []
+        self.transaction_offsets = {}
+
+    def init_transactions(self):
+        self.transactions.append("init")
+
+    def begin_transaction(self):
+        self.transactions.append("begin")
+
+    def send_offsets_to_transaction(self, offsets, consumer_group_id):
+        self.transaction_offsets[consumer_group_id] = offsets
+
+    def commit_transaction(self):
+        self.flush()
+        self.transactions.append("commit")
+
+    def abort_transaction(self):
+        with self._lock:
+            self._buffer = []
+        self.transactions.append("abort")
+
+    def send(self, topic, value=None, key=None, **kwargs):
+        future = Future()
+        with self._lock:
+            self._buffer.append((future, topic, value, key))
+        return future
+
+    def flush(self, timeout=None):
+        with self._lock:
+            buffer, self._buffer = self._buffer, []
+            self.flush_count += 1
+        if not buffer:
+            return
+        total_bytes = sum(len(value or b'') + len(key or b'') for _, _, value, key in buffer)
+        requests = max(1, -(-total_bytes // self.batch_size))
+        time.sleep(requests * self.round_trip_ms / 1000)
+        for offset, (future, topic, value, key) in enumerate(buffer):
+            if topic in self.fail_topics:
+                future.failure(Exception(f"fake broker rejected topic {topic}"))
+                continue
+            self.sent.append((topic, value, key))
+            future.success(RecordMetadata(topic, 0, None, offset, int(time.time() * 1000), None,
+                                          len(key or b''), len(value or b''), -1))
+
+    def close(self, timeout=None):
+        self.flush()
+        self.closed = True
@@ -0,0 +1,70 @@
+from express_pool_kafka.express_kafka_consumer_metrics import ExpressKafkaConsumerMetrics, ExpressKafkaHistogram
+from express_pool_kafka.express_kafka_lag_sampler import ExpressKafkaLagSampler
+from fake_kafka_consumer import FakeKafkaConsumer
+from kafka.structs import TopicPartition
+from kafka_test_support import patch_logging
+from unittest.mock import MagicMock
+import unittest
+
+
+class TestLagSampler(unittest.TestCase):
+    def setUp(self):
+        patch_logging(self)
+
+    def test_histogram_buckets_and_percentile(self):
+        histogram = ExpressKafkaHistogram((1, 10, 100))
+        for value in (0.5, 5, 5, 50, 500):
+            histogram.observe(value)
+        self.assertEqual(histogram.buckets(), [(1, 1), (10, 2), (100, 1), (float('inf'), 1)])
+        self.assertEqual(histogram.percentile(50), 10)
+        self.assertEqual(histogram.percentile(100), 500)
+
+    def test_lag_uses_sampled_end_offsets(self):
+        consumer = FakeKafkaConsumer(partitions=2)
+        consumer.subscribe(["t"])
+        for i in range(10):
+            consumer.produce("t", 0, i)
+        metadata = MagicMock()
+        metadata.create_consumer.return_value = consumer
+
+        metrics = ExpressKafkaConsumerMetrics()
+        metrics.record_poll(3.0, consumer.poll(max_records=4))
+        sampler = ExpressKafkaLagSampler(metadata, metrics)
+        sampler._initialize()
+        sampler.sample()
+
+        tp = TopicPartition("t", 0)
+        self.assertEqual(metrics.lag(tp), 6)
+        self.assertEqual(metrics.total_lag(), 6)
+        self.assertEqual(consumer.end_offsets_calls, 1)
+        self.assertEqual(metrics.poll_latency().count(), 1)
+        self.assertEqual(metrics.snapshot()["lag"], {"t-0": 6})
+
+    def test_unconsumed_partition_lag_from_committed_offset(self):
+        consumer = FakeKafkaConsumer(partitions=3)
+        consumer.subscribe(["t"])
+        for i in range(10):
+            consumer.produce("t", 0, i)
+            consumer.produce("t", 1, i)
+        metadata = MagicMock()
+        metadata.create_consumer.return_value = consumer
+
+        metrics = ExpressKafkaConsumerMetrics()
+        metrics.update_assignment({TopicPartition("t", 0): 2, TopicPartition("t", 1): 0, TopicPartition("t", 2): None})
+        sampler = ExpressKafkaLagSampler(metadata, metrics)
+        sampler._initialize()
+        sampler.sample()
+
+        self.assertEqual(metrics.lag(TopicPartition("t", 0)), 8)
+        self.assertEqual(metrics.lag(TopicPartition("t", 1)), 10)
+        self.assertIsNone(metrics.lag(TopicPartition("t", 2)))
+        self.assertEqual(metrics.total_lag(), 18)
+
+        # revoke 된 partition 은 더 이상 보고하지 않음
+        metrics.update_assignment({TopicPartition("t", 1): 0})
+        self.assertEqual(metrics.partitions(), [TopicPartition("t", 1)])
+        self.assertEqual(metrics.lags(), {TopicPartition("t", 1): 10})
+
+
+if __name__ == "__main__":
+    unittest.main()
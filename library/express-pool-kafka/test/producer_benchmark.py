@@ -0,0 +1,32 @@
+from express_pool_kafka.express_kafka_produce_record import ExpressKafkaProduceRecord
+from express_pool_kafka.kafka_producer_wrapper import KafkaProducerWrapper
+from fake_kafka_producer import FakeKafkaProducer
+from unittest.mock import patch
+import json
+import time
+
+RECORD_COUNT = 5000
+PAYLOAD = {"event_id": "0123456789", "amount": 15000, "currency": "KRW", "channel": "MOBILE", "score": 0.87}
+
+
+def run(send_name: str, **wrapper_kwargs) -> float:
+    with patch('express_pool_kafka.kafka_producer_wrapper.KafkaProducer', FakeKafkaProducer):
+        producer = KafkaProducerWrapper({'value_serializer': lambda x: json.dumps(x).encode('utf-8')},
+                                        **wrapper_kwargs)
+    send = getattr(producer, send_name)
+    record = ExpressKafkaProduceRecord("test_event", PAYLOAD)
+    start = time.perf_counter()
+    for _ in range(RECORD_COUNT):
+        send(record)
+    producer.close()
+    elapsed = time.perf_counter() - start
+    assert len(producer.kafka_internal_producer.sent) == RECORD_COUNT
+    return RECORD_COUNT / elapsed
+
+
+if __name__ == "__main__":
+    # fake broker: 2ms round trip per produce request
+    print(f"send (flush per record)      : {run('send'):>12,.0f} msgs/s")
+    print(f"send_async (max.records=500) : {run('send_async', flush_max_records=500):>12,.0f} msgs/s")
+    print(f"send_async (max.bytes=1MB)   : {run('send_async', flush_max_bytes=1048576):>12,.0f} msgs/s")
+    print(f"send_async (interval.ms=100) : {run('send_async', flush_interval_ms=100):>12,.0f} msgs/s")
@@ -0,0 +1,128 @@
+from express_pool_kafka.express_kafka_callback import ExpressKafkaCallback
+from express_pool_kafka.express_kafka_dead_letter import ExpressKafkaDeadLetter
+from express_pool_kafka.express_kafka_overflow_policy import ExpressKafkaOverflowPolicy
+from express_pool_kafka.express_kafka_produce_record import ExpressKafkaProduceRecord
+from express_pool_kafka.express_kafka_producer_buffer import ExpressKafkaProducerBuffer
+from express_pool_kafka.kafka_producer_wrapper import KafkaProducerWrapper
+from fake_kafka_producer import FakeKafkaProducer
+from kafka_test_support import patch_logging
+from unittest.mock import patch
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+
+class TestProducerBuffer(unittest.TestCase):
+    def setUp(self):
+        patch_logging(self)
+        with patch('express_pool_kafka.kafka_producer_wrapper.KafkaProducer', FakeKafkaProducer):
+            self.producer = KafkaProducerWrapper({'value_serializer': lambda x: x.encode('utf-8'),
+                                                  'round_trip_ms': 0})
+
+    def records(self, count: int):
+        return [ExpressKafkaProduceRecord("t", str(i)) for i in range(count)]
+
+    def sent_values(self):
+        return [value.decode('utf-8') for _, value, _ in self.producer.kafka_internal_producer.sent]
+
+    def test_drop_oldest_keeps_latest(self):
+        buffer = ExpressKafkaProducerBuffer(self.producer, capacity=2,
+                                            overflow_policy=ExpressKafkaOverflowPolicy.DROP_OLDEST)
+        results = [buffer.offer(r) for r in self.records(4)]
+        self.assertEqual(results, [True] * 4)
+        self.assertEqual(buffer.gauges()["dropped"], 2)
+        thread = buffer.start_with_sub_handler_role()
+        buffer.shutdown()
+        thread.join(1)
+        self.assertEqual(self.sent_values(), ["2", "3"])
+
+    def test_drop_newest_rejects(self):
+        buffer = ExpressKafkaProducerBuffer(self.producer, capacity=2,
+                                            overflow_policy=ExpressKafkaOverflowPolicy.DROP_NEWEST)
+        self.assertEqual([buffer.offer(r) for r in self.records(3)], [True, True, False])
+        self.assertEqual(buffer.depth(), 2)
+
+    def test_block_times_out(self):
+        buffer = ExpressKafkaProducerBuffer(self.producer, capacity=1, block_timeout_ms=20)
+        buffer.offer(ExpressKafkaProduceRecord("t", "0"))
+        start = time.monotonic()
+        self.assertFalse(buffer.offer(ExpressKafkaProduceRecord("t", "1")))
+        self.assertGreaterEqual(time.monotonic() - start, 0.02)
+        self.assertEqual(buffer.gauges()["dropped"], 1)
+
+    def test_spill_writes_to_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            spill = ExpressKafkaDeadLetter(file_path=os.path.join(temp_dir, "spill.jsonl"))
+            buffer = ExpressKafkaProducerBuffer(self.producer, capacity=1,
+                                                overflow_policy=ExpressKafkaOverflowPolicy.SPILL, spill=spill)
+            self.assertEqual([buffer.offer(r) for r in self.records(3)], [True, False, False])
+            self.assertEqual(buffer.gauges()["spilled"], 2)
+            with open(os.path.join(temp_dir, "spill.jsonl"), encoding='utf-8') as f:
+                self.assertEqual(len(f.readlines()), 2)
+
+    def test_spill_runs_outside_lock_and_notifies_callback(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            spill = ExpressKafkaDeadLetter(file_path=os.path.join(temp_dir, "spill.jsonl"))
+            buffer = ExpressKafkaProducerBuffer(self.producer, capacity=1,
+                                                overflow_policy=ExpressKafkaOverflowPolicy.SPILL, spill=spill)
+            locked = []
+            write = spill.write
+
+            def try_lock():
+                acquired = buffer._condition.acquire(timeout=0.5)
+                locked.append(acquired)
+                if acquired:
+                    buffer._condition.release()
+
+            def checked_write(record, exception=None):
+                # 다른 thread 에서 lock 을 잡을 수 있어야 함
+                holder = threading.Thread(target=try_lock)
+                holder.start()
+                holder.join()
+                write(record, exception)
+
+            spill.write = checked_write
+            errors = []
+            first, second = self.records(2)
+            buffer.offer(first)
+            self.assertFalse(buffer.offer(second, ExpressKafkaCallback(second, on_error=errors.append)))
+            self.assertEqual(locked, [True])
+            self.assertEqual(len(errors), 1)
+            self.assertIn("full", str(errors[0]))
+
+    def test_dropped_records_notify_callback(self):
+        buffer = ExpressKafkaProducerBuffer(self.producer, capacity=1,
+                                            overflow_policy=ExpressKafkaOverflowPolicy.DROP_OLDEST)
+        errors = []
+        oldest, latest = self.records(2)
+        buffer.offer(oldest, ExpressKafkaCallback(oldest, on_error=lambda e: errors.append(oldest)))
+        self.assertTrue(buffer.offer(latest, ExpressKafkaCallback(latest, on_error=lambda e: errors.append(latest))))
+        self.assertEqual(errors, [oldest])
+        self.assertEqual([oldest.failure_count(), latest.failure_count()], [1, 0])
+
+    def test_dropped_record_without_callback_is_failed(self):
+        buffer = ExpressKafkaProducerBuffer(self.producer, capacity=1,
+                                            overflow_policy=ExpressKafkaOverflowPolicy.DROP_NEWEST)
+        first, second = self.records(2)
+        buffer.offer(first)
+        self.assertFalse(buffer.offer(second))
+        self.assertEqual([first.failure_count(), second.failure_count()], [0, 1])
+
+    def test_offer_rejected_after_shutdown(self):
+        buffer = ExpressKafkaProducerBuffer(self.producer, capacity=10)
+        thread = buffer.start_with_sub_handler_role()
+        buffer.shutdown()
+        thread.join(1)
+        errors = []
+        record = ExpressKafkaProduceRecord("t", "late")
+        self.assertFalse(buffer.offer(record, ExpressKafkaCallback(record, on_error=errors.append)))
+        self.assertEqual(buffer.depth(), 0)
+        self.assertEqual(buffer.gauges()["dropped"], 1)
+        self.assertIn("shut down", str(errors[0]))
+        self.assertEqual(self.sent_values(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
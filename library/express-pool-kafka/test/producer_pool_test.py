@@ -0,0 +1,58 @@
+from express_pool_kafka.express_kafka_metadata import ExpressKafkaMetadata
+from express_pool_kafka.express_kafka_producer_pool import ExpressKafkaProducerPool
+from express_pool_kafka.express_kafka_types import ExpressKafkaTypes
+from fake_kafka_producer import FakeKafkaProducer
+from kafka_test_support import patch_logging
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import functools
+import unittest
+
+
+class TestProducerPool(unittest.TestCase):
+    def setUp(self):
+        patch_logging(self)
+        self.producer_patch = patch('express_pool_kafka.kafka_producer_wrapper.KafkaProducer',
+                                    functools.partial(FakeKafkaProducer, round_trip_ms=0))
+        self.producer_patch.start()
+
+    def tearDown(self):
+        ExpressKafkaProducerPool.close_all()
+        self.producer_patch.stop()
+
+    def build_metadata(self, _id: str) -> ExpressKafkaMetadata:
+        metadata = ExpressKafkaMetadata(ExpressKafkaTypes.PRODUCER)
+        metadata.build(_input={"id": _id, "use": True, "bootstrap.servers": "localhost:9092",
+                               "property": {"value.serializer": "string"}})
+        return metadata
+
+    def test_same_id_shares_producer(self):
+        first = self.build_metadata("prodr")
+        second = self.build_metadata("prodr")
+        other = self.build_metadata("other")
+        self.assertIs(first.acquire_producer(), second.acquire_producer())
+        self.assertIsNot(first.acquire_producer(), other.acquire_producer())
+        self.assertEqual(ExpressKafkaProducerPool.ref_count("prodr"), 3)
+        self.assertEqual(ExpressKafkaProducerPool.size(), 2)
+
+    def test_concurrent_acquire_creates_once(self):
+        metadata = self.build_metadata("prodr")
+        with patch.object(ExpressKafkaMetadata, 'create_producer', wraps=metadata.create_producer) as create:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                producers = list(executor.map(lambda _: metadata.acquire_producer(), range(32)))
+        self.assertEqual(create.call_count, 1)
+        self.assertEqual(len({id(p) for p in producers}), 1)
+        self.assertEqual(ExpressKafkaProducerPool.ref_count("prodr"), 32)
+
+    def test_idle_producer_is_closed(self):
+        metadata = self.build_metadata("prodr")
+        producer = metadata.acquire_producer()
+        self.assertEqual(ExpressKafkaProducerPool.evict_idle(0), 0)
+        metadata.release_producer()
+        self.assertEqual(ExpressKafkaProducerPool.evict_idle(0), 1)
+        self.assertTrue(producer.kafka_internal_producer.closed)
+        self.assertIsNot(metadata.acquire_producer(), producer)
+
+
+if __name__ == "__main__":
+    unittest.main()
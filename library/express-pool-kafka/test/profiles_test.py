@@ -0,0 +1,88 @@
+from express_pool_kafka.express_kafka_configuration import ExpressKafkaConfiguration
+from express_pool_kafka.express_kafka_exception import ExpressKafkaException
+from express_pool_kafka.express_kafka_metadata import ExpressKafkaMetadata
+from express_pool_kafka.express_kafka_profiles import ExpressKafkaProfiles
+from express_pool_kafka.express_kafka_types import ExpressKafkaTypes
+from express_pool_kafka.express_kafka_utils import ExpressKafkaUtils
+from express_pool_kafka.kafka_producer_wrapper import KafkaProducerWrapper
+from kafka_test_support import patch_logging
+from unittest.mock import patch
+import unittest
+
+
+class TestProfiles(unittest.TestCase):
+    def setUp(self):
+        patch_logging(self)
+
+    def build(self, kafka_types: ExpressKafkaTypes, properties, profile=None) -> ExpressKafkaConfiguration:
+        return ExpressKafkaConfiguration.Builder(kafka_types) \
+            .id("test") \
+            .bootstrap_servers("localhost:9092") \
+            .properties(properties) \
+            .profile(profile) \
+            .build()
+
+    def test_profile_expands_and_properties_override(self):
+        configuration = self.build(ExpressKafkaTypes.PRODUCER, {"linger.ms": 1}, profile="high-throughput")
+        properties = configuration.get_properties()
+        self.assertEqual(properties["linger_ms"], 1)
+        self.assertEqual(properties["batch_size"], 262144)
+        self.assertIn(properties["compression_type"], ("lz4", "gzip"))
+
+    def test_profile_keeps_durability_defaults(self):
+        for profile in ExpressKafkaProfiles.PRODUCER_PROFILES:
+            properties = self.build(ExpressKafkaTypes.PRODUCER, {"linger.ms": 1}, profile=profile).get_properties()
+            self.assertNotIn("acks", properties)
+            self.assertNotIn("enable_idempotence", properties)
+
+    def test_profile_with_transactional_id(self):
+        configuration = self.build(ExpressKafkaTypes.PRODUCER,
+                                   {"transactional.id": "tx-1", "api.version": (2, 5)}, profile="balanced")
+        producer = KafkaProducerWrapper(ExpressKafkaUtils.configuration_check(configuration))
+        try:
+            self.assertTrue(producer.kafka_internal_producer.config["enable_idempotence"])
+            self.assertEqual(producer.kafka_internal_producer.config["acks"], -1)
+            self.assertEqual(producer.kafka_internal_producer.config["linger_ms"], 5)
+        finally:
+            producer.close()
+
+    def test_unsupported_profile_key_warns(self):
+        with patch.dict(ExpressKafkaProfiles.PRODUCER_PROFILES, {"legacy": {"linger_ms": 1, "no_such_key": 1}}):
+            with self.assertLogs("ExpressKafkaProfiles", "WARNING") as logs:
+                properties = ExpressKafkaProfiles.expand(ExpressKafkaTypes.PRODUCER, "legacy")
+        self.assertEqual(properties, {"linger_ms": 1})
+        self.assertIn("no_such_key", logs.output[0])
+
+    def test_unknown_key_is_rejected_with_hint(self):
+        with self.assertRaisesRegex(ExpressKafkaException, "did you mean 'linger_ms'"):
+            self.build(ExpressKafkaTypes.PRODUCER, {"linger.msec": 5})
+
+    def test_invalid_values_are_rejected(self):
+        with self.assertRaises(ExpressKafkaException):
+            self.build(ExpressKafkaTypes.PRODUCER, {"compression.type": "brotli"})
+        with self.assertRaises(ExpressKafkaException):
+            self.build(ExpressKafkaTypes.PRODUCER, {"batch.size": "16k"})
+        with self.assertRaises(ExpressKafkaException):
+            self.build(ExpressKafkaTypes.CONSUMER, {"max.poll.records": -1})
+
+    def test_float_and_numeric_string_values_are_accepted(self):
+        configuration = self.build(ExpressKafkaTypes.PRODUCER, {"linger.ms": 0.5, "request.timeout.ms": "3000",
+                                                                "retry.backoff.ms": "12.5"})
+        properties = configuration.get_properties()
+        self.assertEqual(properties["linger_ms"], 0.5)
+        self.assertEqual(properties["request_timeout_ms"], 3000)
+        self.assertEqual(properties["retry_backoff_ms"], 12.5)
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ExpressKafkaException):
+            self.build(ExpressKafkaTypes.CONSUMER, {"group.id": "g"}, profile="turbo")
+
+    def test_metadata_reads_profile(self):
+        metadata = ExpressKafkaMetadata(ExpressKafkaTypes.CONSUMER)
+        metadata.build(_input={"id": "consr", "use": True, "bootstrap.servers": "localhost:9092",
+                               "profile": "low-latency", "property": {"group.id": "g"}})
+        self.assertEqual(metadata.get_configuration().get_properties()["fetch_max_wait_ms"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
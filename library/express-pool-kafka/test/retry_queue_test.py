@@ -0,0 +1,119 @@
+from express_pool_kafka.express_kafka_callback import ExpressKafkaCallback
+from express_pool_kafka.express_kafka_dead_letter import ExpressKafkaDeadLetter
+from express_pool_kafka.express_kafka_produce_record import ExpressKafkaProduceRecord
+from express_pool_kafka.express_kafka_retry_queue import ExpressKafkaRetryQueue
+from express_pool_kafka.kafka_producer_wrapper import KafkaProducerWrapper
+from fake_kafka_producer import FakeKafkaProducer
+from kafka_test_support import patch_logging
+from unittest.mock import patch
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+
+class TestRetryQueue(unittest.TestCase):
+    def setUp(self):
+        patch_logging(self)
+        with patch('express_pool_kafka.kafka_producer_wrapper.KafkaProducer', FakeKafkaProducer):
+            self.producer = KafkaProducerWrapper({'value_serializer': lambda x: x.encode('utf-8'),
+                                                  'round_trip_ms': 0, 'fail_topics': ('bad',)})
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dead_letter_path = os.path.join(self.temp_dir.name, "dead_letter.jsonl")
+        self.dead_letter = ExpressKafkaDeadLetter(file_path=self.dead_letter_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def flush_until(self, condition, timeout: float = 2.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            self.producer.flush()
+            time.sleep(0.005)
+
+    def test_backoff_is_exponential_and_capped(self):
+        retry_queue = ExpressKafkaRetryQueue(self.producer, self.dead_letter, backoff_ms=100, max_backoff_ms=300)
+        self.assertEqual([retry_queue.backoff(n) for n in (1, 2, 3, 4)], [100, 200, 300, 300])
+
+    def test_failed_record_is_retried_then_dead_lettered(self):
+        retry_queue = ExpressKafkaRetryQueue(self.producer, self.dead_letter, max_retries=3, backoff_ms=1)
+        thread = retry_queue.start_with_sub_handler_role()
+        record = ExpressKafkaProduceRecord("bad", "payload", "key")
+        self.producer.send_async(record, callback=ExpressKafkaCallback(record, retry_queue=retry_queue))
+
+        self.flush_until(lambda: self.dead_letter.count() == 1)
+        retry_queue.shutdown()
+        thread.join(1)
+
+        self.assertEqual(record.failure_count(), 3)
+        with open(self.dead_letter_path, encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]["data"], "payload")
+        self.assertEqual(lines[0]["failure_count"], 3)
+
+    def test_full_queue_spills_to_dead_letter(self):
+        retry_queue = ExpressKafkaRetryQueue(self.producer, self.dead_letter, capacity=1, backoff_ms=10000)
+        first = ExpressKafkaProduceRecord("bad", "1")
+        second = ExpressKafkaProduceRecord("bad", "2")
+        self.assertTrue(retry_queue.offer(first))
+        self.assertFalse(retry_queue.offer(second))
+        self.assertEqual(retry_queue.size(), 1)
+        self.assertEqual(retry_queue.dead_letter_pending(), 1)
+        self.assertEqual(self.dead_letter.count(), 0)
+        self.assertEqual(retry_queue.drain_dead_letters(), 1)
+        self.assertEqual(self.dead_letter.count(), 1)
+
+    def test_dead_letter_is_written_by_retry_thread(self):
+        writers = []
+        self.dead_letter.write = lambda record, exception=None: writers.append(threading.current_thread().name)
+        retry_queue = ExpressKafkaRetryQueue(self.producer, self.dead_letter, max_retries=1,
+                                             name="retry-thread")
+        thread = retry_queue.start_with_sub_handler_role()
+        record = ExpressKafkaProduceRecord("bad", "payload")
+        record.fail()
+        self.assertFalse(retry_queue.offer(record))
+
+        deadline = time.monotonic() + 2
+        while not writers and time.monotonic() < deadline:
+            time.sleep(0.005)
+        retry_queue.shutdown()
+        thread.join(1)
+        self.assertEqual(writers, ["retry-thread"])
+
+    def test_custom_on_error_still_retries(self):
+        errors = []
+        retry_queue = ExpressKafkaRetryQueue(self.producer, self.dead_letter, max_retries=2, backoff_ms=1)
+        thread = retry_queue.start_with_sub_handler_role()
+        record = ExpressKafkaProduceRecord("bad", "payload")
+        self.producer.send_async(record, callback=ExpressKafkaCallback(record, on_error=errors.append,
+                                                                       retry_queue=retry_queue))
+
+        self.flush_until(lambda: self.dead_letter.count() == 1)
+        retry_queue.shutdown()
+        thread.join(1)
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(record.failure_count(), 2)
+
+    def test_rejected_dead_letter_topic_falls_back_to_file(self):
+        dead_letter = ExpressKafkaDeadLetter(producer=self.producer, topic="bad", file_path=self.dead_letter_path)
+        dead_letter.write(ExpressKafkaProduceRecord("t", "payload"), ValueError("handler failed"))
+        self.producer.flush()
+
+        with open(self.dead_letter_path, encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual([(line["data"], line["error"]) for line in lines], [("payload", "handler failed")])
+
+    def test_rejected_dead_letter_topic_is_counted(self):
+        dead_letter = ExpressKafkaDeadLetter(producer=self.producer, topic="bad")
+        dead_letter.write(ExpressKafkaProduceRecord("t", "payload"))
+        self.producer.flush()
+        self.assertEqual(dead_letter.count(), 1)
+        self.assertEqual(dead_letter.failed_count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
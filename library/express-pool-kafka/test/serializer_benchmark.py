@@ -0,0 +1,41 @@
+from express_pool_kafka.express_kafka_exception import ExpressKafkaException
+from express_pool_kafka.express_kafka_serializers import ExpressKafkaSerializers
+import timeit
+
+# 대표적인 FDS 거래 이벤트 payload
+PAYLOAD = {
+    "event_id": "20240620153012000123",
+    "user_id": "U000012345",
+    "device_id": "9f0c2a5e-1d3b-4c6a-8e2f-7a9b0c1d2e3f",
+    "timestamp": 1718853896793,
+    "channel": "MOBILE",
+    "tx_type": "TRANSFER",
+    "amount": 1500000,
+    "currency": "KRW",
+    "account_from": "110-123-456789",
+    "account_to": "220-987-654321",
+    "ip": "203.0.113.42",
+    "geo": {"country": "KR", "city": "Seoul", "lat": 37.5665, "lon": 126.9780},
+    "features": {f"cont_{i:03d}": i * 0.137 for i in range(40)},
+    "nominal": {f"nominal_{i:03d}": f"V{i % 7}" for i in range(20)},
+    "rules": ["R001", "R017", "R042"],
+    "score": 0.8731,
+    "is_fraud": False,
+}
+
+if __name__ == "__main__":
+    number = 20000
+    print(f"{'codec':<10}{'resolved':<10}{'size(B)':>10}{'encode(us)':>14}{'decode(us)':>14}")
+    for name in ExpressKafkaSerializers.names():
+        if name == "string":
+            continue
+        try:
+            resolved, serializer, deserializer = ExpressKafkaSerializers.resolve(name)
+        except ExpressKafkaException as e:
+            print(f"{name:<10}{e}")
+            continue
+        encoded = serializer(PAYLOAD)
+        assert deserializer(encoded) == PAYLOAD
+        encode_us = timeit.timeit(lambda: serializer(PAYLOAD), number=number) / number * 1e6
+        decode_us = timeit.timeit(lambda: deserializer(encoded), number=number) / number * 1e6
+        print(f"{name:<10}{resolved:<10}{len(encoded):>10}{encode_us:>14.2f}{decode_us:>14.2f}")
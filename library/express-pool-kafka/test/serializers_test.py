@@ -0,0 +1,58 @@
+from express_pool_kafka.express_kafka_configuration import ExpressKafkaConfiguration
+from express_pool_kafka.express_kafka_exception import ExpressKafkaException
+from express_pool_kafka.express_kafka_serializers import ExpressKafkaSerializers
+from express_pool_kafka.express_kafka_types import ExpressKafkaTypes
+from kafka_test_support import patch_logging
+from unittest.mock import patch
+import importlib.util
+import sys
+import unittest
+
+
+def _missing_codec():
+    raise ImportError("codec library is not installed")
+
+
+class TestSerializers(unittest.TestCase):
+    def setUp(self):
+        patch_logging(self)
+
+    def round_trip(self, name: str):
+        payload = {"amount": 15000, "channel": "MOBILE", "score": 0.87, "rules": ["R001"]}
+        serializer = ExpressKafkaSerializers.get_serializer(name)
+        deserializer = ExpressKafkaSerializers.get_deserializer(name)
+        self.assertEqual(deserializer(serializer(payload)), payload, name)
+
+    def test_round_trip(self):
+        for name in ("json", "orjson"):
+            self.round_trip(name)
+
+    @unittest.skipUnless(importlib.util.find_spec("msgpack"), "msgpack is not installed")
+    def test_msgpack_round_trip(self):
+        self.round_trip("msgpack")
+
+    def test_missing_library_falls_back(self):
+        ExpressKafkaSerializers.register("missing", _missing_codec, fallback="json")
+        with self.assertLogs("ExpressKafkaSerializers", "WARNING") as logs:
+            resolved, serializer, _ = ExpressKafkaSerializers.resolve("missing")
+        self.assertEqual(resolved, "json")
+        self.assertIn("'missing' is not available", logs.output[0])
+        self.assertIn("using 'json'", logs.output[0])
+        self.assertEqual(serializer({"k": "v"}), b'{"k": "v"}')
+
+    def test_missing_msgpack_fails(self):
+        with patch.dict(sys.modules, {"msgpack": None}), patch.dict(ExpressKafkaSerializers._codecs, clear=True):
+            with self.assertRaises(ExpressKafkaException):
+                ExpressKafkaSerializers.resolve("msgpack")
+
+    def test_unknown_name(self):
+        self.assertIsNone(ExpressKafkaSerializers.get_serializer("unknown"))
+
+    def test_builder_uses_registry(self):
+        builder = ExpressKafkaConfiguration.Builder(ExpressKafkaTypes.PRODUCER)
+        properties = builder.bootstrap_servers("localhost:9092").init_properties({"value.serializer": "orjson"})
+        self.assertEqual(properties["value_serializer"]({"k": 1}), b'{"k":1}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from express_pool_kafka.express_kafka_exception import ExpressKafkaException
+from express_pool_kafka.express_kafka_produce_record import ExpressKafkaProduceRecord
+from express_pool_kafka.express_kafka_profiles import ExpressKafkaProfiles
+from express_pool_kafka.express_kafka_types import ExpressKafkaTypes
+from express_pool_kafka.express_kafka_utils import ExpressKafkaUtils
+from express_pool_kafka.kafka_producer_wrapper import KafkaProducerWrapper
+from fake_kafka_consumer import FakeKafkaConsumer
+from fake_kafka_producer import FakeKafkaProducer
+from kafka.structs import TopicPartition
+from kafka_test_support import patch_logging
+from unittest.mock import patch
+import unittest
+
+
+class TestTransaction(unittest.TestCase):
+    def setUp(self):
+        patch_logging(self)
+
+    def create_producer(self, **configs) -> KafkaProducerWrapper:
+        with patch('express_pool_kafka.kafka_producer_wrapper.KafkaProducer', FakeKafkaProducer):
+            return KafkaProducerWrapper({'value_serializer': lambda x: x.encode('utf-8'), 'round_trip_ms': 0,
+                                         'fail_topics': ('bad',), **configs})
+
+    def test_requires_transactional_id(self):
+        producer = self.create_producer()
+        with self.assertRaises(ExpressKafkaException):
+            producer.send_transaction([ExpressKafkaProduceRecord("t", "v")])
+
+    def test_commits_records_and_consumer_offsets(self):
+        consumer = FakeKafkaConsumer(partitions=1)
+        consumer.subscribe(["in"])
+        consumer.produce("in", 0, "a")
+        consumer.produce("in", 0, "b")
+        polled = consumer.poll()
+
+        producer = self.create_producer(transactional_id="tx-1")
+        records = [ExpressKafkaProduceRecord("out", m.value.upper()) for m in polled[TopicPartition("in", 0)]]
+        result = producer.send_transaction(records, ExpressKafkaUtils.offsets_to_commit(polled), "group")
+        producer.send_transaction([ExpressKafkaProduceRecord("out", "c")])
+
+        fake = producer.kafka_internal_producer
+        self.assertEqual(result.success_count(), 2)
+        self.assertEqual(fake.transactions, ["init", "begin", "commit", "begin", "commit"])
+        self.assertEqual(fake.transaction_offsets["group"][TopicPartition("in", 0)].offset, 2)
+        self.assertEqual([value for _, value, _ in fake.sent], [b"A", b"B", b"c"])
+
+    def test_failed_record_aborts(self):
+        producer = self.create_producer(transactional_id="tx-1")
+        records = [ExpressKafkaProduceRecord("out", "v"), ExpressKafkaProduceRecord("bad", "v")]
+        with self.assertRaises(ExpressKafkaException):
+            producer.send_transaction(records)
+        self.assertEqual(producer.kafka_internal_producer.transactions[-1], "abort")
+        self.assertEqual(records[1].failure_count(), 1)
+
+    def test_abort_failure_keeps_original_error(self):
+        producer = self.create_producer(transactional_id="tx-1")
+        fake = producer.kafka_internal_producer
+
+        def abort_transaction():
+            raise RuntimeError("coordinator unavailable")
+
+        fake.abort_transaction = abort_transaction
+        with self.assertLogs("KafkaProducerWrapper", "ERROR") as logs:
+            with self.assertRaisesRegex(ExpressKafkaException, "failed records"):
+                producer.send_transaction([ExpressKafkaProduceRecord("bad", "v")])
+        self.assertIn("coordinator unavailable", logs.output[0])
+
+    def test_transaction_with_profile(self):
+        profile = ExpressKafkaProfiles.expand(ExpressKafkaTypes.PRODUCER, "balanced")
+        producer = self.create_producer(transactional_id="tx-1", **profile)
+        result = producer.send_transaction([ExpressKafkaProduceRecord("out", "a"), ExpressKafkaProduceRecord("out", "b")])
+
+        fake = producer.kafka_internal_producer
+        self.assertEqual(result.success_count(), 2)
+        self.assertEqual(fake.transactions, ["init", "begin", "commit"])
+        # profile 은 acks 를 지정하지 않으므로 transactional producer 의 기본값(acks=all)이 유지됨
+        self.assertNotIn("acks", fake.configs)
+        self.assertEqual(fake.configs["linger_ms"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,15 @@
+from .express_async_logging import ExpressAsyncLogging
 from .express_exception_utils import ExpressExceptionUtils
+from .express_json_formatter import ExpressJsonFormatter
+from .express_log_context import ExpressLogContext
 from .express_logger_factory import ExpressLoggerFactory
 from .express_yml_converter import ExpressYmlConverter
 
-__all__ = [ExpressExceptionUtils, ExpressLoggerFactory, ExpressYmlConverter]
+__all__ = [
+    ExpressAsyncLogging,
+    ExpressExceptionUtils,
+    ExpressJsonFormatter,
+    ExpressLogContext,
+    ExpressLoggerFactory,
+    ExpressYmlConverter
+]
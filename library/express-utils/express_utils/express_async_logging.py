@@ -0,0 +1,146 @@
+from express_utils.express_log_context import ExpressLogContext
+import logging
+from queue import Queue, Full, Empty
+from threading import Lock, Thread
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_SENTINEL = None
+
+
+class ExpressAsyncHandler(logging.Handler):
+    """
+    Stands in for a logger's synchronous handlers: handle() only enqueues the record together with the
+    handlers it is meant for. Records are not formatted on the calling thread and the handler lock is not
+    taken; when the queue is full the record is dropped and counted.
+    """
+
+    def __init__(self, async_logging: 'ExpressAsyncLogging', handlers: Tuple[logging.Handler, ...]):
+        super().__init__(level=min(handler.level for handler in handlers))
+        self._async_logging = async_logging
+        self._handlers = handlers
+
+    @property
+    def handlers(self) -> Tuple[logging.Handler, ...]:
+        return self._handlers
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # format 은 background thread 에서 실행되므로 호출 thread 의 context 를 미리 기록
+        record.express_context = ExpressLogContext.snapshot()
+        self._async_logging._enqueue(record, self._handlers)
+
+
+class ExpressAsyncLogging:
+    """
+    Queue-handler/listener logging configured from the `express_async` section of the logging YAML:
+
+        express_async:
+          enabled: true
+          queue_size: 10000          # bounded; records are dropped (and counted) when full
+          handlers: [kafka_log_file] # handlers moved behind the queue (default: every handler)
+
+    Handlers listed there are replaced on their loggers by an ExpressAsyncHandler, and one background
+    thread formats and writes the records. stop() drains the queue and flushes the handlers.
+    """
+
+    def __init__(self, queue_size: int = 10000):
+        self._queue: "Queue[Optional[Tuple[logging.LogRecord, Tuple[logging.Handler, ...]]]]" = Queue(queue_size)
+        self._thread: Optional[Thread] = None
+        self._installed: List[Tuple[logging.Logger, List[logging.Handler]]] = []
+        self._handlers: List[logging.Handler] = []
+        # 큐가 가득 찬 경우에만 잡는 lock 이므로 정상 경로의 enqueue 에는 영향 없음
+        self._dropped_lock = Lock()
+        self._dropped = 0
+
+    @staticmethod
+    def from_config(config_dict: Dict[str, Any]) -> Optional['ExpressAsyncLogging']:
+        """
+        :return: an installed and started instance, or None when the section is absent or disabled.
+        """
+        async_config = config_dict.get("express_async")
+        if not async_config or not async_config.get("enabled", True):
+            return None
+        async_logging = ExpressAsyncLogging(int(async_config.get("queue_size", 10000)))
+        handler_names = async_config.get("handlers")
+        logger_names = [""] + list((config_dict.get("loggers") or {}).keys())
+        async_logging.install([logging.getLogger(name) for name in logger_names],
+                              set(handler_names) if handler_names else None)
+        async_logging.start()
+        return async_logging
+
+    def install(self, loggers: Iterable[logging.Logger], handler_names: Optional[set] = None) -> None:
+        for logger in loggers:
+            moved = tuple(handler for handler in logger.handlers
+                          if handler_names is None or handler.get_name() in handler_names)
+            if not moved:
+                continue
+            original = list(logger.handlers)
+            kept = [handler for handler in original if handler not in moved]
+            logger.handlers = kept + [ExpressAsyncHandler(self, moved)]
+            self._installed.append((logger, original))
+            self._handlers.extend(handler for handler in moved if handler not in self._handlers)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = Thread(target=self._run, name="ExpressAsyncLogging", daemon=True)
+        self._thread.start()
+
+    def _enqueue(self, record: logging.LogRecord, handlers: Tuple[logging.Handler, ...]) -> None:
+        try:
+            self._queue.put_nowait((record, handlers))
+        except Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _SENTINEL:
+                break
+            self._dispatch(item)
+
+    @staticmethod
+    def _dispatch(item) -> None:
+        record, handlers = item
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                try:
+                    handler.handle(record)
+                except Exception:
+                    # handler 하나의 오류로 background thread 가 종료되지 않도록 함
+                    handler.handleError(record)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Writes every queued record, flushes the handlers and restores the original logger handlers.
+        """
+        if self._thread is not None:
+            # 큐가 가득 차 있어도 sentinel 은 유실되지 않도록 blocking put
+            self._queue.put(_SENTINEL)
+            self._thread.join(timeout)
+            self._thread = None
+        # join 시간이 초과되었으면 남은 record 는 호출 thread 에서 처리
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except Empty:
+                break
+            if item is not _SENTINEL:
+                self._dispatch(item)
+        for handler in self._handlers:
+            handler.flush()
+        for logger, original in self._installed:
+            logger.handlers = original
+        self._installed = []
+
+    def get_queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def get_dropped_count(self) -> int:
+        return self._dropped
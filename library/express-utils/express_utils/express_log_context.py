@@ -0,0 +1,62 @@
+from contextlib import contextmanager
+from threading import local
+from typing import Any, Iterator, Optional, Tuple
+
+# (state name, create time, correlation id)
+ExpressLogContextSnapshot = Tuple[Optional[str], Optional[float], Optional[str]]
+
+
+class ExpressLogContext:
+    """
+    Per-thread logging context read by ExpressJsonFormatter.
+    A worker binds itself as the owner of the current thread; the owner has to provide
+    get_express_base_thread_state() (an Enum) and get_create_time() (epoch seconds, 0 when not initialized),
+    which ExpressBaseThread does. The correlation id is set per task by the worker's own code.
+    """
+    _local = local()
+
+    @staticmethod
+    def bind(owner: Any) -> None:
+        ExpressLogContext._local.owner = owner
+
+    @staticmethod
+    def unbind() -> None:
+        ExpressLogContext._local.__dict__.clear()
+
+    @staticmethod
+    def get_owner() -> Any:
+        return getattr(ExpressLogContext._local, "owner", None)
+
+    @staticmethod
+    def set_correlation_id(correlation_id: Optional[str]) -> None:
+        ExpressLogContext._local.correlation_id = correlation_id
+
+    @staticmethod
+    def get_correlation_id() -> Optional[str]:
+        return getattr(ExpressLogContext._local, "correlation_id", None)
+
+    @staticmethod
+    @contextmanager
+    def correlation(correlation_id: Optional[str]) -> Iterator[None]:
+        previous = ExpressLogContext.get_correlation_id()
+        ExpressLogContext.set_correlation_id(correlation_id)
+        try:
+            yield
+        finally:
+            ExpressLogContext.set_correlation_id(previous)
+
+    @staticmethod
+    def snapshot() -> Optional[ExpressLogContextSnapshot]:
+        """
+        :return: the context of the calling thread, or None when nothing is bound.
+        """
+        context = ExpressLogContext._local.__dict__
+        if not context:
+            return None
+        owner = context.get("owner")
+        if owner is None:
+            return None, None, context.get("correlation_id")
+        create_time = owner.get_create_time()
+        return (owner.get_express_base_thread_state().name,
+                create_time if create_time else None,
+                context.get("correlation_id"))
@@ -1,9 +1,14 @@
+from express_utils.express_async_logging import ExpressAsyncLogging
+import atexit
 import yaml
 import logging
 from logging import config as logging_config
+from threading import RLock
+from typing import Any, Dict, Optional, Tuple
 import os
 
 TRACE_LEVEL = 5
+logging.TRACE = TRACE_LEVEL
 logging.addLevelName(TRACE_LEVEL, "TRACE")
 
 
@@ -13,6 +18,10 @@ def trace(self, message, *args, **kwargs):
 
 
 logging.Logger.trace = trace
+# hot path 에서는 `if logger.trace_enabled:` 로 isEnabledFor 호출 없이 속성만 읽음.
+# 갱신 전의 logger 는 True 로 보고 trace() 에서 다시 확인하므로 결과는 항상 같음.
+# configure()/get_logger() 가 갱신하며, 그 밖에서 level 을 바꾸면 ExpressLoggerFactory.refresh_trace_enabled() 호출
+logging.Logger.trace_enabled = True
 
 
 possible_paths = [
@@ -24,26 +33,128 @@ possible_paths = [
     os.path.abspath("../resources/logging.yml"),
 ]
 class ExpressLoggerFactory:
-    @staticmethod
-    def get_logger(logger_name: str, config_path: str = None) -> logging.Logger:
+    """
+    Applies the logging configuration once and hands out loggers afterwards.
+    The resolved config path, its mtime and the parsed dict are cached; dictConfig runs again only
+    when a different config path is requested or the file was modified, so creating loggers
+    (e.g. one per ExpressBaseThread) costs a single stat instead of re-parsing and rebuilding handlers.
+
+    When the config has an enabled `express_async` section, its handlers are moved behind a bounded
+    queue written by a background thread (see ExpressAsyncLogging); shutdown() drains it at exit.
+    """
+    _lock = RLock()
+    _search_key: Optional[Tuple[str, ...]] = None
+    _resolved_path: Optional[str] = None
+    _configured: Optional[Tuple[str, float]] = None
+    _config_dict: Optional[Dict[str, Any]] = None
+    _async_logging: Optional[ExpressAsyncLogging] = None
+
+    @classmethod
+    def get_logger(cls, logger_name: str, config_path: str = None) -> logging.Logger:
         if config_path is None:
+            config_path = cls._resolve_config_path()
+
+        if not config_path:
+            raise FileNotFoundError("No logging configuration file found in the specified paths.")
+
+        cls.configure(config_path)
+        logger = logging.getLogger(logger_name)
+        logger.trace_enabled = logger.isEnabledFor(TRACE_LEVEL)
+        return logger
+
+    @classmethod
+    def configure(cls, config_path: str, force: bool = False) -> Dict[str, Any]:
+        """
+        Runs dictConfig for config_path unless it is already applied with the same mtime.
+
+        :return: the parsed logging configuration.
+        """
+        mtime = os.path.getmtime(config_path)
+        configured = cls._configured
+        if not force and configured == (config_path, mtime):
+            return cls._config_dict
+
+        with cls._lock:
+            if not force and cls._configured == (config_path, mtime):
+                return cls._config_dict
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config_dict = yaml.safe_load(f)
+            # dictConfig 가 기존 handler 를 닫기 전에 큐에 남은 record 를 모두 기록
+            cls._stop_async_logging()
+            logging_config.dictConfig(config_dict)
+            cls.refresh_trace_enabled()
+            cls._async_logging = ExpressAsyncLogging.from_config(config_dict)
+            cls._config_dict = config_dict
+            cls._configured = (config_path, mtime)
+            return config_dict
+
+    @staticmethod
+    def refresh_trace_enabled() -> None:
+        """
+        Recomputes trace_enabled of every existing logger.
+        Call after changing levels outside configure() (setLevel, logging.disable); loggers that were never
+        refreshed keep trace_enabled True and fall back to the level check in trace().
+        """
+        manager = logging.Logger.manager
+        loggers = [manager.root] + [logger for logger in list(manager.loggerDict.values())
+                                    if isinstance(logger, logging.Logger)]
+        for logger in loggers:
+            logger.trace_enabled = logger.isEnabledFor(TRACE_LEVEL)
 
-            config_path = None
+    @classmethod
+    def _resolve_config_path(cls) -> Optional[str]:
+        # possible_paths 가 바뀌거나 (테스트의 patch 등) 찾았던 파일이 없어지면 다시 탐색
+        search_key = tuple(possible_paths)
+        resolved_path = cls._resolved_path
+        if search_key == cls._search_key and resolved_path and os.path.exists(resolved_path):
+            return resolved_path
+
+        with cls._lock:
+            resolved_path = None
             for path in possible_paths:
                 if os.path.exists(path):
-                    config_path = path
+                    resolved_path = path
                     break
+            cls._search_key = search_key
+            cls._resolved_path = resolved_path
+            return resolved_path
 
-        if not config_path:
-            raise FileNotFoundError("No logging configuration file found in the specified paths.")
+    @classmethod
+    def get_async_logging(cls) -> Optional[ExpressAsyncLogging]:
+        return cls._async_logging
 
-        if not hasattr(logging, 'TRACE'):
-            setattr(logging, 'TRACE', TRACE_LEVEL)
-            logging.addLevelName(TRACE_LEVEL, "TRACE")
+    @classmethod
+    def _stop_async_logging(cls) -> None:
+        async_logging = cls._async_logging
+        cls._async_logging = None
+        if async_logging is not None:
+            async_logging.stop()
 
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_dict = yaml.safe_load(f)
-            logging_config.dictConfig(config_dict)
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Writes the records still queued by the async pipeline and flushes its handlers.
+        Registered with atexit; the synchronous handlers are restored, so logging keeps working afterwards.
+        """
+        with cls._lock:
+            cls._stop_async_logging()
 
-        logger = logging.getLogger(logger_name)
-        return logger
+    @classmethod
+    def get_config(cls) -> Optional[Dict[str, Any]]:
+        return cls._config_dict
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Forgets the cached path and configuration; the next get_logger() resolves and configures again.
+        """
+        with cls._lock:
+            cls._stop_async_logging()
+            cls._search_key = None
+            cls._resolved_path = None
+            cls._configured = None
+            cls._config_dict = None
+
+
+# logging 모듈의 atexit(logging.shutdown) 보다 나중에 등록되므로 먼저 실행되어 큐를 비운 뒤 handler 가 닫힘
+atexit.register(ExpressLoggerFactory.shutdown)
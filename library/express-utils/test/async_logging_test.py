@@ -0,0 +1,155 @@
+from express_utils.express_async_logging import ExpressAsyncHandler, ExpressAsyncLogging
+from express_utils.express_logger_factory import ExpressLoggerFactory
+from threading import Event, current_thread
+from unittest.mock import patch
+import logging
+import os
+import tempfile
+import unittest
+
+CONFIG = """version: 1
+disable_existing_loggers: false
+formatters:
+  simple:
+    format: "%(name)s %(message)s"
+handlers:
+  async_file:
+    class: logging.FileHandler
+    formatter: simple
+    filename: {async_path}
+  sync_file:
+    class: logging.FileHandler
+    formatter: simple
+    filename: {sync_path}
+loggers:
+  async_logger:
+    level: DEBUG
+    handlers: [async_file, sync_file]
+    propagate: no
+root:
+  level: WARNING
+  handlers: [sync_file]
+express_async:
+  enabled: {enabled}
+  queue_size: 100
+  handlers: [async_file]
+"""
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, gate: Event = None):
+        super().__init__()
+        self.gate = gate
+        self.records = []
+        self.threads = []
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.records.append(record.getMessage())
+        self.threads.append(current_thread().name)
+
+
+class TestAsyncLogging(unittest.TestCase):
+    def setUp(self):
+        ExpressLoggerFactory.reset()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.async_path = os.path.join(self.temp_dir.name, "async.log")
+        self.sync_path = os.path.join(self.temp_dir.name, "sync.log")
+
+    def tearDown(self):
+        ExpressLoggerFactory.reset()
+        logging.getLogger("async_logger").handlers = []
+        logging.getLogger().handlers = []
+        self.temp_dir.cleanup()
+
+    def write_config(self, enabled: bool) -> str:
+        path = os.path.join(self.temp_dir.name, "logging.yml")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(CONFIG.format(async_path=self.async_path, sync_path=self.sync_path,
+                                     enabled="true" if enabled else "false"))
+        return path
+
+    def read(self, path: str):
+        with open(path, encoding="utf-8") as file:
+            return file.read().splitlines()
+
+    def test_configured_from_yaml(self):
+        with patch('express_utils.express_logger_factory.possible_paths', [self.write_config(True)]):
+            logger = ExpressLoggerFactory.get_logger("async_logger")
+        async_logging = ExpressLoggerFactory.get_async_logging()
+        self.assertIsNotNone(async_logging)
+        handlers = logger.handlers
+        self.assertEqual([handler.get_name() for handler in handlers[:-1]], ["sync_file"])
+        self.assertIsInstance(handlers[-1], ExpressAsyncHandler)
+
+        for i in range(50):
+            logger.info("message %d", i)
+        ExpressLoggerFactory.shutdown()
+
+        self.assertEqual(self.read(self.async_path), [f"async_logger message {i}" for i in range(50)])
+        self.assertEqual(len(self.read(self.sync_path)), 50)
+        self.assertEqual(async_logging.get_dropped_count(), 0)
+        self.assertEqual([handler.get_name() for handler in logger.handlers], ["async_file", "sync_file"])
+
+    def test_disabled(self):
+        with patch('express_utils.express_logger_factory.possible_paths', [self.write_config(False)]):
+            logger = ExpressLoggerFactory.get_logger("async_logger")
+        self.assertIsNone(ExpressLoggerFactory.get_async_logging())
+        self.assertFalse(any(isinstance(handler, ExpressAsyncHandler) for handler in logger.handlers))
+
+    def test_written_by_background_thread(self):
+        logger = logging.Logger("background")
+        handler = RecordingHandler()
+        logger.addHandler(handler)
+        async_logging = ExpressAsyncLogging(queue_size=10)
+        async_logging.install([logger])
+        async_logging.start()
+
+        logger.warning("value %s", 1)
+        async_logging.stop()
+        self.assertEqual(handler.records, ["value 1"])
+        self.assertEqual(handler.threads, ["ExpressAsyncLogging"])
+        self.assertEqual(logger.handlers, [handler])
+
+    def test_drops_when_full(self):
+        logger = logging.Logger("bounded")
+        release = Event()
+        handler = RecordingHandler(release)
+        logger.addHandler(handler)
+        async_logging = ExpressAsyncLogging(queue_size=2)
+        async_logging.install([logger])
+        async_logging.start()
+
+        # 첫 record 는 handler 에서 대기하고, 큐에 2개가 쌓인 뒤 나머지는 버려짐
+        logger.warning("first")
+        while async_logging.get_queue_depth() > 0:
+            pass
+        for i in range(5):
+            logger.warning("queued %d", i)
+        self.assertEqual(async_logging.get_dropped_count(), 3)
+
+        release.set()
+        async_logging.stop()
+        self.assertEqual(handler.records, ["first", "queued 0", "queued 1"])
+
+    def test_respects_handler_level(self):
+        logger = logging.Logger("levels", level=logging.DEBUG)
+        debug_handler = RecordingHandler()
+        error_handler = RecordingHandler()
+        error_handler.setLevel(logging.ERROR)
+        logger.addHandler(debug_handler)
+        logger.addHandler(error_handler)
+        async_logging = ExpressAsyncLogging()
+        async_logging.install([logger])
+        async_logging.start()
+
+        logger.debug("debug")
+        logger.error("error")
+        async_logging.stop()
+        self.assertEqual(debug_handler.records, ["debug", "error"])
+        self.assertEqual(error_handler.records, ["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
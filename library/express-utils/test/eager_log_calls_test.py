@@ -0,0 +1,16 @@
+from log_overhead_benchmark import find_eager_log_calls
+import unittest
+
+# 비활성화가 기본인 level 이므로 메시지를 미리 만들면 호출할 때마다 비용이 그대로 발생함
+LAZY_METHODS = {"trace", "debug"}
+
+
+class TestEagerLogCalls(unittest.TestCase):
+    def test_no_eager_trace_or_debug_calls(self):
+        eager_calls = [f"{path}:{line} {method}" for path, line, method in find_eager_log_calls()
+                       if method in LAZY_METHODS]
+        self.assertEqual(eager_calls, [], "use %-style arguments instead of f-string, str.format or %")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+from express_utils.express_async_logging import ExpressAsyncLogging
+from express_utils.express_json_formatter import ExpressJsonFormatter
+from express_utils.express_log_context import ExpressLogContext
+from enum import Enum
+from threading import Thread
+import json
+import logging
+import sys
+import unittest
+
+
+class State(Enum):
+    RUNNING = 2
+
+
+class Owner:
+    def __init__(self, create_time: float):
+        self.create_time = create_time
+
+    def get_express_base_thread_state(self):
+        return State.RUNNING
+
+    def get_create_time(self) -> float:
+        return self.create_time
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+def make_record(message: str = "hello %s", args=("world",), exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord("json_logger", logging.INFO, __file__, 1, message, args, exc_info)
+
+
+class TestJsonFormatter(unittest.TestCase):
+    def tearDown(self):
+        ExpressLogContext.unbind()
+
+    def test_without_context(self):
+        record = make_record()
+        output = json.loads(ExpressJsonFormatter().format(record))
+        self.assertEqual(list(output), ["time", "level", "logger", "thread", "state", "elapsed_ms",
+                                        "correlation_id", "message"])
+        self.assertEqual(output["message"], "hello world")
+        self.assertEqual(output["level"], "INFO")
+        self.assertEqual(output["thread"], record.threadName)
+        self.assertIsNone(output["state"])
+        self.assertIsNone(output["elapsed_ms"])
+        self.assertIsNone(output["correlation_id"])
+        self.assertAlmostEqual(output["time"], record.created, places=2)
+
+    def test_with_bound_owner(self):
+        record = make_record()
+        ExpressLogContext.bind(Owner(record.created - 1.5))
+        with ExpressLogContext.correlation("req-1"):
+            output = json.loads(ExpressJsonFormatter().format(record))
+        self.assertEqual(output["state"], "RUNNING")
+        self.assertAlmostEqual(output["elapsed_ms"], 1500.0, places=1)
+        self.assertEqual(output["correlation_id"], "req-1")
+        self.assertIsNone(ExpressLogContext.get_correlation_id())
+
+    def test_uninitialized_owner(self):
+        ExpressLogContext.bind(Owner(0))
+        output = json.loads(ExpressJsonFormatter().format(make_record()))
+        self.assertEqual(output["state"], "RUNNING")
+        self.assertIsNone(output["elapsed_ms"])
+
+    def test_escaping_static_fields_and_exception(self):
+        try:
+            raise ValueError("bad \"value\"")
+        except ValueError:
+            record = make_record("100% \"quoted\"\n한글", (), sys.exc_info())
+        formatter = ExpressJsonFormatter(static_fields={"service": "express", "rate": "50%"})
+        output = json.loads(formatter.format(record))
+        self.assertEqual(output["message"], "100% \"quoted\"\n한글")
+        self.assertEqual(output["service"], "express")
+        self.assertEqual(output["rate"], "50%")
+        self.assertIn("ValueError: bad \"value\"", output["exc_info"])
+
+    def test_context_captured_before_async_format(self):
+        logger = logging.Logger("async_json")
+        handler = ListHandler()
+        handler.setFormatter(ExpressJsonFormatter())
+        logger.addHandler(handler)
+        async_logging = ExpressAsyncLogging()
+        async_logging.install([logger])
+        async_logging.start()
+
+        def work():
+            ExpressLogContext.bind(Owner(1.0))
+            ExpressLogContext.set_correlation_id("task-7")
+            logger.info("from worker")
+            ExpressLogContext.unbind()
+
+        worker = Thread(target=work, name="worker-7")
+        worker.start()
+        worker.join()
+        async_logging.stop()
+
+        output = json.loads(handler.lines[0])
+        self.assertEqual(output["thread"], "worker-7")
+        self.assertEqual(output["state"], "RUNNING")
+        self.assertEqual(output["correlation_id"], "task-7")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from express_utils.express_logger_factory import ExpressLoggerFactory, TRACE_LEVEL
+from unittest.mock import patch
+from typing import List, Tuple
+import ast
+import glob
+import logging
+import os
+import tempfile
+import timeit
+
+CALLS = 200000
+LOG_METHODS = {"trace", "debug", "info", "warning", "error", "exception", "critical"}
+LIBRARY_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+CONFIG = """version: 1
+disable_existing_loggers: false
+handlers:
+  null:
+    class: logging.NullHandler
+root:
+  level: INFO
+  handlers: [null]
+"""
+
+
+class Metadata:
+    topic = "topic"
+    partition = 0
+    offset = 12345
+
+
+def find_eager_log_calls(library_dir: str = LIBRARY_DIR) -> List[Tuple[str, int, str]]:
+    """
+    Log calls whose message is built before the call (f-string, str.format or % on the message),
+    so the cost is paid even when the level is disabled.
+
+    :return: (path, line, method) of each call.
+    """
+    found = []
+    for path in sorted(glob.glob(os.path.join(library_dir, "express-*", "express_*", "*.py"))):
+        with open(path, encoding="utf-8") as file:
+            tree = ast.parse(file.read(), path)
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                    and node.func.attr in LOG_METHODS and node.args):
+                continue
+            message = node.args[0]
+            eager = (isinstance(message, ast.JoinedStr)
+                     or (isinstance(message, ast.BinOp) and isinstance(message.op, ast.Mod))
+                     or (isinstance(message, ast.Call) and isinstance(message.func, ast.Attribute)
+                         and message.func.attr == "format"))
+            if eager:
+                found.append((os.path.relpath(path, library_dir), node.lineno, node.func.attr))
+    return sorted(found)
+
+
+def measure(logger: logging.Logger) -> List[Tuple[str, float]]:
+    record = Metadata()
+    cases = [
+        ("trace f-string", lambda: logger.trace(f"Topic: {record.topic}")),
+        ("trace %-style", lambda: logger.trace("Topic: %s", record.topic)),
+        ("isEnabledFor(TRACE) guard", lambda: logger.isEnabledFor(TRACE_LEVEL) and logger.trace("Topic: %s", record.topic)),
+        ("trace_enabled guard", lambda: logger.trace_enabled and logger.trace("Topic: %s", record.topic)),
+        ("debug f-string", lambda: logger.debug(f"Topic: {record.topic} {record.partition} {record.offset}")),
+        ("debug %-style", lambda: logger.debug("Topic: %s %s %s", record.topic, record.partition, record.offset)),
+        ("empty call (baseline)", lambda: None),
+    ]
+    return [(name, timeit.timeit(case, number=CALLS) / CALLS * 1e9) for name, case in cases]
+
+
+if __name__ == "__main__":
+    eager_calls = find_eager_log_calls()
+    print(f"log calls formatting their message eagerly: {len(eager_calls)}")
+    for path, line, method in eager_calls:
+        print(f"  {path}:{line} {method}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = os.path.join(temp_dir, "logging.yml")
+        with open(config_path, "w", encoding="utf-8") as file:
+            file.write(CONFIG)
+        with patch('express_utils.express_logger_factory.possible_paths', [config_path]):
+            ExpressLoggerFactory.reset()
+            benchmark_logger = ExpressLoggerFactory.get_logger("log_overhead_benchmark")
+
+        print(f"\nper-call cost with TRACE and DEBUG disabled (level INFO, {CALLS} calls):")
+        for name, nanoseconds in measure(benchmark_logger):
+            print(f"  {name:<28}: {nanoseconds:7.1f} ns")
@@ -0,0 +1,98 @@
+from express_utils.express_logger_factory import ExpressLoggerFactory, TRACE_LEVEL
+from unittest.mock import patch
+import logging
+import os
+import tempfile
+import time
+import unittest
+
+CONFIG = """version: 1
+disable_existing_loggers: false
+handlers:
+  null:
+    class: logging.NullHandler
+loggers:
+  cached_logger:
+    level: {level}
+    handlers: [null]
+    propagate: no
+root:
+  level: WARNING
+  handlers: [null]
+"""
+
+
+class TestLoggerFactoryCache(unittest.TestCase):
+    def setUp(self):
+        ExpressLoggerFactory.reset()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_path = self.write_config("INFO", "logging.yml")
+        self.paths_patch = patch('express_utils.express_logger_factory.possible_paths', [self.config_path])
+        self.paths_patch.start()
+
+    def tearDown(self):
+        self.paths_patch.stop()
+        self.temp_dir.cleanup()
+        ExpressLoggerFactory.reset()
+
+    def write_config(self, level: str, name: str) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(CONFIG.format(level=level))
+        return path
+
+    def test_configures_once(self):
+        with patch('logging.config.dictConfig', wraps=logging.config.dictConfig) as dict_config:
+            for i in range(100):
+                ExpressLoggerFactory.get_logger(f"worker-{i}")
+        self.assertEqual(dict_config.call_count, 1)
+        self.assertEqual(logging.getLogger("cached_logger").level, logging.INFO)
+
+    def test_reconfigures_when_file_changes(self):
+        ExpressLoggerFactory.get_logger("cached_logger")
+        self.write_config("DEBUG", "logging.yml")
+        os.utime(self.config_path, (time.time() + 10, time.time() + 10))
+        self.assertEqual(ExpressLoggerFactory.get_logger("cached_logger").level, logging.DEBUG)
+
+    def test_resolves_again_when_paths_change(self):
+        ExpressLoggerFactory.get_logger("cached_logger")
+        other_path = self.write_config("ERROR", "other.yml")
+        with patch('express_utils.express_logger_factory.possible_paths', [other_path]):
+            self.assertEqual(ExpressLoggerFactory.get_logger("cached_logger").level, logging.ERROR)
+
+    def test_trace_enabled_follows_level(self):
+        logger = ExpressLoggerFactory.get_logger("cached_logger")
+        self.assertEqual(logging.TRACE, TRACE_LEVEL)
+        self.assertFalse(logger.trace_enabled)
+
+        logger.setLevel(TRACE_LEVEL)
+        ExpressLoggerFactory.refresh_trace_enabled()
+        self.assertTrue(logger.trace_enabled)
+        self.assertTrue(logging.getLogger("cached_logger.child").trace_enabled)
+        logging.disable(logging.DEBUG)
+        try:
+            ExpressLoggerFactory.refresh_trace_enabled()
+            self.assertFalse(logger.trace_enabled)
+        finally:
+            logging.disable(logging.NOTSET)
+            ExpressLoggerFactory.refresh_trace_enabled()
+
+    def test_logging_manager_is_not_patched(self):
+        self.assertEqual(logging.Manager._clear_cache.__module__, "logging")
+
+    def test_trace_enabled_refreshes_on_config_change(self):
+        logger = ExpressLoggerFactory.get_logger("cached_logger")
+        self.assertFalse(logger.trace_enabled)
+        self.write_config("TRACE", "logging.yml")
+        os.utime(self.config_path, (time.time() + 10, time.time() + 10))
+        ExpressLoggerFactory.get_logger("other")
+        self.assertTrue(logger.trace_enabled)
+
+    def test_missing_config(self):
+        with patch('express_utils.express_logger_factory.possible_paths', []):
+            with self.assertRaises(FileNotFoundError):
+                ExpressLoggerFactory.get_logger("cached_logger")
+
+
+if __name__ == "__main__":
+    unittest.main()